@@ -13,7 +13,7 @@ from .core import import_registry
 _CURRENT_DIRECTORY = os.path.dirname(os.path.realpath(__file__))
 Configuration = collections.namedtuple(
     "Configuration",
-    "paths namespaces partial_matches types aliases continue_on_syntax_error",
+    "paths namespaces partial_matches types aliases continue_on_syntax_error jobs",
 )
 
 
@@ -69,6 +69,15 @@ def _parse_arguments(text):
         "don't modify it or exit the script.",
     )
 
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="The number of files to change at the same time. "
+        "Use 0 to use every CPU.",
+    )
+
     return parser.parse_args(text)
 
 
@@ -153,6 +162,7 @@ def parse_arguments(text):
         arguments.types,
         arguments.aliases,
         arguments.continue_on_syntax_error,
+        arguments.jobs,
     )
 
 
@@ -177,4 +187,5 @@ def main(text):
         import_types=configuration.types,
         aliases=configuration.aliases,
         continue_on_syntax_error=configuration.continue_on_syntax_error,
+        jobs=configuration.jobs,
     )
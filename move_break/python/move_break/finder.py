@@ -8,8 +8,11 @@ as part of this package's API.
 
 """
 
+import collections
 import copy
 import os
+import re
+import threading
 
 import parso
 
@@ -19,6 +22,14 @@ from .core.parsers import base
 _ALLOWED_ERROR_CODES = (
     903,  # IndentationError << This package can handle indentation issues, no problem
 )
+_CACHE_SIZE = 8 * 1024 * 1024  # The total size of the cached files, in bytes
+_IMPORT_EXPRESSION = re.compile(b"\\bimport\\b")
+
+
+def _read_bytes(path):
+    """bytes: Get the raw contents of some file on-disk."""
+    with open(path, "rb") as handler:
+        return handler.read()
 
 
 def expand_paths(path, fallback=""):
@@ -81,7 +92,13 @@ def get_namespaces(path):
         set[str]: The found imports. e.g. {"os.path", "foo.bar", "some_custom_module"}.
 
     """
-    graph = get_graph(path)
+    if not _IMPORT_EXPRESSION.search(_read_bytes(path)):
+        # A file that never says "import" can't have any imports
+        return set()
+
+    # Nothing here edits the graph so it can be shared with other callers
+    graph, errors = _CACHE.get(path)
+    _check_errors(path, errors)
     imports = parser.get_imports(graph, partial=True)
 
     return {
@@ -89,37 +106,120 @@ def get_namespaces(path):
     }
 
 
-def get_graph(path):
-    """Convert a file path into a parso graph.
+def _get_errors(grammar, graph):
+    """Find every syntax error in a parsed Python module, ignoring errors this package can handle.
 
     Args:
-        path (str): An absolute path to a file on-disk to load.
-
-    Raises:
-        RuntimeError: If `path` has some errors which prevent it from being loaded.
+        grammar (:class:`parso.grammar.Grammar`): The grammar that parsed `graph`.
+        graph (:class:`parso.python.tree.Module`): The parsed Python module.
 
     Returns:
-        :class:`parso.python.tree.Module`: The parsed `code`, as a parso object.
+        list[:class:`parso.normalizer.Issue`]: The found errors, if any.
 
     """
+    errors = list(grammar.iter_errors(graph))
+
+    for error in copy.copy(errors):
+        if error.code in _ALLOWED_ERROR_CODES:
+            errors.remove(error)
+
+    return errors
+
+
+class _GraphCache(object):
+    """The most recently parsed Python files, limited by the size of those files."""
+
+    def __init__(self, size):
+        """Start with no parsed files.
+
+        Args:
+            size (int): The total size of every parsed file to keep, in bytes.
+
+        """
+        super(_GraphCache, self).__init__()
+
+        self.size = size
+        self._graphs = collections.OrderedDict()
+        self._total = 0
+        self._lock = threading.Lock()
+
+    def clear(self):
+        """Forget every parsed file."""
+        with self._lock:
+            self._graphs.clear()
+            self._total = 0
+
+    def get(self, path):
+        """Parse `path`, re-using the last parse if the file's time and size haven't changed.
+
+        The returned graph is shared with every other caller so it must not be edited.
+
+        Args:
+            path (str): An absolute path to a file on-disk to load.
+
+        Returns:
+            tuple[:class:`parso.python.tree.Module`, list[:class:`parso.normalizer.Issue`]]:
+                The parsed file and any syntax errors that it has.
 
-    def _get_errors(code):
-        grammar = parso.load_grammar()
-        module = grammar.parse(code)
+        """
+        status = os.stat(path)
+        key = (status.st_mtime, status.st_size)
 
-        errors = list(grammar.iter_errors(module))
+        with self._lock:
+            entry = self._graphs.pop(path, None)
 
-        for error in copy.copy(errors):
-            if error.code in _ALLOWED_ERROR_CODES:
-                errors.remove(error)
+            if entry:
+                self._total -= entry[0][1]
 
-        return errors
+        if not entry or entry[0] != key:
+            entry = (key, get_graph_and_errors(path))
 
+        with self._lock:
+            if path not in self._graphs:
+                self._graphs[path] = entry
+                self._total += entry[0][1]
+
+            while self._total > self.size and len(self._graphs) > 1:
+                _, ((_, size), _) = self._graphs.popitem(last=False)
+                self._total -= size
+
+        return entry[1]
+
+
+_CACHE = _GraphCache(_CACHE_SIZE)
+
+
+def get_graph_and_errors(path):
+    """Parse a file path into a parso graph and find its syntax errors.
+
+    Args:
+        path (str): An absolute path to a file on-disk to load.
+
+    Returns:
+        tuple[:class:`parso.python.tree.Module`, list[:class:`parso.normalizer.Issue`]]:
+            The parsed file and any syntax errors that it has.
+
+    """
     with open(path, "r") as handler:
         code = handler.read()
 
-    errors = _get_errors(code)
+    grammar = parso.load_grammar()
+    graph = grammar.parse(code)
+
+    return graph, _get_errors(grammar, graph)
 
+
+def _check_errors(path, errors):
+    """Stop if `path` has any syntax errors.
+
+    Args:
+        path (str): An absolute path to the file which has `errors`.
+        errors (list[:class:`parso.normalizer.Issue`]): The file's syntax errors, if any.
+
+    Raises:
+        RuntimeError: If `path` has some errors which prevent it from being loaded.
+
+    """
     if errors:
         raise RuntimeError(
             'Path "{path}" cannot be loaded as a graph. It has syntax errors.'.format(
@@ -127,4 +227,88 @@ def get_graph(path):
             )
         )
 
-    return parso.parse(code)
+
+def get_graph(path):
+    """Convert a file path into a parso graph.
+
+    The file is parsed every time so that the caller may edit the graph.
+
+    Args:
+        path (str): An absolute path to a file on-disk to load.
+
+    Raises:
+        RuntimeError: If `path` has some errors which prevent it from being loaded.
+
+    Returns:
+        :class:`parso.python.tree.Module`: The parsed `code`, as a parso object.
+
+    """
+    graph, errors = get_graph_and_errors(path)
+    _check_errors(path, errors)
+
+    return graph
+
+
+def set_cache_size(size):
+    """Change how many parsed files :func:`get_namespaces` keeps between calls.
+
+    Args:
+        size (int):
+            The total size of every parsed file to keep, in bytes. The
+            parsed graphs take much more memory than the files do. If
+            0, only the most recent file is kept.
+
+    """
+    _CACHE.size = size
+
+
+def get_prefilter(namespaces):
+    """Make a pattern which quickly finds files that might import `namespaces`.
+
+    Every import of "foo.bar.bazz", no matter how it's written, must
+    contain the word "foo" somewhere in the file. So files without
+    "foo" can be skipped without parsing them.
+
+    Args:
+        namespaces (iter[str]): Dot-separated Python namespaces. e.g. {"foo.bar"}.
+
+    Returns:
+        :class:`re.Pattern` or NoneType:
+            A pattern which matches the first name of any namespace.
+            If any namespace has no first name (e.g. "."), return
+            nothing because every file could match.
+
+    """
+    names = set()
+
+    for namespace in namespaces:
+        name = namespace.lstrip(".").split(".")[0]
+
+        if not name:
+            return None
+
+        names.add(re.escape(name.encode("utf-8")))
+
+    if not names:
+        return None
+
+    return re.compile(b"\\b(?:" + b"|".join(sorted(names)) + b")\\b")
+
+
+def is_possible_match(path, pattern):
+    """Check if a Python file could contain the words that `pattern` searches for.
+
+    Args:
+        path (str): An absolute path to a Python file on-disk.
+        pattern (:class:`re.Pattern` or NoneType):
+            The pattern from :func:`get_prefilter`. If no pattern is
+            given, every file is a possible match.
+
+    Returns:
+        bool: If `path` needs to be parsed to know if it contains an import.
+
+    """
+    if pattern is None:
+        return True
+
+    return bool(pattern.search(_read_bytes(path)))
@@ -5,6 +5,10 @@
 
 import itertools
 import logging
+import multiprocessing
+import os
+import shutil
+import tempfile
 
 from . import finder
 from .core import parser
@@ -12,6 +16,128 @@ from .core import parser
 _LOGGER = logging.getLogger(__name__)
 
 
+def _get_code(item):
+    """Replace the imports of one Python file, without writing it to-disk.
+
+    Args:
+        item (tuple[str, list[tuple[str, str]], bool, set[str], bool]):
+            The path to a Python file followed by the `namespaces`,
+            `partial`, `import_types`, and `aliases` arguments of
+            :func:`move_imports`.
+
+    Returns:
+        tuple[str, str or NoneType, str]:
+            The given path, its new code (or None, if nothing changed),
+            and a description of why `path` couldn't be parsed, if it couldn't.
+
+    """
+    path, namespaces, partial, import_types, aliases = item
+
+    try:
+        graph = finder.get_graph(path)
+    except RuntimeError as error:
+        return path, None, str(error)
+
+    imports = parser.get_imports(
+        graph, partial=partial, namespaces=namespaces, aliases=aliases
+    )
+    changed = False
+
+    for statement, (old, new) in itertools.product(imports, namespaces):
+        if import_types and statement.get_import_type() not in import_types:
+            continue
+
+        if old in statement:
+            statement.replace(old, new)
+            changed = True
+
+    if not changed:
+        return path, None, ""
+
+    return path, graph.get_code(), ""
+
+
+def _iter_results(items, jobs):
+    """Replace the imports of many Python files, possibly in separate processes.
+
+    Args:
+        items (list[tuple]): The arguments to :func:`_get_code` for each file.
+        jobs (int): The number of processes to use. If less than 1, use every CPU.
+
+    Yields:
+        tuple[str, str or NoneType, str]:
+            The output of :func:`_get_code` for each of `items`, in the same order.
+
+    """
+    if jobs < 1:
+        jobs = multiprocessing.cpu_count()
+
+    jobs = min(jobs, len(items))
+
+    if jobs < 2 or multiprocessing.current_process().daemon:
+        # Processes of a :class:`multiprocessing.Pool` may not start processes.
+        #
+        # Files are processed one at a time so that, if the caller stops
+        # early, the remaining files are never parsed.
+        #
+        for item in items:
+            yield _get_code(item)
+
+        return
+
+    pool = multiprocessing.Pool(processes=jobs)
+
+    try:
+        results = pool.map(_get_code, items)
+    except BaseException:
+        pool.terminate()
+
+        raise
+    else:
+        pool.close()
+    finally:
+        pool.join()
+
+    for result in results:
+        yield result
+
+
+def _write(path, code):
+    """Replace the contents of `path` with `code` so that readers never see a partial file.
+
+    If `path` is a symlink, the file it points to is replaced. A file
+    with several hard links is written in place, instead, so that every
+    link keeps sharing the same file.
+
+    Args:
+        path (str): An absolute path to a Python file on-disk.
+        code (str): The new contents of `path`.
+
+    """
+    path = os.path.realpath(path)
+
+    if os.stat(path).st_nlink > 1:
+        with open(path, "w") as handler:
+            handler.write(code)
+
+        return
+
+    handle, temporary = tempfile.mkstemp(
+        dir=os.path.dirname(path), suffix=".py", prefix=".move_break_"
+    )
+
+    try:
+        with os.fdopen(handle, "w") as handler:
+            handler.write(code)
+
+        shutil.copymode(path, temporary)
+        os.rename(temporary, path)
+    except BaseException:
+        os.remove(temporary)
+
+        raise
+
+
 def move_imports(  # pylint: disable=too-many-arguments
     files,
     namespaces,
@@ -19,12 +145,14 @@ def move_imports(  # pylint: disable=too-many-arguments
     import_types=frozenset(),
     aliases=False,
     continue_on_syntax_error=False,
+    jobs=1,
 ):
     """Replace the imports of every given file.
 
     Not every path in `files` will actually be overwritten. Because
     that depends on whether the file includes a namespace import from
-    `namespaces`.
+    `namespaces`. Files which don't mention any of `namespaces` are
+    skipped without being parsed.
 
     Args:
         files (iter[str]):
@@ -51,6 +179,10 @@ def move_imports(  # pylint: disable=too-many-arguments
             If True and a path in `files` is an invalid Python module
             and otherwise cannot be parsed then skip the file and keep
             going. Otherwise, raise an exception. Default is False.
+        jobs (int, optional):
+            The number of files to parse and replace at the same time,
+            each in a separate process. If the value is less than 1,
+            every CPU is used. Default: 1.
 
     Raises:
         RuntimeError:
@@ -64,8 +196,6 @@ def move_imports(  # pylint: disable=too-many-arguments
         set[str]: The paths from `files` that were actually overwritten.
 
     """
-    output = set()
-
     if not namespaces:
         raise ValueError("Namespaces cannot be empty.")
 
@@ -75,35 +205,27 @@ def move_imports(  # pylint: disable=too-many-arguments
                 'Pair "{old}/{new}" cannot be the same.'.format(old=old, new=new)
             )
 
-    for path in files:
-        changed = False
+    prefilter = finder.get_prefilter(old for old, _ in namespaces)
+    items = [
+        (path, namespaces, partial, import_types, aliases)
+        for path in files
+        if finder.is_possible_match(path, prefilter)
+    ]
+    output = set()
 
-        try:
-            graph = finder.get_graph(path)
-        except RuntimeError:
+    for path, code, error in _iter_results(items, jobs):
+        if error:
             _LOGGER.warning('Couldn\'t parse "%s" as a Python file.', path)
 
             if not continue_on_syntax_error:
-                raise
+                raise RuntimeError(error)
 
             continue
 
-        imports = parser.get_imports(
-            graph, partial=partial, namespaces=namespaces, aliases=aliases
-        )
-
-        for statement, (old, new) in itertools.product(imports, namespaces):
-            if import_types and statement.get_import_type() not in import_types:
-                continue
-
-            if old in statement:
-                statement.replace(old, new)
-                changed = True
-
-        if changed:
-            with open(path, "w") as handler:
-                handler.write(graph.get_code())
+        if code is None:
+            continue
 
-            output.add(path)
+        _write(path, code)
+        output.add(path)
 
     return output
@@ -15,6 +15,18 @@ from move_break import mover
 class Common(unittest.TestCase):
     """A base clsas used by other test classes."""
 
+    @staticmethod
+    def _make_file(code):
+        """str: Write `code` to a temporary Python file and delete it later."""
+        with tempfile.NamedTemporaryFile(
+            suffix=".py", mode="w", delete=False
+        ) as handler:
+            handler.write(code)
+
+        atexit.register(functools.partial(os.remove, handler.name))
+
+        return handler.name
+
     def _test(  # pylint: disable=too-many-arguments
         self,
         expected,
@@ -53,22 +65,17 @@ class Common(unittest.TestCase):
                 going. Otherwise, raise an exception. Default is False.
 
         """
-        with tempfile.NamedTemporaryFile(
-            suffix=".py", mode="w", delete=False
-        ) as handler:
-            handler.write(code)
-
-        atexit.register(functools.partial(os.remove, handler.name))
+        path = self._make_file(code)
 
         mover.move_imports(
-            {handler.name},
+            {path},
             namespaces,
             partial=partial,
             aliases=aliases,
             continue_on_syntax_error=continue_on_syntax_error,
         )
 
-        with open(handler.name, "r") as handler:
+        with open(path, "r") as handler:
             new_code = handler.read()
 
         self.assertEqual(expected, new_code)
@@ -3,8 +3,12 @@
 
 """Check that setting / replacing imports works as expected."""
 
+import os
 import textwrap
 
+from move_break import finder, mover
+from six.moves import mock
+
 from . import common
 
 
@@ -752,3 +756,217 @@ class PartialImport(common.Common):
         expected = "import new.blah, thing.another, new.blah.more"
 
         self._test(expected, code, namespaces, partial=True)
+
+
+class Prefilter(common.Common):
+    """Skip files which can't possibly contain the namespaces to replace."""
+
+    def test_skip(self):
+        """Don't parse a file which never mentions the namespace."""
+        code = "import thing.another\n"
+        namespaces = [("foo.bar", "new.bar")]
+
+        with mock.patch.object(mover.finder, "get_graph") as get_graph:
+            self._test(code, code, namespaces)
+
+        self.assertFalse(get_graph.called)
+
+    def test_skip_syntax_error(self):
+        """Don't raise for a broken file if it never mentions the namespace."""
+        code = "from thing import, another\n"
+        namespaces = [("foo.bar", "new.bar")]
+
+        self._test(code, code, namespaces)
+
+    def test_word(self):
+        """Only skip a file if the namespace's first name isn't a whole word."""
+        code = "import foobar\n"
+        namespaces = [("foo", "new")]
+
+        self.assertFalse(
+            finder.is_possible_match(
+                self._make_file(code), finder.get_prefilter(["foo"])
+            )
+        )
+        self._test(code, code, namespaces)
+
+        code = textwrap.dedent(
+            """\
+            from \\
+                foo import bar
+            """
+        )
+        expected = textwrap.dedent(
+            """\
+            from \\
+                new import bar
+            """
+        )
+
+        self._test(expected, code, namespaces, partial=True)
+
+    def test_namespaces(self):
+        """Skip files which have no imports at all."""
+        path = self._make_file("foo = 8\n")
+
+        with mock.patch.object(finder, "get_graph") as get_graph:
+            self.assertEqual(set(), finder.get_namespaces(path))
+
+        self.assertFalse(get_graph.called)
+
+
+class Cache(common.Common):
+    """Parse each file only once in :func:`.get_namespaces`, as long as it doesn't change."""
+
+    def setUp(self):
+        """Start each test without any parsed files."""
+        super(Cache, self).setUp()
+
+        finder._CACHE.clear()  # pylint: disable=protected-access
+        self.addCleanup(
+            finder.set_cache_size,
+            finder._CACHE_SIZE,  # pylint: disable=protected-access
+        )
+
+    def test_parse_once(self):
+        """Re-use the graph of :func:`.get_namespaces` until the file changes."""
+        path = self._make_file("import foo.bar\n")
+
+        with mock.patch.object(
+            finder, "get_graph_and_errors", wraps=finder.get_graph_and_errors
+        ) as get_graph_and_errors:
+            self.assertEqual({"foo", "foo.bar"}, finder.get_namespaces(path))
+            self.assertEqual({"foo", "foo.bar"}, finder.get_namespaces(path))
+            self.assertEqual(1, get_graph_and_errors.call_count)
+
+            # :func:`.move_imports` edits its graph so it always parses the file
+            self.assertEqual(
+                {path}, mover.move_imports({path}, [("foo.bar", "another.bar")])
+            )
+            self.assertEqual(2, get_graph_and_errors.call_count)
+
+            # The file was re-written so it must be parsed again
+            self.assertEqual({"another", "another.bar"}, finder.get_namespaces(path))
+            self.assertEqual(3, get_graph_and_errors.call_count)
+
+    def test_edit(self):
+        """Don't let edits to a graph from :func:`.get_graph` change the cache."""
+        path = self._make_file("import foo.bar\n")
+        self.assertEqual({"foo", "foo.bar"}, finder.get_namespaces(path))
+
+        graph = finder.get_graph(path)
+        next(graph.iter_imports()).children[1].children[0].value = "another"
+
+        self.assertEqual("import another.bar\n", graph.get_code())
+        self.assertEqual("import foo.bar\n", finder.get_graph(path).get_code())
+        self.assertEqual({"foo", "foo.bar"}, finder.get_namespaces(path))
+
+    def test_size(self):
+        """Forget the oldest files once the cached files are too large."""
+        first = self._make_file("import foo\n")
+        second = self._make_file("import bar\n")
+        finder.set_cache_size(len("import foo\n"))
+
+        with mock.patch.object(
+            finder, "get_graph_and_errors", wraps=finder.get_graph_and_errors
+        ) as get_graph_and_errors:
+            finder.get_namespaces(first)
+            finder.get_namespaces(second)
+            finder.get_namespaces(second)
+            self.assertEqual(2, get_graph_and_errors.call_count)
+
+            finder.get_namespaces(first)
+            self.assertEqual(3, get_graph_and_errors.call_count)
+
+    def test_errors(self):
+        """Get a file's syntax errors from the same parse as its graph."""
+        _, errors = finder.get_graph_and_errors(self._make_file("import foo\n"))
+        self.assertEqual([], errors)
+
+        path = self._make_file("from foo import, bar\n")
+        _, errors = finder.get_graph_and_errors(path)
+        self.assertTrue(errors)
+
+        with self.assertRaises(RuntimeError):
+            finder.get_graph(path)
+
+        with self.assertRaises(RuntimeError):
+            finder.get_namespaces(path)
+
+
+class Jobs(common.Common):
+    """Replace the imports of several files at once."""
+
+    def test_parallel(self):
+        """Get the same files and code as replacing them one-by-one."""
+        codes = ["import foo.bar\n", "import thing\n", "from foo import bar\n"] * 3
+        namespaces = [("foo.bar", "new.bar")]
+        serial = [self._make_file(code) for code in codes]
+        parallel = [self._make_file(code) for code in codes]
+
+        serial_output = mover.move_imports(serial, namespaces, partial=True)
+        parallel_output = mover.move_imports(parallel, namespaces, partial=True, jobs=3)
+
+        self.assertEqual(
+            sorted(serial.index(path) for path in serial_output),
+            sorted(parallel.index(path) for path in parallel_output),
+        )
+
+        for first, second in zip(serial, parallel):
+            with open(first, "r") as handler:
+                first_code = handler.read()
+
+            with open(second, "r") as handler:
+                self.assertEqual(first_code, handler.read())
+
+    def test_syntax_error(self):
+        """Stop at the first file with a syntax error, even if files are parsed in parallel."""
+        code = "import foo.bar\n"
+        good = self._make_file(code)
+        bad = self._make_file("from foo import, bar\n")
+        after = self._make_file(code)
+        namespaces = [("foo.bar", "new.bar")]
+
+        with self.assertRaises(RuntimeError):
+            mover.move_imports([good, bad, after], namespaces, jobs=3)
+
+        with open(after, "r") as handler:
+            self.assertEqual(code, handler.read())
+
+        self.assertEqual(
+            {after},
+            mover.move_imports(
+                [good, bad, after], namespaces, continue_on_syntax_error=True, jobs=3
+            ),
+        )
+
+
+class Write(common.Common):
+    """Keep links to a file working after its imports are replaced."""
+
+    def _test_link(self, make_link):
+        """Replace the imports of a link to a file and check both paths."""
+        path = self._make_file("import foo.bar\n")
+        link = path + "_link.py"
+        make_link(path, link)
+        self.addCleanup(os.remove, link)
+
+        self.assertEqual({link}, mover.move_imports({link}, [("foo.bar", "new.bar")]))
+
+        for item in (path, link):
+            with open(item, "r") as handler:
+                self.assertEqual("import new.bar\n", handler.read())
+
+        return path, link
+
+    def test_symlink(self):
+        """Replace the file which a symlink points to, not the symlink."""
+        _, link = self._test_link(os.symlink)
+
+        self.assertTrue(os.path.islink(link))
+
+    def test_hard_link(self):
+        """Write to the shared file of a hard link, in place."""
+        path, link = self._test_link(os.link)
+
+        self.assertTrue(os.path.samefile(path, link))
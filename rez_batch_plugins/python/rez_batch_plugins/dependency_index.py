@@ -0,0 +1,269 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""A persistent index of which Rez package families require which others.
+
+:func:`rez.package_search.get_reverse_dependency_tree` reads the
+``requires`` of every Rez package family, in every path, every time
+it is called. This module reads them once per packages path, saves the
+result to-disk, and on later runs only re-reads the families whose
+files changed since then. Finding the downstream consumers of a family
+is then a dictionary lookup.
+
+Just like :func:`rez.package_search.get_reverse_dependency_tree`, only
+the latest version of each family is used and the requirements of
+every variant of that version are included.
+
+"""
+
+import collections
+import hashlib
+import json
+import logging
+import os
+import tempfile
+
+from rez import packages_
+from rez.config import config
+from rez.exceptions import PackageFamilyNotFoundError
+from rez.package_repository import package_repository_manager
+from rez.utils import formatting
+from rez.vendor.version import version as version_
+
+SCHEMA_VERSION = 1
+_FOLDER_NAME = "rez_batch_plugins_dependency_index"
+_LOGGER = logging.getLogger(__name__)
+
+
+class DependencyIndex(object):
+    """Every Rez package family, its latest version, and what it requires."""
+
+    def __init__(self, families):
+        """Build a reverse lookup from some already-read package families.
+
+        Args:
+            families (dict[str, dict]):
+                Each family name and the latest version of the family
+                along with its requirements. See :func:`_read_family`.
+
+        """
+        super(DependencyIndex, self).__init__()
+
+        self._families = families
+        self._consumers = collections.defaultdict(dict)
+
+        for name, entry in families.items():
+            for request in entry["requires"]:
+                self._consumers[formatting.PackageRequest(request).name].setdefault(
+                    name, []
+                ).append(request)
+
+    def get_consumers(self, name):
+        """Find every family which requires a Rez package family.
+
+        Args:
+            name (str): The name of a Rez package family. e.g. "foo".
+
+        Raises:
+            :class:`rez.exceptions.PackageFamilyNotFoundError`: If `name` doesn't exist.
+
+        Returns:
+            dict[str, list[str]]:
+                Each downstream family name and the requests that it
+                makes for `name`. e.g. {"bar": ["foo-1+<2"]}.
+
+        """
+        if name not in self._families:
+            raise PackageFamilyNotFoundError(
+                "No such package family {name!r}".format(name=name)
+            )
+
+        return {
+            family: requests
+            for family, requests in self._consumers.get(name, dict()).items()
+            if family != name
+        }
+
+    def get_version(self, name):
+        """str: Get the latest version of the Rez package family `name`."""
+        return self._families[name]["version"]
+
+
+def _get_cache_path(path, directory=""):
+    """str: Find the file where the index of a packages path is saved."""
+    return os.path.join(
+        directory or tempfile.gettempdir(),
+        _FOLDER_NAME,
+        hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest() + ".json",
+    )
+
+
+def _get_modified_time(path, name, entry=None):
+    """Get a timestamp which changes whenever a Rez package family changes.
+
+    Adding or removing a version changes the family's folder. Editing
+    the latest version changes its package definition file.
+
+    Args:
+        path (str): The packages path which contains the family.
+        name (str): The name of the family.
+        entry (dict, optional): The last-saved details of the family, if any.
+
+    Returns:
+        float or NoneType: The timestamp or None if the family isn't on-disk.
+
+    """
+    times = []
+
+    for item in (os.path.join(path, name), (entry or dict()).get("filepath")):
+        if item and os.path.exists(item):
+            times.append(os.path.getmtime(item))
+
+    if not times:
+        return None
+
+    return max(times)
+
+
+def _read(path):
+    """dict[str, dict]: Load the saved families of a packages path index, if any."""
+    try:
+        with open(path, "r") as handler:
+            data = json.load(handler)
+    except (IOError, OSError, ValueError):
+        return dict()
+
+    if data.get("schema") != SCHEMA_VERSION:
+        return dict()
+
+    return data.get("families", dict())
+
+
+def _read_family(repository, family):
+    """Get the latest version of a Rez package family and everything that it requires.
+
+    Args:
+        repository (:class:`rez.package_repository.PackageRepository`):
+            The packages path which contains `family`.
+        family (:class:`rez.package_resources.PackageFamilyResource`):
+            The Rez package family to read.
+
+    Returns:
+        dict or NoneType:
+            The family's latest version, package definition file, and
+            requirements. If the family has no packages, return None.
+
+    """
+    latest = None
+
+    for resource in repository.iter_packages(family):
+        if latest is None or resource.version > latest.version:
+            latest = resource
+
+    if latest is None:
+        return None
+
+    package = packages_.Package(latest)
+    requires = []
+
+    for variant in package.iter_variants():
+        requires.extend(
+            str(request) for request in variant.get_requires() if not request.conflict
+        )
+
+    return {
+        "filepath": package.uri or "",
+        "requires": sorted(set(requires)),
+        "version": str(package.version),
+    }
+
+
+def _write(path, families):
+    """Save the families of a packages path index so that later runs can re-use it."""
+    directory = os.path.dirname(path)
+
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+
+    handle, temporary = tempfile.mkstemp(dir=directory, suffix=".json")
+
+    with os.fdopen(handle, "w") as handler:
+        json.dump({"schema": SCHEMA_VERSION, "families": families}, handler)
+
+    os.rename(temporary, path)
+
+
+def _update_path(path, directory=""):
+    """Read the Rez package families of one packages path, re-using the saved index.
+
+    Args:
+        path (str): The packages path to read.
+        directory (str, optional): The folder where indexes are saved.
+
+    Returns:
+        dict[str, dict]: Each family name and its details. See :func:`_read_family`.
+
+    """
+    cache_path = _get_cache_path(path, directory=directory)
+    previous = _read(cache_path)
+    repository = package_repository_manager.get_repository(path)
+    families = dict()
+    changed = False
+
+    for family in repository.iter_package_families():
+        entry = previous.get(family.name)
+        modified = _get_modified_time(path, family.name, entry=entry)
+
+        if entry and modified is not None and entry.get("modified") == modified:
+            families[family.name] = entry
+
+            continue
+
+        changed = True
+        entry = _read_family(repository, family)
+
+        if not entry:
+            _LOGGER.warning('Package family "%s" has no packages.', family.name)
+
+            continue
+
+        entry["modified"] = _get_modified_time(path, family.name, entry=entry)
+        families[family.name] = entry
+
+    if changed or set(previous) != set(families):
+        _write(cache_path, families)
+
+    return families
+
+
+def get_index(paths=None, directory=""):
+    """Get the reverse dependencies of every Rez package family.
+
+    If a family exists in several paths, its latest version is used.
+    If several paths have the same latest version, the earliest path wins.
+
+    Args:
+        paths (list[str], optional):
+            The directories to search for Rez package families,
+            Default: :attr:`rez.config.config.packages_path`.
+        directory (str, optional):
+            The folder where indexes are saved between runs. If no
+            folder is given, a temporary folder is used.
+
+    Returns:
+        :class:`DependencyIndex`: The found families and their dependencies.
+
+    """
+    paths = paths or config.packages_path  # pylint: disable=no-member
+    families = dict()
+
+    for path in paths:
+        for name, entry in _update_path(path, directory=directory).items():
+            existing = families.get(name)
+
+            if not existing or version_.Version(entry["version"]) > version_.Version(
+                existing["version"]
+            ):
+                families[name] = entry
+
+    return DependencyIndex(families)
@@ -0,0 +1,255 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""A persistent index of which Python files (and Rez packages) import which namespaces.
+
+Checking if a Rez package imports some namespace normally means parsing
+every one of its Python files. This module parses each file using
+:mod:`ast`, which is much faster than parso, and saves the found
+namespaces to-disk by the hash of the file's contents. The files of
+every added Rez package are saved too, along with their modification
+time, size, and hash. Later runs skip files whose time and size haven't
+changed without reading them and only parse files whose contents changed.
+
+The namespaces of every added Rez package are also kept in an inverted
+index, from namespace to the packages and files which import it. So
+finding every package which imports some namespace is a single query.
+
+"""
+
+import collections
+import hashlib
+import json
+import logging
+import os
+import tempfile
+
+from move_break import move_break_api
+from python_compatibility import import_parser
+
+SCHEMA_VERSION = 2
+_LOGGER = logging.getLogger(__name__)
+
+
+class NamespaceIndex(object):
+    """The imported namespaces of many Python files and the Rez packages that own them."""
+
+    def __init__(self, path=""):
+        """Load the namespaces of any files which were already parsed.
+
+        Args:
+            path (str, optional):
+                The JSON file where parsed namespaces are saved between
+                runs. If no path is given, nothing is loaded or saved.
+
+        """
+        super(NamespaceIndex, self).__init__()
+
+        self._path = path
+        self._hashes, self._roots = _read(path) if path else (dict(), dict())
+        self._changed = False
+        self._files = collections.defaultdict(set)
+        self._names = collections.defaultdict(set)
+
+    def _get_hash(self, path):
+        """Read a Python file and parse it, if its contents haven't been parsed before.
+
+        Args:
+            path (str): The absolute path to a Python file on-disk.
+
+        Returns:
+            str: The hash of the file's contents, which its namespaces are saved by.
+
+        """
+        with open(path, "rb") as handler:
+            data = handler.read()
+
+        key = hashlib.sha1(data).hexdigest()
+
+        if key not in self._hashes:
+            self._hashes[key] = sorted(_parse(path, data))
+            self._changed = True
+
+        return key
+
+    def add_package(self, name, root, ignore=frozenset()):
+        """Add every Python file of a Rez package to the inverted index.
+
+        Files whose modification time and size match the last time
+        that `root` was added are not read again.
+
+        Args:
+            name (str): The name of the Rez package. e.g. "foo".
+            root (str): The folder on-disk which contains the package's Python files.
+            ignore (set[str], optional): Any file paths to skip.
+
+        """
+        known = self._roots.get(root, dict())
+        files = dict()
+
+        for path in move_break_api.expand_paths(root):
+            if path in ignore:
+                continue
+
+            status = os.stat(path)
+            entry = known.get(path)
+
+            if (
+                entry
+                and entry[:2] == [status.st_mtime, status.st_size]
+                and entry[2] in self._hashes
+            ):
+                key = entry[2]
+            else:
+                key = self._get_hash(path)
+
+            files[path] = [status.st_mtime, status.st_size, key]
+
+            for namespace in self._hashes[key]:
+                self._files[namespace].add((name, path))
+                self._names[namespace].add(name)
+
+        if files != known:
+            self._roots[root] = files
+            self._changed = True
+
+    def find(self, namespaces):
+        """Find every added Rez package and file which imports any of `namespaces`.
+
+        Args:
+            namespaces (iter[str]): Dot-separated Python namespaces. e.g. {"foo.bar"}.
+
+        Returns:
+            set[tuple[str, str]]: Each found Rez package name and file path.
+
+        """
+        output = set()
+
+        for namespace in namespaces:
+            output.update(self._files.get(namespace, set()))
+
+        return output
+
+    def get_namespaces(self, path):
+        """Get every dot-separated namespace that a Python file imports.
+
+        Args:
+            path (str): The absolute path to a Python file on-disk.
+
+        Returns:
+            set[str]: The found namespaces. e.g. {"os", "os.path", "foo.bar"}.
+
+        """
+        return set(self._hashes[self._get_hash(path)])
+
+    def is_importing(self, name, namespaces):
+        """Check if an added Rez package imports any of `namespaces`.
+
+        Args:
+            name (str): The name of the Rez package. e.g. "foo".
+            namespaces (iter[str]): Dot-separated Python namespaces. e.g. {"foo.bar"}.
+
+        Returns:
+            bool: If any file of the package imports any of `namespaces`.
+
+        """
+        return any(name in self._names.get(namespace, ()) for namespace in namespaces)
+
+    def save(self):
+        """Write every parsed file's namespaces to-disk, if anything new was parsed."""
+        if not self._path or not self._changed:
+            return
+
+        directory = os.path.dirname(self._path)
+
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        handle, temporary = tempfile.mkstemp(dir=directory, suffix=".json")
+
+        with os.fdopen(handle, "w") as handler:
+            json.dump(
+                {
+                    "schema": SCHEMA_VERSION,
+                    "hashes": self._hashes,
+                    "roots": self._roots,
+                },
+                handler,
+            )
+
+        os.rename(temporary, self._path)
+        self._changed = False
+
+
+def _parse(path, data):
+    """Find the namespaces that some Python source code imports.
+
+    The found namespaces include every namespace that
+    :func:`move_break.move_break_api.get_namespaces` finds, except for
+    import aliases, plus the parent package of aliased plain imports.
+    e.g. `import foo.bar as thing` finds {"foo", "foo.bar"}.
+    If the code can't be parsed by :mod:`ast` (e.g. it's Python 2 code
+    but this is Python 3), parso is used instead.
+
+    Args:
+        path (str): The Python file that `data` came from.
+        data (bytes): The file's contents.
+
+    Returns:
+        set[str]: The found namespaces.
+
+    """
+    try:
+        modules = import_parser.parse_python_source_code(
+            data.decode("utf-8").replace("\r\n", "\n")
+        )
+    except (SyntaxError, UnicodeDecodeError, ValueError):
+        _LOGGER.debug('Path "%s" could not be parsed by ast.', path)
+
+        return move_break_api.get_namespaces(path)
+
+    namespaces = set()
+
+    for module in modules:
+        namespace = module.get_namespace().lstrip(".")
+
+        if not namespace:
+            continue
+
+        namespaces.add(namespace)
+
+        if not module.get_leaf():
+            # `import foo.bar` also makes `foo` available
+            namespaces.update(module.iter_parent_namespaces())
+
+    return namespaces
+
+
+def _read(path):
+    """Load the saved namespaces and Rez package files of an index, if any.
+
+    Args:
+        path (str): The JSON file where the index was saved.
+
+    Returns:
+        tuple[dict[str, list[str]], dict[str, dict[str, list]]]:
+            Each file hash and its namespaces, followed by each Rez
+            package folder and the modification time, size, and hash
+            of each of its files.
+
+    """
+    try:
+        with open(path, "r") as handler:
+            data = json.load(handler)
+    except (IOError, OSError, ValueError):
+        return dict(), dict()
+
+    if data.get("schema") != SCHEMA_VERSION:
+        return dict(), dict()
+
+    return data.get("hashes", dict()), data.get("roots", dict())
+
+
+def get_default_path():
+    """str: Get the file where namespaces are saved, if the user doesn't choose one."""
+    return os.path.join(tempfile.gettempdir(), "rez_batch_plugins_namespace_index.json")
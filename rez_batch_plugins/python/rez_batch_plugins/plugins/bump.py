@@ -5,26 +5,32 @@
 
 import argparse
 import collections
+import functools
+import json
 import logging
 import os
+import shutil
 import sys
+import tarfile
 import tempfile
 import textwrap
 
-from python_compatibility import wrapping
-from rez import (build_process_, build_system, package_search, package_test,
-                 serialise)
+from rez import build_process_, build_system, packages_, serialise
 from rez.utils import filesystem, formatting
-from rez_batch_process.core import registry
-from rez_batch_process.core.plugins import command, conditional
+from rez_batch_process.core import exceptions, registry, rez_git
+from rez_batch_process.core.plugins import command
 from rez_bump import rez_bump_api
 from rez_industry import api
-from rez_utilities import creator, finder
+from rez_utilities import finder
+
+from .. import dependency_index, validation
 
 _Configuration = collections.namedtuple(
     "_Configuration", "command token pull_request_name ssl_no_verify results"
 )
 _LOGGER = logging.getLogger(__name__)
+_STAGE_EXTENSION = ".json"
+_VALIDATIONS = dict()
 _BUMP_CHOICES = frozenset(("major", "minor", "patch"))
 _Results = collections.namedtuple(
     "_Results", "pre_bump_build pre_bump_test post_bump_build post_bump_test"
@@ -100,46 +106,137 @@ class Bump(command.RezShellCommand):
                   or whether it's OK to continue.
 
         Returns:
-            str: Any error message that occurred from this command, if any.
+            tuple[str, :attr:`_Results`]:
+                Any error message that occurred from this command, if
+                any, and the build / test results.
 
         """
-        build_path = tempfile.mkdtemp(suffix="_pre_bump_build_path")
-        pre_bump_build = True
+        results = _VALIDATIONS.get(package.name)
+
+        if results:
+            # :meth:`Bump.prepare` already validated every package of the bump
+            error, _ = cls._try_bump(package, arguments)
+
+            return error, results
+
+        # Validate an unchanged copy of the package while the original is bumped
+        directory, pre_bump_root = _copy_package(package)
 
         try:
-            creator.build(package, build_path, packages_path=arguments.additional_paths)
-        except RuntimeError:
-            pre_bump_build = False
+            return cls._validate_bump(package, pre_bump_root, arguments)
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    @classmethod
+    def _try_bump(cls, package, arguments):
+        """Bump a Rez package and report any error.
 
-        pre_bump_tests = _run_test(package, paths=arguments.additional_paths)
+        Args:
+            package (:class:`rez.developer_package.DeveloperPackage`):
+                The Rez package that will be changed.
+            arguments (:class:`argparse.Namespace`):
+                The user-provided, plug-in specific arguments.
 
-        error = ""
-        post_bump_build = "Not run"
-        post_bump_tests = "Not run"
+        Returns:
+            tuple[str, :class:`rez.developer_package.DeveloperPackage` or NoneType]:
+                Any error message that occurred while bumping, if
+                any, and the bumped package, if the bump succeeded.
 
+        """
         try:
-            package = cls._bump(package, arguments.new, arguments.packages)
+            return "", cls._bump(package, arguments.new, arguments.packages)
         except Exception:  # pylint: disable=broad-except
-            error = 'Bumping package "{package.name}" failed.'.format(package=package)
             _LOGGER.warning('Package "%s" bump failed.', package)
-        else:
-            build_path = tempfile.mkdtemp(suffix="_post_bump_build_path")
-            post_bump_build = True
 
-            try:
-                creator.build(
-                    package, build_path, packages_path=arguments.additional_paths
-                )
-            except Exception:  # pylint: disable=broad-except
-                post_bump_build = False
+            return (
+                'Bumping package "{package.name}" failed.'.format(package=package),
+                None,
+            )
 
-            post_bump_tests = _run_test(package, paths=arguments.additional_paths)
+    @classmethod
+    def _validate_bump(cls, package, pre_bump_root, arguments):
+        """Bump a Rez package and then build and test it before and after the bump.
 
-        results = _Results(
-            pre_bump_build, pre_bump_tests, post_bump_build, post_bump_tests
+        Args:
+            package (:class:`rez.developer_package.DeveloperPackage`):
+                The Rez package that will be changed.
+            pre_bump_root (str):
+                The folder of an unchanged copy of `package`.
+            arguments (:class:`argparse.Namespace`):
+                The user-provided, plug-in specific arguments.
+
+        Returns:
+            tuple[str, :attr:`_Results`]:
+                Any error message that occurred from this command, if
+                any, and the build / test results.
+
+        """
+        roots = [pre_bump_root]
+        error, bumped = cls._try_bump(package, arguments)
+        post_bump_root = ""
+
+        if bumped:
+            post_bump_root = finder.get_package_root(bumped)
+            roots.append(post_bump_root)
+
+        validations = validation.validate(roots, paths=arguments.additional_paths)
+        _LOGGER.info(
+            'Package "%s" validation results:\n%s',
+            package.name,
+            validation.get_matrix(validations),
         )
 
-        return error, results
+        return error, _get_results(validations, pre_bump_root, post_bump_root)
+
+    @classmethod
+    def prepare(cls, run, arguments):
+        """Bump every downstream Rez package in a copy and validate them all at once.
+
+        Each Rez package is copied twice and one copy is bumped. Every
+        copy is then built and tested, in parallel, and one table of
+        results is reported for the whole bump. This all happens
+        before any pull request is opened. :meth:`run` adds the
+        results of each package to its pull request.
+
+        Args:
+            run (callable[callable[:class:`rez.packages_.Package`] -> str] -> tuple):
+                Call a function on every Rez package of the bump, each
+                in a clone of its repository.
+            arguments (:class:`argparse.Namespace`):
+                The user-provided, plug-in specific arguments.
+
+        """
+        _VALIDATIONS.clear()
+        directory = tempfile.mkdtemp(suffix="_bump_validation")
+
+        try:
+            run(functools.partial(_stage, directory=directory, arguments=arguments))
+            stages = _read_stages(directory)
+            validations = validation.validate(
+                [root for roots in stages.values() for root in roots if root],
+                paths=arguments.additional_paths,
+            )
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+        table = collections.OrderedDict()
+
+        for name, (pre_bump_root, post_bump_root) in stages.items():
+            results = _get_results(validations, pre_bump_root, post_bump_root)
+            _VALIDATIONS[name] = results
+            table["{name} (pre-bump)".format(name=name)] = validation.Result(
+                results.pre_bump_build, results.pre_bump_test
+            )
+            table["{name} (post-bump)".format(name=name)] = validation.Result(
+                results.post_bump_build, results.post_bump_test
+            )
+
+        _LOGGER.info("Bump validation results:\n%s", validation.get_matrix(table))
+
+    @staticmethod
+    def is_thread_safe():
+        """bool: Packages are built and tested in this process, which changes its current directory."""
+        return False
 
     @classmethod
     def parse_arguments(cls, text):
@@ -195,16 +292,108 @@ class Bump(command.RezShellCommand):
             cached_users=arguments.cached_users,
             fallback_reviewers=arguments.fallback_reviewers,
             base_url=arguments.base_url,
+            adapter=arguments.git_adapter,
         )
 
         return ""
 
 
-def _get_user_provided_packages():
-    """set[str]: Every package/version whose downstream dependencies must be bumped."""
+def _get_results(validations, pre_bump_root, post_bump_root):
+    """Find the build / test results of one Rez package before and after its bump.
+
+    Args:
+        validations (dict[str, :attr:`.validation.Result`]):
+            Each validated package root and its results.
+        pre_bump_root (str):
+            The folder of an unchanged copy of the package.
+        post_bump_root (str):
+            The folder of the bumped package or an empty string, if
+            the bump failed.
+
+    Returns:
+        :attr:`_Results`: The package's results.
+
+    """
+    pre_bump = validations[pre_bump_root]
+    post_bump = validation.Result(validation.NOT_RUN, validation.NOT_RUN)
+
+    if post_bump_root:
+        post_bump = validations[post_bump_root]
+
+    return _Results(pre_bump.build, pre_bump.test, post_bump.build, post_bump.test)
+
+
+def _read_stages(directory):
+    """Find every Rez package copy which :func:`_stage` wrote to `directory`.
+
+    Args:
+        directory (str): The folder given to :func:`_stage`.
+
+    Returns:
+        :class:`collections.OrderedDict` [str, tuple[str, str]]:
+            Each Rez package name, sorted, and the folders of its
+            unchanged and bumped copies. If the bump failed, the bumped
+            copy's folder is an empty string.
+
+    """
+    stages = collections.OrderedDict()
+
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith(_STAGE_EXTENSION):
+            continue
+
+        with open(os.path.join(directory, name), "r") as handler:
+            stages[name[: -len(_STAGE_EXTENSION)]] = tuple(json.load(handler))
+
+    return stages
+
+
+def _stage(package, directory, arguments):
+    """Copy a Rez package twice and bump one of the copies, for :meth:`Bump.prepare`.
+
+    The package itself is not changed. The folders of both copies are
+    written to a JSON file in `directory`, named after the package.
+
+    Args:
+        package (:class:`rez.developer_package.DeveloperPackage`):
+            The Rez package to copy.
+        directory (str):
+            The folder to copy into. It is shared by every Rez package of the bump.
+        arguments (:class:`argparse.Namespace`):
+            The user-provided, plug-in specific arguments.
+
+    Returns:
+        str: Any error message that occurred while bumping, if any.
+
+    """
+    staging = os.path.join(directory, package.name)
+    pre_bump_root = _copy_repository(package, os.path.join(staging, "pre_bump"))
+    post_bump_root = _copy_repository(package, os.path.join(staging, "post_bump"))
+    error, bumped = Bump._try_bump(  # pylint: disable=protected-access
+        packages_.get_developer_package(post_bump_root), arguments
+    )
+
+    if not bumped:
+        post_bump_root = ""
+
+    with open(os.path.join(directory, package.name + _STAGE_EXTENSION), "w") as handler:
+        json.dump([pre_bump_root, post_bump_root], handler)
+
+    return error
+
+
+def _get_user_arguments():
+    """:class:`argparse.Namespace`: Get the arguments that the user gave to this plugin."""
     parser = _get_parser()
     arguments, _ = parser.parse_known_args(sys.argv[1:])
 
+    return arguments
+
+
+def _get_user_provided_packages():
+    """set[str]: Every package/version whose downstream dependencies must be bumped."""
+    arguments = _get_user_arguments()
+
     return {formatting.PackageRequest(package) for package in arguments.packages}
 
 
@@ -215,6 +404,9 @@ def _get_packages_which_must_be_changed(paths=None):
     be used as the "root" and downstream packages that depend on this
     package will be searched and returned, here.
 
+    Downstream packages are found using a saved index of every
+    package's requirements. See :mod:`.dependency_index` for details.
+
     Args:
         paths (list[str], optional):
             The directories to search for Rez package families,
@@ -227,26 +419,23 @@ def _get_packages_which_must_be_changed(paths=None):
             valid but must be skipped, for some reason.
 
     """
-    packages, invalids, skips = conditional.get_default_latest_packages(paths=paths)
+    index = dependency_index.get_index(
+        paths=paths, directory=_get_user_arguments().dependency_index
+    )
     downstream = set()
 
     for package in _get_user_provided_packages():
-        downstream_package_names, _ = package_search.get_reverse_dependency_tree(
-            package_name=package.name, depth=1, paths=paths,
-        )
+        downstream.update(index.get_consumers(package.name))
 
-        # According to the documenatation in
-        # :func:`rez.package_search.get_reverse_dependency_tree` The
-        # first list always contains `package` by itself. We don't need
-        # this so we discard it here and just get the "depth 1" packages.
-        #
-        downstream_package_names = downstream_package_names[1]
+    packages_to_change = []
 
-        downstream.update(downstream_package_names)
+    for name in sorted(downstream):
+        package = packages_.get_latest_package(name, paths=paths)
 
-    packages_to_change = [package for package in packages if package.name in downstream]
+        if package:
+            packages_to_change.append(package)
 
-    return packages_to_change, invalids, skips
+    return packages_to_change, [], []
 
 
 def _get_parser():
@@ -276,7 +465,15 @@ def _get_parser():
     parser.add_argument(
         "-a",
         "--additional-paths",
-        help="An optional set of paths to include while resolving Rez packages.",
+        help="An optional set of paths to include while resolving Rez packages. "
+        "Separate each path with {os.pathsep!r}.".format(os=os),
+    )
+    parser.add_argument(
+        "--dependency-index",
+        default="",
+        help="A folder where the requirements of every Rez package are saved "
+        "between runs, to find downstream packages quickly. "
+        "If no folder is given, a temporary folder is used.",
     )
 
     command.add_git_arguments(parser)
@@ -306,57 +503,54 @@ def _run_build(package, paths=None):
     return True
 
 
-def _run_rez_test(package, paths=None):
-    # """Build and run the tests for every given Rez package.
-    #
-    # Args:
-    #     packages (:class:`rez.developer_package.DeveloperPackage`):
-    #         The Rez package whose tests will be run.
-    #     paths (list[str], optional):
-    #         All paths to search for Rez packages. Default is
-    #         :attr:`rez.config.packages_path`.
-    #
-    # Returns:
-    #     dict[str, int]: The name of each test that ran and its test results.
-    #
-    # """
-    # `package_request` is given an empty string and later defined, below
-    runner = package_test.PackageTestRunner(
-        package_request="", package_paths=paths, verbose=True,
-    )
-    runner.package = package
+def _copy_package(package):
+    """Copy a source Rez package into a temporary folder.
 
-    # TODO : Once this issue is merged and closed, this may need to account for "run_on"
-    #
-    # Reference: https://github.com/nerdvegas/rez/issues/665
-    #
-    tests = runner.get_test_names()
+    If the package is in a git repository, every committed file of the
+    repository is copied, not just the package's folder. That way,
+    relative symlinks and "../" paths which point outside of the
+    package still work in the copy.
 
-    if not tests:
-        uri = runner.get_package().uri
-        _LOGGER.warning('No tests found "%s".', uri)
+    Args:
+        package (:class:`rez.developer_package.DeveloperPackage`):
+            The Rez package to copy.
 
-        return "No tests were found"
+    Returns:
+        tuple[str, str]:
+            The temporary folder, which the caller must delete, and
+            the package's folder inside of it.
 
-    status = "Succeeded"
+    """
+    directory = tempfile.mkdtemp(suffix="_pre_bump_package")
 
-    for name in tests:
-        test_status = runner.run_test(name)
+    try:
+        return directory, _copy_repository(package, directory)
+    except BaseException:
+        shutil.rmtree(directory, ignore_errors=True)
 
-        if test_status:
-            status = "Has fails"
+        raise
+
+
+def _copy_repository(package, directory):
+    """str: Copy the git repository of `package` into `directory` and find the package's copy."""
+    root = finder.get_package_root(package)
+
+    try:
+        repository = rez_git.get_repository(package)
+    except exceptions.NoGitRepository:
+        destination = os.path.join(directory, os.path.basename(root))
+        shutil.copytree(root, destination, symlinks=True)
 
-            break  # No need to keep testing since we know there's at least one failure
+        return destination
 
-    return status
+    with tempfile.TemporaryFile() as handler:
+        repository.archive(handler, treeish="HEAD")
+        handler.seek(0)
 
+        with tarfile.open(fileobj=handler) as archive:
+            archive.extractall(directory)
 
-def _run_test(package, paths=None):
-    with wrapping.keep_cwd(os.getcwd()):
-        # Many Rez tests are run assuming that the user is cd'ed
-        # into the Rez package so we need to change directory here.
-        #
-        return _run_rez_test(package, paths=paths)
+    return os.path.join(directory, os.path.relpath(root, repository.working_dir))
 
 
 def _bump(package, increment, new_dependencies):
@@ -367,7 +561,9 @@ def _bump(package, increment, new_dependencies):
 
     new_code = api.add_to_attribute("requires", new_dependencies, code)
 
-    with filesystem.make_path_writable(os.path.dirname(os.path.dirname(package.filepath))):
+    with filesystem.make_path_writable(
+        os.path.dirname(os.path.dirname(package.filepath))
+    ):
         with serialise.open_file_for_write(package.filepath) as handler:
             handler.write(new_code)
 
@@ -8,7 +8,6 @@ import shlex
 import sys
 import textwrap
 
-from move_break import move_break_api
 from rez import serialise
 from rez_batch_process import cli as rez_batch_process_cli
 from rez_batch_process.core import registry, worker
@@ -16,7 +15,7 @@ from rez_batch_process.core.plugins import command, conditional
 from rez_move_imports import cli as rez_move_imports_cli
 from rez_utilities import finder, inspection
 
-from .. import repository_area
+from .. import namespace_index, repository_area
 
 
 class MoveImports(command.RezShellCommand):
@@ -98,6 +97,13 @@ class MoveImports(command.RezShellCommand):
             help="If running the command on a package raises an exception "
             "and this flag is added, this class will bail out early.",
         )
+        parser.add_argument(
+            "--namespace-index",
+            default="",
+            help="A JSON file where the imports of every Python file are saved "
+            "between runs, to find packages to change quickly. "
+            "If no file is given, a temporary file is used.",
+        )
 
         command.add_git_arguments(parser)
 
@@ -165,12 +171,31 @@ class MoveImports(command.RezShellCommand):
             cached_users=arguments.cached_users,
             fallback_reviewers=arguments.fallback_reviewers,
             base_url=arguments.base_url,
+            adapter=arguments.git_adapter,
         )
 
         return ""
 
 
-def _needs_replacement(package, user_namespaces):
+def _add_package(index, package):
+    """Add the Python files of a Rez package to an index of imported namespaces.
+
+    Args:
+        index (:class:`.NamespaceIndex`): The index to add to.
+        package (:class:`rez.packages_.Package`): Some Rez package (source or released).
+
+    Returns:
+        :class:`rez.packages_.Package`: The nearest Rez package definition of `package`.
+
+    """
+    root = finder.get_package_root(package)
+    package = finder.get_nearest_rez_package(root)
+    index.add_package(package.name, root, ignore={package.filepath})
+
+    return package
+
+
+def _needs_replacement(package, user_namespaces, index):
     """Figure out if the Rez package has Python files in it that :class:`MoveImports` can act upon.
 
     The logic goes like this:
@@ -191,6 +216,8 @@ def _needs_replacement(package, user_namespaces):
             replace. If any of the found namespaces match these then
             it means `package` must have at least one of its modules
             replaced.
+        index (:class:`.NamespaceIndex`):
+            The imported namespaces of every Python file that's been checked so far.
 
     Returns:
         bool:
@@ -198,18 +225,9 @@ def _needs_replacement(package, user_namespaces):
             inside of the given `package`.
 
     """
-    root = finder.get_package_root(package)
-    package = finder.get_nearest_rez_package(root)
-
-    namespaces = set()
+    package = _add_package(index, package)
 
-    for path in move_break_api.expand_paths(root):
-        if path == package.filepath:
-            continue
-
-        namespaces.update(move_break_api.get_namespaces(path))
-
-    if namespaces.intersection(user_namespaces):
+    if index.is_importing(package.name, user_namespaces):
         return True
 
     if not inspection.is_built_package(package):
@@ -220,19 +238,37 @@ def _needs_replacement(package, user_namespaces):
         repository.working_dir, package.name
     )
 
-    return _needs_replacement(repository_package, user_namespaces)
+    return _needs_replacement(repository_package, user_namespaces, index)
 
 
-def _get_user_provided_namespaces():
-    """set[tuple[str, str]]: Find the dot-separated namespaces to replace + their replacements."""
+def _get_user_arguments():
+    """:class:`argparse.Namespace`: Get the user's arguments for :class:`MoveImports`."""
     _, arguments = rez_batch_process_cli.parse_arguments(sys.argv[1:])
 
-    return rez_move_imports_cli.get_user_namespaces(shlex.split(arguments.move_arguments))
+    return arguments
+
+
+def _get_user_provided_namespaces(arguments):
+    """Find the dot-separated namespaces to replace + their replacements.
+
+    Args:
+        arguments (:class:`argparse.Namespace`): The user's arguments for :class:`MoveImports`.
+
+    Returns:
+        set[tuple[str, str]]: Each namespace to replace and its replacement.
+
+    """
+    return rez_move_imports_cli.get_user_namespaces(
+        shlex.split(arguments.move_arguments)
+    )
 
 
 def _get_packages_which_must_be_changed(paths=None):
     """Get every Rez package that has imports to replace.
 
+    The imports of every package are found using a saved index of
+    every Python file's imports. See :mod:`.namespace_index` for details.
+
     Args:
         paths (list[str], optional):
             The directories to search for Rez package families,
@@ -246,8 +282,12 @@ def _get_packages_which_must_be_changed(paths=None):
 
     """
     packages, invalids, skips = conditional.get_default_latest_packages(paths=paths)
-    user_provided_namespaces = _get_user_provided_namespaces()
+    arguments = _get_user_arguments()
+    user_provided_namespaces = _get_user_provided_namespaces(arguments)
     expected_existing_namespaces = {old for old, _ in user_provided_namespaces}
+    index = namespace_index.NamespaceIndex(
+        arguments.namespace_index or namespace_index.get_default_path()
+    )
     output = []
 
     for package in packages:
@@ -262,7 +302,7 @@ def _get_packages_which_must_be_changed(paths=None):
 
             continue
 
-        if not _needs_replacement(package, expected_existing_namespaces):
+        if not _needs_replacement(package, expected_existing_namespaces, index):
             skips.append(
                 worker.Skip(
                     package,
@@ -275,6 +315,8 @@ def _get_packages_which_must_be_changed(paths=None):
 
         output.append(package)
 
+    index.save()
+
     return output, invalids, skips
 
 
@@ -108,6 +108,11 @@ class Yaml2Py(command.RezShellCommand):
 
         return ""
 
+    @staticmethod
+    def is_thread_safe():
+        """bool: Writing a package.py changes the permissions of its parent folders."""
+        return False
+
     @staticmethod
     def parse_arguments(text):
         """Parse the user-provided text into something that this class understands.
@@ -158,6 +163,7 @@ class Yaml2Py(command.RezShellCommand):
             cached_users=arguments.cached_users,
             fallback_reviewers=arguments.fallback_reviewers,
             base_url=arguments.base_url,
+            adapter=arguments.git_adapter,
         )
 
         _LOGGER.info('Pull request posted for "%s".', package.name)
@@ -0,0 +1,323 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Build and test several source Rez packages at the same time.
+
+Each Rez package is built into its own, temporary install path and then
+its rez-tests are run. Every package is validated in a separate process
+so that builds and tests (which often change the current directory)
+can't interfere with each other. The install path is deleted once the
+package is validated.
+
+Processes of a :class:`multiprocessing.Pool`, such as the ones made by
+``rez_batch_process run --jobs``, may not start processes of their own.
+From there, each package is validated by running this module as a new
+Python process, instead. Those processes share the limit of
+:mod:`rez_batch_process.core.subprocess_pool` with every other ``--jobs`` process.
+
+"""
+
+import argparse
+import collections
+import json
+import logging
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+from multiprocessing import pool as pool_
+
+import six
+from python_compatibility import wrapping
+from rez import package_test, packages_
+from rez_batch_process.core import subprocess_pool
+from rez_utilities import creator
+from six.moves import shlex_quote
+
+NOT_RUN = "Not run"
+Result = collections.namedtuple("Result", "build test")
+_LOGGER = logging.getLogger(__name__)
+
+
+def _run_rez_test(package, paths=None):
+    """Run every rez-test of a Rez package, stopping at the first failure.
+
+    Args:
+        package (:class:`rez.developer_package.DeveloperPackage`):
+            The Rez package whose tests will be run.
+        paths (list[str], optional):
+            All paths to search for Rez packages. Default is
+            :attr:`rez.config.packages_path`.
+
+    Returns:
+        str: A description of how the tests went. e.g. "Succeeded".
+
+    """
+    # `package_request` is given an empty string and later defined, below
+    runner = package_test.PackageTestRunner(
+        package_request="", package_paths=paths, verbose=True,
+    )
+    runner.package = package
+
+    # TODO : Once this issue is merged and closed, this may need to account for "run_on"
+    #
+    # Reference: https://github.com/nerdvegas/rez/issues/665
+    #
+    tests = runner.get_test_names()
+
+    if not tests:
+        uri = runner.get_package().uri
+        _LOGGER.warning('No tests found "%s".', uri)
+
+        return "No tests were found"
+
+    status = "Succeeded"
+
+    for name in tests:
+        test_status = runner.run_test(name)
+
+        if test_status:
+            status = "Has fails"
+
+            break  # No need to keep testing since we know there's at least one failure
+
+    return status
+
+
+def _to_results(results):
+    """Convert the output of :func:`_validate` into the output of :func:`validate`.
+
+    Args:
+        results (list[tuple[str, bool, str]]):
+            Each package root, if the package built, and how its tests went.
+
+    Returns:
+        :class:`collections.OrderedDict` [str, :attr:`Result`]:
+            Each package root, in the order given, and its results.
+
+    """
+    return collections.OrderedDict(
+        (root, Result(build, test)) for root, build, test in results
+    )
+
+
+def _validate(item):
+    """Build a source Rez package into a temporary folder and then test it.
+
+    Args:
+        item (tuple[str, list[str] or NoneType]):
+            The root folder of a source Rez package and the paths to
+            search for its dependencies.
+
+    Returns:
+        tuple[str, bool, str]:
+            The given root, if the package built, and how its tests went.
+
+    """
+    root, paths = item
+    package = packages_.get_developer_package(root)
+    install_path = tempfile.mkdtemp(suffix="_validation_install_path")
+
+    try:
+        try:
+            creator.build(package, install_path, packages_path=paths)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception('Package "%s" failed to build.', root)
+            build = False
+        else:
+            build = True
+
+        return root, build, run_test(package, paths=paths)
+    finally:
+        shutil.rmtree(install_path, ignore_errors=True)
+
+
+def _validate_in_subprocess(item):
+    """Run :func:`_validate` in a new Python process, which calls this module.
+
+    Args:
+        item (tuple[str, list[str] or NoneType]):
+            The root folder of a source Rez package and the paths to
+            search for its dependencies.
+
+    Returns:
+        tuple[str, bool, str]:
+            The given root, if the package built, and how its tests went.
+
+    """
+    root, paths = item
+    handle, output = tempfile.mkstemp(suffix="_validation.json")
+    os.close(handle)
+    parts = [sys.executable, "-m", __name__, root, "--output", output]
+
+    if paths:
+        parts.append("--paths")
+        parts.extend(paths)
+
+    try:
+        result = subprocess_pool.get_pool().run(
+            " ".join(shlex_quote(part) for part in parts)
+        )
+
+        try:
+            with open(output, "r") as handler:
+                build, test = json.load(handler)
+        except ValueError:
+            _LOGGER.error(
+                'Package "%s" could not be validated. Return code "%s", error "%s".',
+                root,
+                result.returncode,
+                result.stderr,
+            )
+
+            return root, False, NOT_RUN
+    finally:
+        os.remove(output)
+
+    return root, build, test
+
+
+def get_matrix(results):
+    """Describe the build / test results of many Rez packages as a table.
+
+    Args:
+        results (dict[str, :attr:`Result`]): Each package root and its results.
+
+    Returns:
+        str: The generated table, one package per line.
+
+    """
+    rows = [("Package", "Builds", "Tests")]
+    rows.extend(
+        (root, str(result.build), result.test) for root, result in results.items()
+    )
+    widths = [max(len(row[index]) for row in rows) for index in range(3)]
+
+    return "\n".join(
+        "  ".join(text.ljust(width) for text, width in zip(row, widths)).rstrip()
+        for row in rows
+    )
+
+
+def run_test(package, paths=None):
+    """Run every rez-test of a Rez package, from within the package's folder.
+
+    Args:
+        package (:class:`rez.developer_package.DeveloperPackage`):
+            The Rez package whose tests will be run.
+        paths (list[str], optional):
+            All paths to search for Rez packages. Default is
+            :attr:`rez.config.packages_path`.
+
+    Returns:
+        str: A description of how the tests went. e.g. "Succeeded".
+
+    """
+    with wrapping.keep_cwd(os.getcwd()):
+        # Many Rez tests are run assuming that the user is cd'ed
+        # into the Rez package so we need to change directory here.
+        #
+        return _run_rez_test(package, paths=paths)
+
+
+def _get_paths(paths):
+    """Split `paths` into separate paths, if it's a single string.
+
+    Args:
+        paths (str or list[str] or NoneType):
+            Some paths to search for Rez packages. A string may contain
+            several paths, separated by :attr:`os.pathsep`.
+
+    Returns:
+        list[str] or NoneType: Every path or None, if there are no paths.
+
+    """
+    if not paths:
+        return None
+
+    if isinstance(paths, six.string_types):
+        return paths.split(os.pathsep)
+
+    return list(paths)
+
+
+def validate(roots, paths=None, jobs=0):
+    """Build and test several source Rez packages, each in a separate process.
+
+    Args:
+        roots (list[str]):
+            The root folder of every source Rez package to validate.
+        paths (str or list[str], optional):
+            All paths to search for Rez packages. A string may contain
+            several paths, separated by :attr:`os.pathsep`. Default is
+            :attr:`rez.config.packages_path`.
+        jobs (int, optional):
+            The number of packages to validate at the same time. If
+            the value is less than 1, every CPU is used. Default: 0.
+
+    Returns:
+        :class:`collections.OrderedDict` [str, :attr:`Result`]:
+            Each package root, in the order given, and its results.
+
+    """
+    if jobs < 1:
+        jobs = multiprocessing.cpu_count()
+
+    jobs = max(1, min(jobs, len(roots)))
+    paths = _get_paths(paths)
+    items = [(root, paths) for root in roots]
+
+    if multiprocessing.current_process().daemon:
+        # Processes of a :class:`multiprocessing.Pool` may not start
+        # processes so each package is validated by a new Python process.
+        # Threads are enough to wait for them.
+        #
+        pool = pool_.ThreadPool(processes=jobs)
+        function = _validate_in_subprocess
+    elif jobs < 2:
+        return _to_results([_validate(item) for item in items])
+    else:
+        pool = multiprocessing.Pool(processes=jobs)
+        function = _validate
+
+    try:
+        results = pool.map(function, items)
+    except BaseException:
+        pool.terminate()
+
+        raise
+    else:
+        pool.close()
+    finally:
+        pool.join()
+
+    return _to_results(results)
+
+
+def _main(text):
+    """Validate one Rez package and write its results to a JSON file.
+
+    This is called by :func:`_validate_in_subprocess`.
+
+    Args:
+        text (list[str]): The package root, output file, and paths to search for Rez packages.
+
+    """
+    parser = argparse.ArgumentParser(description="Build and test a Rez package.")
+    parser.add_argument("root", help="The folder of the source Rez package.")
+    parser.add_argument(
+        "--output", required=True, help="The JSON file to write results to."
+    )
+    parser.add_argument(
+        "--paths", nargs="*", help="The paths to search for Rez packages."
+    )
+    arguments = parser.parse_args(text)
+    _, build, test = _validate((arguments.root, arguments.paths or None))
+
+    with open(arguments.output, "w") as handler:
+        json.dump([build, test], handler)
+
+
+if __name__ == "__main__":
+    _main(sys.argv[1:])
@@ -0,0 +1,181 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Make sure that :mod:`.bump` validates every Rez package of a bump before and after."""
+
+import os
+import tempfile
+
+import git
+from python_compatibility.testing import common
+from rez_batch_plugins.plugins import bump
+from rez_batch_process.core import rez_git
+from six.moves import mock
+
+
+class _Package(object):  # pylint: disable=too-few-public-methods
+    """A fake Rez package which only knows its folder."""
+
+    def __init__(self, root):
+        """Keep track of the package's folder."""
+        super(_Package, self).__init__()
+
+        self.root = root
+        self.name = os.path.basename(root)
+
+
+def _make_repository(root, names):
+    """Commit a Rez package for each of `names` into a new git repository at `root`."""
+    repository = git.Repo.init(root)
+
+    for name in names:
+        os.makedirs(os.path.join(root, name))
+
+        with open(os.path.join(root, name, "package.py"), "w") as handler:
+            handler.write('name = "{name}"'.format(name=name))
+
+        repository.index.add([name + "/package.py"])
+
+    repository.index.commit("Added packages")
+
+    return repository
+
+
+class CopyPackage(common.Common):
+    """Check :func:`.bump._copy_package`."""
+
+    def setUp(self):
+        """Find Rez package folders from the fake packages."""
+        super(CopyPackage, self).setUp()
+
+        rez_git.clear_caches()
+
+        patcher = mock.patch.object(
+            bump.finder, "get_package_root", side_effect=lambda package: package.root
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_relative_paths(self):
+        """Copy the whole repository so that paths outside of the package still work."""
+        root = tempfile.mkdtemp(suffix="_bump_repository")
+        self.delete_item_later(root)
+        os.makedirs(os.path.join(root, "shared"))
+        os.makedirs(os.path.join(root, "foo"))
+
+        with open(os.path.join(root, "shared", "rezbuild.py"), "w") as handler:
+            handler.write("print('built')")
+
+        with open(os.path.join(root, "foo", "package.py"), "w") as handler:
+            handler.write('name = "foo"')
+
+        os.symlink(
+            os.path.join(os.pardir, "shared", "rezbuild.py"),
+            os.path.join(root, "foo", "rezbuild.py"),
+        )
+        repository = git.Repo.init(root)
+        repository.index.add(
+            ["shared/rezbuild.py", "foo/package.py", "foo/rezbuild.py"]
+        )
+        repository.index.commit("Added foo")
+
+        directory, copy = bump._copy_package(  # pylint: disable=protected-access
+            _Package(os.path.join(root, "foo"))
+        )
+        self.delete_item_later(directory)
+
+        self.assertEqual(os.path.join(directory, "foo"), copy)
+        self.assertTrue(os.path.islink(os.path.join(copy, "rezbuild.py")))
+
+        with open(os.path.join(copy, "rezbuild.py"), "r") as handler:
+            self.assertEqual("print('built')", handler.read())
+
+    def test_not_in_repository(self):
+        """Copy only the package's folder if it isn't in a git repository."""
+        root = tempfile.mkdtemp(suffix="_bump_package")
+        self.delete_item_later(root)
+
+        with open(os.path.join(root, "package.py"), "w") as handler:
+            handler.write('name = "foo"')
+
+        with mock.patch.object(
+            bump.rez_git,
+            "get_repository",
+            side_effect=bump.exceptions.NoGitRepository(None, root, "No repository."),
+        ):
+            directory, copy = bump._copy_package(  # pylint: disable=protected-access
+                _Package(root)
+            )
+
+        self.delete_item_later(directory)
+
+        self.assertTrue(os.path.isfile(os.path.join(copy, "package.py")))
+
+
+class Prepare(common.Common):
+    """Check :meth:`.bump.Bump.prepare`."""
+
+    def setUp(self):
+        """Find Rez package folders from the fake packages."""
+        super(Prepare, self).setUp()
+
+        rez_git.clear_caches()
+        self.addCleanup(bump._VALIDATIONS.clear)  # pylint: disable=protected-access
+
+        patcher = mock.patch.object(
+            bump.finder, "get_package_root", side_effect=lambda package: package.root
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_whole_bump(self):
+        """Validate every package of the bump at once, before any package runs."""
+
+        def _bump(package, *_):
+            if package.name == "bad":
+                raise RuntimeError("Bump failed.")
+
+            return package
+
+        def _validate(roots, paths=None):
+            calls.append((roots, paths))
+
+            return {root: bump.validation.Result(True, "Succeeded") for root in roots}
+
+        root = tempfile.mkdtemp(suffix="_bump_repository")
+        self.delete_item_later(root)
+        _make_repository(root, ["bad", "good"])
+        packages = [_Package(os.path.join(root, name)) for name in ["bad", "good"]]
+        arguments = mock.MagicMock(additional_paths="", new="minor", packages=[])
+        calls = []
+
+        with mock.patch.object(
+            bump.Bump, "_bump", side_effect=_bump
+        ), mock.patch.object(
+            bump.packages_, "get_developer_package", side_effect=_Package
+        ), mock.patch.object(
+            bump.validation, "validate", side_effect=_validate
+        ):
+            bump.Bump.prepare(
+                lambda function: [function(package) for package in packages], arguments,
+            )
+            run = (
+                bump.Bump._run_command_with_results
+            )  # pylint: disable=protected-access
+            error, results = run(packages[1], arguments)
+
+        self.assertEqual(1, len(calls))
+        self.assertEqual(3, len(calls[0][0]))
+        self.assertEqual("", error)
+        self.assertEqual(
+            bump._Results(  # pylint: disable=protected-access
+                True, "Succeeded", True, "Succeeded"
+            ),
+            results,
+        )
+        self.assertEqual(
+            bump._Results(  # pylint: disable=protected-access
+                True, "Succeeded", bump.validation.NOT_RUN, bump.validation.NOT_RUN
+            ),
+            bump._VALIDATIONS["bad"],  # pylint: disable=protected-access
+        )
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Make sure that :mod:`.dependency_index` finds downstream Rez packages."""
+
+import os
+import tempfile
+import textwrap
+import time
+
+from python_compatibility.testing import common
+from rez import package_repository, package_search
+from rez.exceptions import PackageFamilyNotFoundError
+from rez_batch_plugins import dependency_index
+from six.moves import mock
+
+
+class GetIndex(common.Common):
+    """Find the Rez package families which require another family."""
+
+    def setUp(self):
+        """Make a folder of released Rez packages and a folder for the index."""
+        super(GetIndex, self).setUp()
+
+        self._packages = tempfile.mkdtemp(suffix="_dependency_index_packages")
+        self.delete_item_later(self._packages)
+        self._directory = tempfile.mkdtemp(suffix="_dependency_index")
+        self.delete_item_later(self._directory)
+
+        self._make_package("foo", "1.0.0")
+        self._make_package("bar", "1.0.0", requires=["foo-1"])
+        self._make_package("fizz", "1.0.0")
+        self._make_package("fizz", "2.0.0", requires=["bar", "foo-1+<2", "~buzz"])
+
+    def _make_package(self, name, version, requires=None):
+        """Write a released Rez package into the packages folder."""
+        directory = os.path.join(self._packages, name, version)
+        os.makedirs(directory)
+
+        with open(os.path.join(directory, "package.py"), "w") as handler:
+            handler.write(
+                textwrap.dedent(
+                    """\
+                    name = "{name}"
+                    version = "{version}"
+                    requires = {requires!r}
+                    """
+                ).format(name=name, version=version, requires=requires or [])
+            )
+
+    def _get_index(self):
+        """:class:`.DependencyIndex`: Index the packages folder."""
+        return dependency_index.get_index(
+            paths=[self._packages], directory=self._directory
+        )
+
+    def test_consumers(self):
+        """Find the same families as Rez's own reverse dependency search."""
+        index = self._get_index()
+
+        for name in ("foo", "bar", "fizz"):
+            expected, _ = package_search.get_reverse_dependency_tree(
+                name, depth=1, paths=[self._packages]
+            )
+            # The first list is always `name`. The second, if any, is its consumers
+            expected = set(expected[1]) if len(expected) > 1 else set()
+            self.assertEqual(expected, set(index.get_consumers(name)))
+
+        self.assertEqual(
+            {"bar": ["foo-1"], "fizz": ["foo-1+<2"]}, index.get_consumers("foo")
+        )
+
+        with self.assertRaises(PackageFamilyNotFoundError):
+            index.get_consumers("does_not_exist")
+
+    def test_incremental(self):
+        """Only read the families that changed since the index was saved."""
+        self._get_index()
+
+        with mock.patch.object(
+            dependency_index,
+            "_read_family",
+            wraps=dependency_index._read_family,  # pylint: disable=protected-access
+        ) as read_family:
+            self._get_index()
+            self.assertEqual(0, read_family.call_count)
+
+            time.sleep(0.01)  # Make sure the folder gets a new timestamp
+            self._make_package("foo", "1.1.0")
+            self._make_package("buzz", "1.0.0", requires=["foo"])
+            package_repository.package_repository_manager.clear_caches()
+            index = self._get_index()
+
+        self.assertEqual(
+            ["buzz", "foo"],
+            sorted(call[0][1].name for call in read_family.call_args_list),
+        )
+        self.assertEqual("1.1.0", index.get_version("foo"))
+        self.assertEqual({"bar", "buzz", "fizz"}, set(index.get_consumers("foo")))
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Make sure that :mod:`.namespace_index` finds the same imports as :mod:`move_break`."""
+
+import os
+import tempfile
+import textwrap
+
+from move_break import move_break_api
+from python_compatibility.testing import common
+from rez_batch_plugins import namespace_index
+from six.moves import mock
+
+
+class NamespaceIndex(common.Common):
+    """Find the namespaces imported by Python files and Rez packages."""
+
+    def setUp(self):
+        """Make a folder of Python files and a file for the index."""
+        super(NamespaceIndex, self).setUp()
+
+        self._root = tempfile.mkdtemp(suffix="_namespace_index")
+        self.delete_item_later(self._root)
+        self._path = os.path.join(self._root, "index", "namespaces.json")
+
+        self._write(
+            "module.py",
+            """\
+            import os.path
+            import foo.bar as thing
+            from fizz import buzz
+            from fizz.buzz import *
+            from . import sibling
+            from .. import parent_module as other
+
+            def function():
+                import inner.thing
+            """,
+        )
+        self._write("other.py", "import something_else\n")
+
+    def _write(self, name, text):
+        """str: Write a Python file into the test folder and return its path."""
+        path = os.path.join(self._root, name)
+
+        with open(path, "w") as handler:
+            handler.write(textwrap.dedent(text))
+
+        return path
+
+    def test_move_break(self):
+        """Find every namespace that :func:`move_break.move_break_api.get_namespaces` finds."""
+        path = os.path.join(self._root, "module.py")
+        namespaces = namespace_index.NamespaceIndex().get_namespaces(path)
+
+        self.assertEqual(
+            {
+                "fizz.buzz",
+                "foo",
+                "foo.bar",
+                "inner",
+                "inner.thing",
+                "os",
+                "os.path",
+                "parent_module",
+                "sibling",
+            },
+            namespaces,
+        )
+        # move_break also lists the alias of `import foo.bar as thing`
+        self.assertEqual(
+            move_break_api.get_namespaces(path) - {"thing"}, namespaces - {"foo"},
+        )
+
+    def test_find(self):
+        """Find the packages and files which import some namespaces."""
+        index = namespace_index.NamespaceIndex()
+        index.add_package("some_package", self._root)
+
+        self.assertEqual(
+            {("some_package", os.path.join(self._root, "module.py"))},
+            index.find({"foo.bar", "does.not.exist"}),
+        )
+        self.assertEqual(
+            {("some_package", os.path.join(self._root, "other.py"))},
+            index.find({"something_else"}),
+        )
+        self.assertEqual(set(), index.find({"fizz.buzz.nothing"}))
+
+    def test_incremental(self):
+        """Only parse files whose contents changed since the index was saved."""
+        index = namespace_index.NamespaceIndex(self._path)
+        index.add_package("some_package", self._root)
+        index.save()
+
+        self.assertTrue(os.path.isfile(self._path))
+
+        with mock.patch.object(
+            namespace_index,
+            "_parse",
+            wraps=namespace_index._parse,  # pylint: disable=protected-access
+        ) as parse, mock.patch.object(
+            namespace_index.hashlib, "sha1", wraps=namespace_index.hashlib.sha1
+        ) as sha1:
+            index = namespace_index.NamespaceIndex(self._path)
+            index.add_package("some_package", self._root)
+            self.assertEqual(0, parse.call_count)
+            # Unchanged files aren't even read
+            self.assertEqual(0, sha1.call_count)
+
+            path = self._write("other.py", "import another_thing\n")
+            index = namespace_index.NamespaceIndex(self._path)
+            index.add_package("some_package", self._root)
+            self.assertEqual(1, sha1.call_count)
+
+        self.assertEqual([path], [call[0][0] for call in parse.call_args_list])
+        self.assertEqual({("some_package", path)}, index.find({"another_thing"}))
+        self.assertEqual(set(), index.find({"something_else"}))
+
+    def test_is_importing(self):
+        """Check if one added package imports some namespaces."""
+        another = tempfile.mkdtemp(suffix="_another_package")
+        self.delete_item_later(another)
+
+        with open(os.path.join(another, "module.py"), "w") as handler:
+            handler.write("import os\n")
+
+        index = namespace_index.NamespaceIndex()
+        index.add_package("some_package", self._root)
+        index.add_package("another_package", another)
+
+        self.assertTrue(index.is_importing("some_package", {"nope", "fizz.buzz"}))
+        self.assertFalse(index.is_importing("some_package", {"nope"}))
+        self.assertFalse(index.is_importing("another_package", {"fizz.buzz"}))
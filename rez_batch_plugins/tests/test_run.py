@@ -36,6 +36,7 @@ _BumpArguments = collections.namedtuple(
             "cached_users",
             "fallback_reviewers",
             "base_url",
+            "git_adapter",
         ],
     ),
 )
@@ -767,6 +768,7 @@ class Bump(common.Common):
             cached_users="",
             fallback_reviewers=None,
             base_url="",
+            git_adapter="",
         )
 
         with rez_configuration.patch_release_packages_path(release_path):
@@ -813,6 +815,7 @@ class _Arguments(
         self.cached_users = ""
         self.fallback_reviewers = ""
         self.base_url = ""
+        self.git_adapter = ""
         self.arguments = arguments
         self.command = command
         self.exit_on_error = True
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Make sure that :mod:`.validation` builds and tests Rez packages in parallel."""
+
+import os
+import tempfile
+import textwrap
+from multiprocessing import pool as pool_
+
+from python_compatibility.testing import common
+from rez_batch_plugins import validation
+from six.moves import mock
+
+
+def _fake_build(package, install_path, *_, **__):
+    """Pretend to build a Rez package. Packages whose name starts with "bad" fail."""
+    _INSTALL_PATHS.append(install_path)
+
+    if package.name.startswith("bad"):
+        raise RuntimeError("Build failed.")
+
+
+_INSTALL_PATHS = []
+
+
+class Validate(common.Common):
+    """Check the per-package results of :func:`.validation.validate`."""
+
+    def _make_package(self, name):
+        """str: Write a source Rez package and return its folder."""
+        root = tempfile.mkdtemp(suffix="_validation")
+        self.delete_item_later(root)
+
+        with open(os.path.join(root, "package.py"), "w") as handler:
+            handler.write(
+                textwrap.dedent(
+                    """\
+                    name = "{name}"
+                    version = "1.0.0"
+                    """
+                ).format(name=name)
+            )
+
+        return root
+
+    def _test(self, jobs):
+        """Validate a good and a bad package and check their results."""
+        roots = [self._make_package("good"), self._make_package("bad")]
+
+        with mock.patch.object(
+            validation.creator, "build", side_effect=_fake_build
+        ), mock.patch.object(validation, "run_test", return_value="Succeeded"):
+            results = validation.validate(roots, jobs=jobs)
+
+        self.assertEqual(roots, list(results))
+        self.assertEqual(
+            [
+                validation.Result(True, "Succeeded"),
+                validation.Result(False, "Succeeded"),
+            ],
+            list(results.values()),
+        )
+
+        return results
+
+    def test_serial(self):
+        """Validate each package one after another."""
+        self._test(1)
+
+    def test_parallel(self):
+        """Validate every package at once and keep the given order."""
+        results = self._test(2)
+        matrix = validation.get_matrix(results).splitlines()
+
+        self.assertEqual(3, len(matrix))
+        self.assertEqual(["Package", "Builds", "Tests"], matrix[0].split())
+
+    def test_cleanup(self):
+        """Delete the install path of every package once it's validated."""
+        del _INSTALL_PATHS[:]
+        self._test(1)
+
+        self.assertEqual(2, len(_INSTALL_PATHS))
+        self.assertFalse(any(os.path.exists(path) for path in _INSTALL_PATHS))
+
+    def test_subprocess(self):
+        """Validate packages in new Python processes, from a daemonic process."""
+        roots = [self._make_package("good"), self._make_package("another")]
+        expected = validation.validate(roots, jobs=1)
+        pool = pool_.Pool(processes=1)
+
+        try:
+            results = pool.apply(validation.validate, (roots,), {"jobs": 2})
+        finally:
+            pool.close()
+            pool.join()
+
+        self.assertEqual(expected, results)
+
+    def test_paths_string(self):
+        """Split a string of paths, like ``bump --additional-paths`` gives, into each path."""
+        roots = [self._make_package("good")]
+        items = []
+
+        def _validate(item):
+            items.append(item)
+
+            return item[0], True, "Succeeded"
+
+        with mock.patch.object(validation, "_validate", side_effect=_validate):
+            validation.validate(roots, paths=os.pathsep.join(["foo", "bar"]), jobs=1)
+
+        self.assertEqual([(roots[0], ["foo", "bar"])], items)
@@ -6,9 +6,11 @@
 from __future__ import print_function
 
 import argparse
+import collections
 import copy
 import fnmatch
 import functools
+import json
 import logging
 import operator
 import os
@@ -19,14 +21,16 @@ from python_compatibility import imports, wrapping
 from rez.config import config
 from rez_utilities import finder
 
-from .core import cli_constant, registry, worker
-from .core.gitter import github_user
+from .core import cli_constant, journal, registry, result_cache, worker
+from .core.gitter import clone_cache, git_link, github_user
 
+_JSONL_FORMAT = "jsonl"
 _LOGGER = logging.getLogger(__name__)
+_TEXT_FORMAT = "text"
 
 
-def __gather_package_data(arguments):
-    """Use the user-provided CLI arguments to find Rez packages.
+def __iter_package_data(arguments):
+    """Use the user-provided CLI arguments to find Rez packages, one at a time.
 
     Args:
         arguments (:class:`argparse.ArgumentParser`):
@@ -34,8 +38,11 @@ def __gather_package_data(arguments):
             the command to use for searching, and other important
             searching-related details.
 
-    Returns:
-        All of the data needed for the `__report` and `__run` functions.
+    Yields:
+        :attr:`.worker.Classification`:
+            Each package, as soon as the package finder finds it.
+            Packages which still need to be checked are yielded as
+            :attr:`.worker.FOUND`.
 
     """
     ignore_patterns, packages_path, search_packages_path = _resolve_arguments(
@@ -45,23 +52,62 @@ def __gather_package_data(arguments):
     )
     rez_packages = set(arguments.rez_packages)
 
-    package_finder = registry.get_package_finder(arguments.command)
+    package_finder = registry.iter_package_finder(arguments.command)
 
-    found_packages = []
-    packages, invalid_packages, skips = package_finder(
-        paths=packages_path + search_packages_path
-    )
+    for classification in package_finder(paths=packages_path + search_packages_path):
+        if classification.status != worker.FOUND:
+            yield classification
+
+            continue
+
+        package = classification.package
 
-    for package in packages:
         if rez_packages and package.name not in rez_packages:
-            skips.append(package)
+            yield worker.Classification(
+                worker.SKIPPED,
+                package,
+                worker.Skip(
+                    package,
+                    finder.get_package_root(package),
+                    "was not included in --rez-packages.",
+                ),
+            )
+
+            continue
+
+        pattern = _get_ignore_pattern(package, ignore_patterns)
+
+        if pattern:
+            yield worker.Classification(worker.IGNORED, package, pattern)
         else:
-            found_packages.append(package)
+            yield classification
 
-    ignored_packages, other_packages = _split_the_ignored_packages(
-        found_packages, ignore_patterns
-    )
 
+def __gather_package_data(arguments):
+    """Use the user-provided CLI arguments to find Rez packages.
+
+    Args:
+        arguments (:class:`argparse.ArgumentParser`):
+            The packages to ignore, paths to search for packages,
+            the command to use for searching, and other important
+            searching-related details.
+
+    Returns:
+        All of the data needed for the `__run` function.
+
+    """
+    ignored_packages = set()
+    classifications = []
+
+    for classification in __iter_package_data(arguments):
+        if classification.status == worker.IGNORED:
+            ignored_packages.add((classification.package, classification.details))
+        else:
+            classifications.append(classification)
+
+    other_packages, invalid_packages, skips = worker.split_classifications(
+        classifications
+    )
     other_packages = sorted(other_packages, key=operator.attrgetter("name"))
 
     return ignored_packages, other_packages, invalid_packages, skips
@@ -76,6 +122,10 @@ def __report(arguments, _):
     - Packages that were skipped automatically
     - Packages that were ignored explicitly (by the user)
 
+    If the user asked for "jsonl" output, each package is printed as
+    soon as the package finder finds it and it is checked, as one JSON
+    object per line.
+
     Args:
         arguments (:class:`argparse.Namespace`):
             The base user-provided arguments from command-line.
@@ -83,25 +133,33 @@ def __report(arguments, _):
             An un-used argument for this function.
 
     """
-    ignored_packages, other_packages, invalid_packages, skips = __gather_package_data(
-        arguments
-    )
-
-    packages, invalids = worker.report(
-        other_packages,
+    classifications = worker.iter_found_report(
+        __iter_package_data(arguments),
         maximum_repositories=arguments.maximum_repositories,
         maximum_rez_packages=arguments.maximum_rez_packages,
     )
 
-    invalids.extend(invalid_packages)
+    if arguments.format == _JSONL_FORMAT:
+        for classification in classifications:
+            print(json.dumps(_serialize_classification(classification)))
+            sys.stdout.flush()
+
+        sys.exit(0)
 
-    _print_ignored(ignored_packages)
+    found = collections.defaultdict(list)
+
+    for classification in classifications:
+        found[classification.status].append(classification)
+
+    _print_ignored([(item.package, item.details) for item in found[worker.IGNORED]])
     print("\n")
-    _print_skips(skips, arguments.verbose)
+    _print_skips([item.details for item in found[worker.SKIPPED]], arguments.verbose)
     print("\n")
-    _print_invalids(invalids, arguments.verbose)
+    _print_invalids([item.details for item in found[worker.INVALID]], arguments.verbose)
     print("\n")
-    _print_missing(packages, arguments.verbose)
+    _print_missing(
+        [item.package for item in found[worker.NEEDS_RUN]], arguments.verbose
+    )
 
     sys.exit(0)
 
@@ -121,15 +179,33 @@ def __run(arguments, command_arguments):  # pylint: disable=too-many-locals
     )
 
     command = registry.get_command(arguments.command)
-
-    packages, un_ran, invalids = worker.run(
-        functools.partial(command.run, arguments=command_arguments),
-        other_packages,
+    journal_ = _get_journal(arguments)
+    run = functools.partial(
+        worker.run,
+        packages_to_run=other_packages,
         maximum_repositories=arguments.maximum_repositories,
         maximum_rez_packages=arguments.maximum_rez_packages,
         keep_temporary_files=arguments.keep_temporary_files,
         temporary_directory=arguments.temporary_directory,
+        jobs=arguments.jobs,
+        cache=_get_clone_cache(arguments),
+        clone_strategy=arguments.clone_strategy,
+        command_jobs=arguments.command_jobs,
+        command_timeout=arguments.command_timeout,
     )
+    command.prepare(run, command_arguments)
+
+    try:
+        packages, un_ran, invalids = run(
+            functools.partial(command.run, arguments=command_arguments),
+            journal=journal_,
+            result_cache=_get_result_cache(arguments),
+            concurrent_packages=command.is_thread_safe(),
+        )
+    except BaseException:
+        _print_resume(journal_)
+
+        raise
 
     invalids.extend(invalid_packages)
 
@@ -144,6 +220,7 @@ def __run(arguments, command_arguments):  # pylint: disable=too-many-locals
         print(sorted(error.get_package().name for error in bads))
 
     if un_ran:
+        _print_resume(journal_)
         print("These packages could not be run on:")
 
         for package, error in sorted(un_ran, key=_get_package_name):
@@ -161,6 +238,9 @@ def __run(arguments, command_arguments):  # pylint: disable=too-many-locals
         for package in sorted(packages, key=operator.attrgetter("name")):
             print(package.name)
 
+    # Every package finished so there's nothing left to resume
+    journal_.delete()
+
 
 def __make_git_users(arguments):
     """Write a cache of GitHub users to-disk.
@@ -176,6 +256,7 @@ def __make_git_users(arguments):
         base_url=arguments.base_url,
         verify=arguments.ssl_no_verify,
         maximum=arguments.maximum_users,
+        update=arguments.update,
     )
 
     print(
@@ -186,36 +267,46 @@ def __make_git_users(arguments):
     sys.exit(0)
 
 
-def _split_the_ignored_packages(packages, patterns):
-    """Get the "user-ignored" Rez packages.
+def _get_ignore_pattern(package, patterns):
+    """Find the pattern which makes a Rez package "user-ignored", if any.
 
     Args:
-        packages (iter[:class:`rez.packages_.Package`]):
-            The Rez packages that may or may not need to be ignored.
+        package (:class:`rez.packages_.Package`):
+            The Rez package that may or may not need to be ignored.
         patterns (list[str]):
             All glob patterns that are used to find packages to ignore.
             If a Rez package's name matches even one of the strings in
             `patterns` then the package is ignored.
 
     Returns:
-        tuple[set[:class:`rez.packages_.Package`], set[:class:`rez.packages_.Package`]]:
-            The Rez packages to ignore, followed by the Rez packages to
-            not ignore.
+        str: The first matching pattern or an empty string, if `package` isn't ignored.
 
     """
-    ignored = set()
-    non_ignored = set()
+    for pattern in patterns:
+        if fnmatch.fnmatch(package.name, pattern):
+            return pattern
 
-    for package in packages:
-        for pattern in patterns:
-            if fnmatch.fnmatch(package.name, pattern):
-                ignored.add((package, pattern))
+    return ""
 
-                break
-        else:
-            non_ignored.add(package)
 
-    return ignored, non_ignored
+def _get_journal(arguments):
+    """Create a journal for a new run or find the journal of a run to resume.
+
+    Args:
+        arguments (:class:`argparse.Namespace`):
+            The base user-provided arguments from command-line.
+
+    Raises:
+        ValueError: If the user asked to resume a run which has no journal.
+
+    Returns:
+        :class:`.Journal`: The found or created journal.
+
+    """
+    if arguments.resume:
+        return journal.get(arguments.temporary_directory, arguments.resume)
+
+    return journal.create(arguments.temporary_directory)
 
 
 def _resolve_arguments(patterns, packages_path, search_packages_path):
@@ -272,6 +363,42 @@ def _resolve_arguments(patterns, packages_path, search_packages_path):
     return ignore_patterns, packages_path, search_packages_path
 
 
+def _get_clone_cache(arguments):
+    """Get the cache of mirrored git repositories that the user asked for, if any.
+
+    Args:
+        arguments (:class:`argparse.Namespace`):
+            The base user-provided arguments from command-line.
+
+    Returns:
+        :class:`.MirrorCache` or NoneType: The found cache.
+
+    """
+    if not arguments.clone_cache:
+        return None
+
+    return clone_cache.get_cache(
+        arguments.clone_cache, maximum_size=arguments.clone_cache_size * 1024 ** 2
+    )
+
+
+def _get_result_cache(arguments):
+    """Get the cache of unchanged Rez packages that the user asked for, if any.
+
+    Args:
+        arguments (:class:`argparse.Namespace`):
+            The base user-provided arguments from command-line.
+
+    Returns:
+        :class:`.ResultCache` or NoneType: The found cache.
+
+    """
+    if not arguments.result_cache:
+        return None
+
+    return result_cache.ResultCache(arguments.result_cache)
+
+
 def _get_package_name(item):
     """str: Sort a package / error pair by the name of each Rez package."""
     package = item[0]
@@ -279,6 +406,43 @@ def _get_package_name(item):
     return package.name
 
 
+def _serialize_classification(classification):
+    """Convert a checked Rez package into something that can be written as JSON.
+
+    Args:
+        classification (:attr:`.Classification`):
+            The Rez package, whether it is ignored / skipped / invalid
+            / needs to be run, and details about why.
+
+    Returns:
+        dict[str, str]: The package's status, name, version, folder, and details.
+
+    """
+    package = classification.package
+    output = {
+        "name": package.name,
+        "status": classification.status,
+        "version": str(package.version),
+    }
+    details = classification.details
+
+    if classification.status == worker.IGNORED:
+        output["path"] = finder.get_package_root(package)
+        output["pattern"] = details
+    elif classification.status == worker.SKIPPED:
+        output["path"] = details.path
+        output["reason"] = details.reason
+    elif classification.status == worker.INVALID:
+        output["path"] = details.get_path()
+        output["message"] = str(details)
+        output["full_message"] = details.get_full_message()
+    else:
+        output["path"] = finder.get_package_root(package)
+        output["repository"] = details
+
+    return output
+
+
 def _print_ignored(packages):
     """Print every package as "ignored".
 
@@ -372,6 +536,19 @@ def _print_missing(packages, verbose):
         print(line)
 
 
+def _print_resume(journal_):
+    """Tell the user how to continue a run which didn't finish.
+
+    Args:
+        journal_ (:class:`.Journal`): The record of the run.
+
+    """
+    print(
+        'Run "{journal_.run_id}" did not finish. '
+        'Add "--resume {journal_.run_id}" to continue it.'.format(journal_=journal_)
+    )
+
+
 def _print_skips(skips, verbose):
     """Print the Rez packages that were skipped automatically by this tool.
 
@@ -489,6 +666,30 @@ def _add_arguments(parser):
         help="A folder on-disk that will be used to clone git repositories.",
     )
 
+    parser.add_argument(
+        "--clone-cache",
+        help="A folder on-disk where git repositories are mirrored between runs. "
+        "Later runs fetch from the mirror instead of cloning from scratch.",
+    )
+
+    parser.add_argument(
+        "--clone-cache-size",
+        default=clone_cache.DEFAULT_MAXIMUM_SIZE // 1024 ** 2,
+        type=int,
+        help="The number of megabytes that --clone-cache may use. "
+        "Once exceeded, the least-recently used repositories are deleted.",
+    )
+
+    parser.add_argument(
+        "--clone-strategy",
+        choices=git_link.CLONE_STRATEGIES,
+        default=git_link.FULL,
+        help='How much of each git repository to download. "shallow" only gets the '
+        'latest commit. "blobless" downloads file contents lazily. When searching for '
+        'packages, "sparse" only checks out Rez package and Sphinx conf.py files and '
+        '"tree" only checks out the files of the package being searched for.',
+    )
+
 
 def _process_help(text):
     """Check which help message the user actually wants to print out to the shell.
@@ -588,10 +789,54 @@ def parse_arguments(text):
     reporter = sub_parsers.add_parser("report")
     reporter.set_defaults(execute=__report)
     _add_arguments(reporter)
+    reporter.add_argument(
+        "--format",
+        choices=(_TEXT_FORMAT, _JSONL_FORMAT),
+        default=_TEXT_FORMAT,
+        help='How to print the report. "jsonl" prints one JSON object per Rez '
+        "package as soon as the package is checked.",
+    )
 
     runner = sub_parsers.add_parser("run")
     runner.set_defaults(execute=__run)
     _add_arguments(runner)
+    runner.add_argument(
+        "-j",
+        "--jobs",
+        default=1,
+        type=int,
+        help="The number of git repositories to clone and run on at the same time. "
+        "If 0, every CPU is used.",
+    )
+    runner.add_argument(
+        "--command-jobs",
+        default=0,
+        type=int,
+        help="The number of shell commands that may run at the same time, across "
+        "every repository in --jobs. Thread-safe commands also run the Rez "
+        "packages of one repository at the same time. If 0, one command per-CPU "
+        "may run.",
+    )
+    runner.add_argument(
+        "--command-timeout",
+        default=0,
+        type=float,
+        help="The number of seconds that the command may run on one Rez "
+        "package before it is stopped. If 0, it may run forever.",
+    )
+    runner.add_argument(
+        "--result-cache",
+        default="",
+        help="A folder on-disk which remembers every Rez package that the "
+        "command did not change. Re-runs skip those packages until their "
+        "files, the command, or its arguments change.",
+    )
+    runner.add_argument(
+        "--resume",
+        help="The ID of an earlier run which stopped early. "
+        "Rez packages which finished in that run are not run again. "
+        "Use the same --temporary-directory as the earlier run.",
+    )
 
     git_users_command = sub_parsers.add_parser("make-git-users")
     git_users_command.set_defaults(execute=__make_git_users)
@@ -600,7 +845,14 @@ def parse_arguments(text):
         help="The authentication token to the remote git repository (GitHub, bitbucket, etc).",
     )
     git_users_command.add_argument(
-        "path", help="The found users will be written to this JSON file path."
+        "path", help="The found users will be written to this JSON-lines file path."
+    )
+    git_users_command.add_argument(
+        "-u",
+        "--update",
+        action="store_true",
+        help="If path is an existing cache, only download the users which were "
+        "created since it was last written and add them to it.",
     )
     git_users_command.add_argument(
         "-m",
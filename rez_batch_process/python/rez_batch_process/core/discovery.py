@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Find the latest version of every Rez package family quickly.
+
+:func:`rez.packages_.get_latest_package` searches every packages path
+again for every family name. This module scans each packages path
+just once, in parallel, and keeps the latest version of each family
+that it finds along the way.
+
+"""
+
+import logging
+from multiprocessing import pool as multiprocessing_pool
+
+from rez import packages_
+from rez.config import config
+from rez.package_repository import package_repository_manager
+
+_LOGGER = logging.getLogger(__name__)
+_MAXIMUM_THREADS = 8
+
+
+def _scan_repository(repository):
+    """Find the latest version of every package family in one packages path.
+
+    Args:
+        repository (:class:`rez.package_repository.PackageRepository`):
+            A Rez packages path to search through.
+
+    Returns:
+        dict[str, :class:`rez.package_resources.PackageResource` or NoneType]:
+            Each found family name and its latest package. If a family
+            has no packages, its package is None.
+
+    """
+    latest = dict()
+
+    for family in repository.iter_package_families():
+        best = latest.get(family.name)
+
+        for package in repository.iter_packages(family):
+            if best is None or package.version > best.version:
+                best = package
+
+        latest[family.name] = best
+
+    return latest
+
+
+def iter_latest_packages(paths=None, jobs=None):
+    """Get one package, its latest version, from every Rez package family.
+
+    This gives the same packages as
+    :func:`rez_utilities.inspection.iter_latest_packages`. If a package
+    family has the same latest version in several paths, the earliest
+    path wins.
+
+    Args:
+        paths (list[str], optional):
+            The directories to search for Rez package families,
+            Default: :attr:`rez.config.config.packages_path`.
+        jobs (int, optional):
+            The number of paths to scan at the same time. If no number
+            is given, every path is scanned at once, up to 8 paths.
+
+    Yields:
+        :class:`rez.packages_.Package`:
+            The latest version of every package family, sorted by name.
+
+    """
+    paths = paths or config.packages_path  # pylint: disable=no-member
+    repositories = [package_repository_manager.get_repository(path) for path in paths]
+
+    if not jobs:
+        jobs = min(len(repositories), _MAXIMUM_THREADS)
+
+    if jobs > 1:
+        pool = multiprocessing_pool.ThreadPool(jobs)
+
+        try:
+            results = pool.map(_scan_repository, repositories)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        results = [_scan_repository(repository) for repository in repositories]
+
+    latest = dict()
+
+    for result in results:
+        for name, package in result.items():
+            best = latest.get(name)
+
+            if best is None or (package and package.version > best.version):
+                latest[name] = package
+
+    for name in sorted(latest):
+        package = latest[name]
+
+        if not package:
+            _LOGGER.warning(
+                'Package family "%s" was found but it has no packages. '
+                "The package is probably damaged.",
+                name,
+            )
+
+            continue
+
+        yield packages_.Package(package)
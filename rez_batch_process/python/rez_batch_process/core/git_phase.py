@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Hold back the git work of Rez packages until every command of their repository has run.
+
+When a command plug-in is thread-safe, :func:`.worker.run` runs the
+command of every Rez package in a repository at the same time, each in
+its own copy of the repository. The git work of each package (commit,
+push, and pull request) is then done afterwards, one package at a time,
+in order.
+
+Command plug-ins don't need to know which is happening. They call
+:func:`defer` with their git work. If a :class:`Queue` is active, the
+work is saved for later. Otherwise, it is run right away.
+
+"""
+
+import collections
+import threading
+
+from rez_utilities import finder
+
+_ACTIVE = dict()
+
+
+class Queue(object):
+    """The held-back git work of some Rez packages, by package."""
+
+    def __init__(self):
+        """Start with no work."""
+        super(Queue, self).__init__()
+
+        self._functions = collections.defaultdict(list)
+        self._lock = threading.Lock()
+
+    def add(self, package, function):
+        """Save some git work of a Rez package, to run later.
+
+        Args:
+            package (:class:`rez.packages_.Package`): The Rez package which `function` changes.
+            function (callable[] -> object): The git work to run.
+
+        """
+        with self._lock:
+            self._functions[finder.get_package_root(package)].append(function)
+
+    def pop(self, package):
+        """Get and forget the saved git work of a Rez package.
+
+        Args:
+            package (:class:`rez.packages_.Package`): The Rez package to get work for.
+
+        Returns:
+            list[callable[] -> object]: The work, in the order it was added.
+
+        """
+        with self._lock:
+            return self._functions.pop(finder.get_package_root(package), [])
+
+
+def defer(package, function):
+    """Run some git work of a Rez package, or save it for later if a :class:`Queue` is active.
+
+    Args:
+        package (:class:`rez.packages_.Package`): The Rez package which `function` changes.
+        function (callable[] -> object): The git work to run.
+
+    """
+    queue = get_active()
+
+    if queue:
+        queue.add(package, function)
+    else:
+        function()
+
+
+def get_active():
+    """:class:`Queue` or NoneType: Get the queue which git work is saved to, if any."""
+    return _ACTIVE.get("queue")
+
+
+def set_active(queue):
+    """Make `queue` save all git work from now on. Use None to run git work right away."""
+    _ACTIVE["queue"] = queue
@@ -0,0 +1,374 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""A persistent, size-limited cache of bare git repositories.
+
+Cloning is the slowest part of ``rez_batch_process``. Instead of cloning
+every repository from its remote every time, each remote is mirrored
+once into a cache folder. Later runs only need to ``git fetch`` the
+mirror and then make a local clone from it, which is mostly hard-links.
+
+Every mirror has a lock file so that several ``rez_batch_process``
+processes can share one cache folder safely. Each mirror's size is
+saved next to it whenever it changes. Once the cache grows past its
+maximum size, the least-recently used mirrors are deleted.
+
+"""
+
+import contextlib
+import hashlib
+import logging
+import os
+import re
+import shutil
+import time
+
+import git
+from git import exc
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+try:
+    from functools import lru_cache  # python 3
+except ImportError:
+    from backports.functools_lru_cache import lru_cache  # python 2
+
+DEFAULT_MAXIMUM_SIZE = 10 * 1024 ** 3  # 10 GB
+_LOCK_SUFFIX = ".lock"
+_SIZE_SUFFIX = ".size"
+_LOGGER = logging.getLogger(__name__)
+_SCP_EXPRESSION = re.compile(r"^(?:[\w\-.]+@)?(?P<host>[\w\-.]+):(?P<path>[^/].*)$")
+_URL_EXPRESSION = re.compile(
+    r"^(?:[\w+]+://)(?:[^@/]+@)?(?P<host>[^/:]+)(?::\d+)?/(?P<path>.+)$"
+)
+
+
+class MirrorCache(object):
+    """A folder of bare git repositories, which is used to speed up cloning."""
+
+    def __init__(self, root, maximum_size=DEFAULT_MAXIMUM_SIZE):
+        """Keep track of the folder that will contain every mirrored repository.
+
+        Args:
+            root (str):
+                An absolute path to a folder on-disk. It will be created
+                if it does not already exist.
+            maximum_size (int, optional):
+                The number of bytes that the cache may use before old
+                repositories are deleted. Default: 10 GB.
+
+        """
+        super(MirrorCache, self).__init__()
+
+        self._root = root
+        self._maximum_size = maximum_size
+
+    def _get_mirror_directory(self, url):
+        """str: Find the folder where the mirror of `url` lives."""
+        return os.path.join(self._root, get_key(url))
+
+    def _get_entries(self):
+        """Find every mirrored repository in the cache.
+
+        Returns:
+            list[tuple[float, int, str]]:
+                The last time that each mirror was used, its saved size
+                on-disk in bytes, and its folder. The least-recently
+                used mirrors are listed first.
+
+        """
+        entries = []
+
+        for name in os.listdir(self._root):
+            directory = os.path.join(self._root, name)
+
+            if not os.path.isdir(directory):
+                continue
+
+            lock = directory + _LOCK_SUFFIX
+            last_used = os.path.getmtime(lock if os.path.isfile(lock) else directory)
+            entries.append((last_used, _get_saved_size(directory), directory))
+
+        return sorted(entries)
+
+    def _refresh_mirror(self, url):
+        """Create or update the mirror of some git repository.
+
+        The caller must hold the mirror's lock.
+
+        Args:
+            url (str): The website address or file path to a git repository.
+
+        Returns:
+            str: The folder on-disk of the bare, mirrored repository.
+
+        """
+        directory = self._get_mirror_directory(url)
+
+        try:
+            repository = git.Repo(directory)
+        except (exc.InvalidGitRepositoryError, exc.NoSuchPathError):
+            if os.path.isdir(directory):
+                shutil.rmtree(directory)
+
+            _LOGGER.info('Mirroring repository "%s" to "%s".', url, directory)
+            git.Repo.clone_from(url, directory, mirror=True)
+        else:
+            _LOGGER.info('Updating mirrored repository "%s".', directory)
+            repository.git.fetch("--prune", "origin")
+
+        _save_size(directory)
+        # Mark the mirror as recently used
+        os.utime(directory + _LOCK_SUFFIX, (time.time(), time.time()))
+
+        return directory
+
+    @contextlib.contextmanager
+    def _use_mirror(self, url):
+        """Create or update a mirror and keep it locked while it's in use.
+
+        Args:
+            url (str): The website address or file path to a git repository.
+
+        Yields:
+            str: The folder on-disk of the bare, mirrored repository.
+
+        """
+        if not os.path.isdir(self._root):
+            os.makedirs(self._root)
+
+        directory = self._get_mirror_directory(url)
+
+        # The lock is held from the update until the caller is done so
+        # that :meth:`evict`, from another process, can't delete the mirror
+        #
+        with _lock(directory + _LOCK_SUFFIX):
+            yield self._refresh_mirror(url)
+
+        self.evict(keep={directory})
+
+    def clone(self, url, directory):
+        """Clone `url` to `directory`, using the mirror as the source.
+
+        The new repository is a regular clone but it is made from the
+        local mirror so barely anything is downloaded. Its "origin"
+        remote still points to `url` so that pushes and pulls behave as
+        if `url` was cloned directly.
+
+        Args:
+            url (str): The website address or file path to a git repository.
+            directory (str): The folder that will contain the new clone.
+
+        Returns:
+            :class:`git.Repo`: The created repository.
+
+        """
+        with self._use_mirror(url) as mirror:
+            repository = git.Repo.clone_from(mirror, directory)
+
+        repository.remotes.origin.set_url(url)
+
+        return repository
+
+    def evict(self, keep=frozenset()):
+        """Delete the least-recently used mirrors until the cache fits its maximum size.
+
+        Mirrors which are locked by another process are left alone.
+
+        Args:
+            keep (container[str], optional):
+                The folders of mirrors that must not be deleted.
+
+        """
+        entries = self._get_entries()
+        total = sum(size for _, size, _ in entries)
+
+        for _, size, directory in entries:
+            if total <= self._maximum_size:
+                return
+
+            if directory in keep:
+                continue
+
+            with _lock(directory + _LOCK_SUFFIX, blocking=False) as acquired:
+                if not acquired:
+                    continue
+
+                if os.path.isdir(directory):
+                    _LOGGER.info('Removing cached repository "%s".', directory)
+                    shutil.rmtree(directory)
+
+                if os.path.isfile(directory + _SIZE_SUFFIX):
+                    os.remove(directory + _SIZE_SUFFIX)
+
+            total -= size
+
+    def get_mirror(self, url):
+        """Create or update the mirror of some git repository.
+
+        Args:
+            url (str): The website address or file path to a git repository.
+
+        Returns:
+            str: The folder on-disk of the bare, mirrored repository.
+
+        """
+        with self._use_mirror(url) as directory:
+            return directory
+
+    def update(self, repository, url):
+        """Make an existing clone of `url` match the latest commit of its remote.
+
+        Args:
+            repository (:class:`git.Repo`):
+                A clone of `url` which was made by a previous run.
+            url (str):
+                The website address or file path that `repository` was cloned from.
+
+        """
+        branch = repository.active_branch.name
+
+        with self._use_mirror(url) as mirror:
+            repository.git.fetch(
+                mirror, "+refs/heads/*:refs/remotes/origin/*", "--prune"
+            )
+
+        repository.head.reset(
+            "origin/{branch}".format(branch=branch), index=True, working_tree=True
+        )
+        repository.git.clean("-df")
+
+
+def _get_disk_usage(directory):
+    """int: Find the number of bytes of every file in `directory`, recursively."""
+    total = 0
+
+    for root, _, files in os.walk(directory):
+        for name in files:
+            path = os.path.join(root, name)
+
+            if not os.path.islink(path):
+                total += os.path.getsize(path)
+
+    return total
+
+
+def _get_saved_size(directory):
+    """int: Get the size of a mirror, from when it last changed."""
+    try:
+        with open(directory + _SIZE_SUFFIX, "r") as handler:
+            return int(handler.read())
+    except (IOError, OSError, ValueError):
+        # Mirrors from older versions of this module have no saved size
+        return _save_size(directory)
+
+
+@contextlib.contextmanager
+def _lock(path, blocking=True):
+    """Prevent other processes from using a mirror while it is in use.
+
+    Args:
+        path (str): The lock file to create or re-use.
+        blocking (bool, optional):
+            If True, wait for the lock to be released by other
+            processes. If False, give up immediately.
+
+    Yields:
+        bool: If the lock was acquired.
+
+    """
+    with open(path, "a") as handler:
+        if not fcntl:
+            yield True
+
+            return
+
+        flags = fcntl.LOCK_EX
+
+        if not blocking:
+            flags |= fcntl.LOCK_NB
+
+        try:
+            fcntl.flock(handler.fileno(), flags)
+        except (IOError, OSError):
+            yield False
+
+            return
+
+        try:
+            yield True
+        finally:
+            fcntl.flock(handler.fileno(), fcntl.LOCK_UN)
+
+
+def _save_size(directory):
+    """Measure the size of a mirror and save it next to the mirror.
+
+    Args:
+        directory (str): The folder on-disk of some mirrored repository.
+
+    Returns:
+        int: The number of bytes of every file in `directory`.
+
+    """
+    size = _get_disk_usage(directory)
+
+    with open(directory + _SIZE_SUFFIX, "w") as handler:
+        handler.write(str(size))
+
+    return size
+
+
+@lru_cache()
+def get_cache(root, maximum_size=DEFAULT_MAXIMUM_SIZE):
+    """Get a shared :class:`MirrorCache` for some folder.
+
+    Args:
+        root (str):
+            An absolute path to a folder on-disk which contains mirrored repositories.
+        maximum_size (int, optional):
+            The number of bytes that the cache may use before old
+            repositories are deleted. Default: 10 GB.
+
+    Returns:
+        :class:`MirrorCache`: The found or created cache.
+
+    """
+    return MirrorCache(os.path.abspath(root), maximum_size=maximum_size)
+
+
+def get_key(url):
+    """Convert a remote URL into a name which is unique to its repository.
+
+    Different spellings of the same remote, such as
+    "git@github.com:foo/bar.git" and "https://github.com/foo/bar", get
+    the same key.
+
+    Args:
+        url (str): The website address or file path to a git repository.
+
+    Returns:
+        str: A folder-friendly name for the repository.
+
+    """
+    match = _URL_EXPRESSION.match(url) or _SCP_EXPRESSION.match(url)
+
+    if match and not os.path.exists(url):
+        normalized = "{host}/{path}".format(
+            host=match.group("host").lower(), path=match.group("path")
+        )
+    else:
+        normalized = os.path.normcase(os.path.abspath(url))
+
+    normalized = normalized.rstrip("/")
+
+    if normalized.endswith(".git"):
+        normalized = normalized[: -len(".git")]
+
+    name = re.sub(r"[^\w\-.]+", "_", normalized.split("/")[-1])
+    digest = hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:12]
+
+    return "{name}_{digest}".format(name=name, digest=digest)
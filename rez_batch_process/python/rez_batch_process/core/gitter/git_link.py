@@ -7,8 +7,8 @@ Searching for documentation in a Rez package is somewhat complex
 because it's not guaranteed that a built package will come with its
 documentation. Most of the time, it's in the source Rez package.
 
-To actually search for the conf.py file(s), we **clone the repository
-and search it as files, using Python**.
+To actually search for the conf.py file(s), we **clone the repository,
+list its files using git, and only check out the files that we need**.
 
 Important:
     All of the repositories that are cloned will be auto-cleaned by the
@@ -23,8 +23,10 @@ Reference:
 from __future__ import print_function
 
 import atexit
+import hashlib
 import logging
 import os
+import posixpath
 import shutil
 import tempfile
 
@@ -38,6 +40,14 @@ try:
 except ImportError:
     from backports.functools_lru_cache import lru_cache  # python 2
 
+FULL = "full"
+SHALLOW = "shallow"
+BLOBLESS = "blobless"
+SPARSE = "sparse"
+TREE = "tree"
+CLONE_STRATEGIES = (FULL, SHALLOW, BLOBLESS, SPARSE, TREE)
+
+_CHECKOUT_CHUNK_SIZE = 200  # Keeps `git checkout` below command-line length limits
 _DIRECTORIES_TO_DELETE = set()
 _LOGGER = logging.getLogger(__name__)
 _REPOSITORIES = dict()
@@ -57,7 +67,7 @@ class _ProgressBar(git.remote.RemoteProgress):
 
 
 @lru_cache(maxsize=None)
-def _get_repository(url, directory="", keep=False):
+def _get_repository(url, directory="", keep=False, cache=None, strategy=FULL):
     """Get a cached git repository or clone one, if it does not exist.
 
     Args:
@@ -72,6 +82,12 @@ def _get_repository(url, directory="", keep=False):
         keep (bool, optional):
             If False, delete temporary directories once they are no
             If longer needed. True, don't delete them. Default is False.
+        cache (:class:`.MirrorCache`, optional):
+            If included, `url` is cloned from a local mirror of the
+            repository instead of from `url` directly. Default is None.
+        strategy (str, optional):
+            How much of `url` to download. See :func:`clone` for
+            details. This is ignored if `cache` is given. Default: :attr:`FULL`.
 
     Returns:
         :class:`git.Repo`: The created repository instance.
@@ -94,12 +110,21 @@ def _get_repository(url, directory="", keep=False):
     if not os.path.isdir(directory):
         os.makedirs(directory)
         _LOGGER.info('Now cloning repository "%s" to "%s".', url, directory)
-        # TODO : Add thing to make this more quiet
-        git_repository = git.Repo.clone_from(url, directory, _ProgressBar())
+
+        if cache:
+            git_repository = cache.clone(url, directory)
+        else:
+            # TODO : Add thing to make this more quiet
+            git_repository = clone(
+                url, directory, strategy=strategy, progress=_ProgressBar()
+            )
     else:
         _LOGGER.info('Re-using repository located at "%s".', directory)
         git_repository = git.Repo(directory)
 
+        if cache:
+            cache.update(git_repository, url)
+
     if not keep:
         add_directory_to_delete(directory)
 
@@ -114,24 +139,17 @@ def _delete_temporary_repositories():
         shutil.rmtree(folder)
 
 
-@lru_cache(maxsize=None)
-def _iter_package_files(directory):
-    """Find every Rez package file starting from a folder.
-
-    Args:
-        directory (str): The absolute path that will be used to search for Rez packages.
-
-    Yields:
-        str: The full path to any matching Rez package file.
+def _is_inside(path, directory):
+    """bool: Check if a relative, "/"-separated `path` is inside of `directory`."""
+    if not directory:
+        return True
 
-    """
-    for root, _, files in os.walk(directory):
-        for path in files:
-            if path in rez_configuration.REZ_PACKAGE_NAMES:
-                yield os.path.join(root, path)
+    return path.startswith(directory.rstrip("/") + "/")
 
 
-def has_package_conf(repository, package, directory="", keep=False):
+def has_package_conf(  # pylint: disable=too-many-arguments
+    repository, package, directory="", keep=False, cache=None, strategy=FULL
+):
     """Check if there is a Sphinx conf.py inside of a Rez package.
 
     Args:
@@ -149,20 +167,177 @@ def has_package_conf(repository, package, directory="", keep=False):
         keep (bool, optional):
             If False, delete temporary directories once they are no
             If longer needed. True, don't delete them. Default is False.
+        cache (:class:`.MirrorCache`, optional):
+            If included, `repository` is cloned from a local mirror
+            instead of from `repository` directly. Default is None.
+        strategy (str, optional):
+            How much of `repository` to download. Because only Rez
+            package files and Sphinx conf.py files are needed,
+            :attr:`SPARSE` is usually the fastest option. See
+            :func:`clone` for details. Default: :attr:`FULL`.
 
     Returns:
         bool: If a conf.py was found.
 
     """
-    repository = _get_repository(repository, directory=directory, keep=keep)
+    repository = _get_repository(
+        repository, directory=directory, keep=keep, cache=cache, strategy=strategy
+    )
+    paths = list(iter_tree_files(repository, rez_configuration.REZ_PACKAGE_NAMES))
+    materialize(repository, paths)
+
+    for path in paths:
+        relative_root = posixpath.dirname(path)
+        root = os.path.normpath(os.path.join(repository.working_dir, relative_root))
+        name = packages_.get_developer_package(root).name
+
+        if name != package:
+            continue
+
+        materialize(
+            repository,
+            [
+                conf
+                for conf in iter_tree_files(repository, {conf_manager.SETTINGS_FILE})
+                if _is_inside(conf, relative_root)
+            ],
+        )
+
+        return bool(conf_manager.get_conf_file(root))
 
-    for path in _iter_package_files(repository.working_dir):
-        name = packages_.get_developer_package(os.path.dirname(path)).name
+    return False
 
-        if name == package:
-            return bool(conf_manager.get_conf_file(os.path.dirname(path)))
 
-    return False
+def clone(url, directory, strategy=FULL, progress=None):
+    """Clone a git repository, downloading only as much as `strategy` needs.
+
+    The strategies are
+
+    - :attr:`FULL` - A regular ``git clone``.
+    - :attr:`SHALLOW` - Only the latest commit, using ``--depth 1``.
+    - :attr:`BLOBLESS` - Every commit but file contents are only
+      downloaded once they are needed, using ``--filter=blob:none``.
+    - :attr:`SPARSE` - A blobless clone which only checks out Rez
+      package files and Sphinx conf.py files. See :func:`get_sparse_patterns`.
+    - :attr:`TREE` - A blobless clone which checks out nothing. Use
+      :func:`iter_tree_files` and :func:`materialize` to get files.
+
+    If the remote doesn't support ``--filter``, git falls back to
+    downloading everything.
+
+    Args:
+        url (str): The website address or file path to a git repository.
+        directory (str): The folder that will contain the new clone.
+        strategy (str, optional): One of :attr:`CLONE_STRATEGIES`. Default: :attr:`FULL`.
+        progress (:class:`git.remote.RemoteProgress`, optional):
+            An object which reports the cloning progress. Default is None.
+
+    Raises:
+        ValueError: If `strategy` is unknown.
+
+    Returns:
+        :class:`git.Repo`: The created repository.
+
+    """
+    if strategy == FULL:
+        return git.Repo.clone_from(url, directory, progress)
+
+    if strategy == SHALLOW:
+        return git.Repo.clone_from(url, directory, progress, depth=1)
+
+    if strategy == BLOBLESS:
+        return git.Repo.clone_from(url, directory, progress, filter="blob:none")
+
+    if strategy == TREE:
+        return git.Repo.clone_from(
+            url, directory, progress, filter="blob:none", no_checkout=True
+        )
+
+    if strategy != SPARSE:
+        raise ValueError(
+            'Strategy "{strategy}" is unknown. Options were "{options}".'.format(
+                strategy=strategy, options=CLONE_STRATEGIES
+            )
+        )
+
+    repository = git.Repo.clone_from(
+        url, directory, progress, filter="blob:none", no_checkout=True
+    )
+    repository.git.config("core.sparseCheckout", "true")
+    information = os.path.join(repository.git_dir, "info")
+
+    if not os.path.isdir(information):
+        os.makedirs(information)
+
+    with open(os.path.join(information, "sparse-checkout"), "w") as handler:
+        handler.write("\n".join(get_sparse_patterns()) + "\n")
+
+    repository.git.read_tree("-mu", "HEAD")
+
+    return repository
+
+
+def iter_tree_files(repository, names, treeish="HEAD"):
+    """Find files by-name, using git's tree objects instead of the working tree.
+
+    This works even if nothing in `repository` has been checked out.
+
+    Args:
+        repository (:class:`git.Repo`):
+            Some git repository to search within.
+        names (container[str]):
+            The file names to look for. e.g. {"package.py"}.
+        treeish (str, optional):
+            The commit / tree to search. Default: "HEAD".
+
+    Yields:
+        str: Each "/"-separated path, relative to the root of `repository`.
+
+    """
+    for path in repository.git.ls_tree("-r", "-z", "--name-only", treeish).split("\0"):
+        if path and posixpath.basename(path) in names:
+            yield path
+
+
+def materialize(repository, paths, treeish="HEAD"):
+    """Write files from git onto disk, if they aren't on-disk already.
+
+    If `repository` is a blobless clone, only the contents of `paths`
+    are downloaded.
+
+    Args:
+        repository (:class:`git.Repo`):
+            Some git repository which contains `paths`.
+        paths (iter[str]):
+            "/"-separated paths, relative to the root of `repository`.
+            e.g. the output of :func:`iter_tree_files`.
+        treeish (str, optional):
+            The commit / tree to get the files from. Default: "HEAD".
+
+    """
+    missing = [
+        path
+        for path in paths
+        if not os.path.isfile(os.path.join(repository.working_dir, path))
+    ]
+
+    for index in range(0, len(missing), _CHECKOUT_CHUNK_SIZE):
+        repository.git.checkout(
+            treeish, "--", *missing[index : index + _CHECKOUT_CHUNK_SIZE]
+        )
+
+
+def get_sparse_patterns():
+    """Get the files which :attr:`SPARSE` clones check out.
+
+    These are just enough files to find Rez packages and their Sphinx
+    documentation, in any folder of a repository.
+
+    Returns:
+        list[str]: Every sparse-checkout pattern.
+
+    """
+    return sorted(rez_configuration.REZ_PACKAGE_NAMES) + [conf_manager.SETTINGS_FILE]
 
 
 def add_everything_in_repository(repository):
@@ -197,13 +372,16 @@ def add_directory_to_delete(directory):
 def make_repository_folder(directory, url):
     """Recommend a child directory within `directory` for a git repository to live in.
 
+    The folder name ends with a hash of `url` so that repositories with
+    the same name, from different owners, never share a folder.
+
     Args:
         directory (str): The root URL that will be used to generate a child folder.
         url (str): The website address that contains the git repository name as a suffix.
             e.g. "https://github.com/foo/bar.git" or "https://github.com/foo/bar".
 
     Returns:
-        str: The child folder.
+        str: The child folder. e.g. "{directory}/bar_1a2b3c4d".
 
     """
     # Remove any trailing slashes
@@ -220,7 +398,9 @@ def make_repository_folder(directory, url):
 
     # name = "bar"
 
-    return os.path.join(directory, name)
+    suffix = hashlib.sha1(url.encode("utf-8")).hexdigest()[:8]
+
+    return os.path.join(directory, "{name}_{suffix}".format(name=name, suffix=suffix))
 
 
 atexit.register(_delete_temporary_repositories)
@@ -3,13 +3,25 @@
 
 """A module that lets the user control how pull requests are submitted for git repositories."""
 
-from . import github_link
+import collections
 
-_ADAPTERS = [github_link.GithubAdapter]
+from . import github_link, github_rest
 
+_ADAPTERS = collections.OrderedDict(
+    (
+        ("github", github_link.GithubAdapter),
+        ("github_rest", github_rest.GithubRestAdapter),
+    )
+)
 
-def get_remote_adapter(
-    package, url, token, fallback_reviewers=None, base_url="", verify=True
+
+def get_adapter_names():
+    """list[str]: The names of every adapter which can be chosen by the user."""
+    return list(_ADAPTERS.keys())
+
+
+def get_remote_adapter(  # pylint: disable=too-many-arguments
+    package, url, token, fallback_reviewers=None, base_url="", verify=True, name=""
 ):
     """Find a class that should create pull requests for the given package + URL.
 
@@ -36,6 +48,9 @@ def get_remote_adapter(
             If True, require a valid SSL certificate in private If
             networks. If False, accept all external SSL certificates.
             Default is True.
+        name (str, optional):
+            The adapter to use, from :func:`get_adapter_names`. If no
+            name is given, the first adapter which supports `url` is used.
 
     Returns:
         :class:`.BaseAdapter` or NoneType: The found class, if any.
@@ -44,7 +59,10 @@ def get_remote_adapter(
     if not fallback_reviewers:
         fallback_reviewers = []
 
-    for adapter in _ADAPTERS:
+    for name_, adapter in _ADAPTERS.items():
+        if name and name_ != name:
+            continue
+
         if adapter.is_valid_url(url):
             return adapter(
                 package,
@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Answer "does this folder have changes?" for many folders, using one ``git status``.
+
+Running ``git status -- <folder>`` once per Rez package starts a new git
+process each time, all of which read the same git index. Instead,
+:class:`StatusOracle` runs ``git status --porcelain -z`` once for the
+whole repository, stores every changed path in a trie, and answers each
+folder from memory. Whenever files are written, the oracle must be
+invalidated so that the next question runs ``git status`` again.
+
+"""
+
+import logging
+import posixpath
+import threading
+
+_CHANGED = object()
+_LOGGER = logging.getLogger(__name__)
+_ORACLES = dict()
+_ORACLES_LOCK = threading.Lock()
+_RENAME_STATUSES = frozenset(("R", "C"))
+
+
+class StatusOracle(object):
+    """The uncommitted and untracked changes of one git repository."""
+
+    def __init__(self, repository):
+        """Keep track of a git repository to check for changes.
+
+        Args:
+            repository (:class:`git.Repo`): A git repository on-disk.
+
+        """
+        super(StatusOracle, self).__init__()
+
+        self._repository = repository
+        self._lock = threading.Lock()
+        self._trie = None
+
+    def _get_trie(self):
+        """dict[str, dict]: Get every changed path, running ``git status`` if needed."""
+        with self._lock:
+            if self._trie is None:
+                output = self._repository.git.execute(
+                    ["git", "status", "--porcelain", "-z"]
+                )
+                self._trie = _make_trie(_iter_changed_paths(output))
+
+            return self._trie
+
+    def has_changes(self, path):
+        """Check if a folder or file has any uncommitted or untracked changes.
+
+        Args:
+            path (str):
+                A path, relative to the root of the repository. Use
+                :attr:`os.curdir` to check the whole repository.
+
+        Returns:
+            bool: If `path` or anything inside of it has changes.
+
+        """
+        node = self._get_trie()
+        path = posixpath.normpath(path.replace("\\", "/"))
+
+        if path == posixpath.curdir:
+            return bool(node)
+
+        for part in path.split("/"):
+            if _CHANGED in node:
+                # A parent folder is reported as a whole. e.g. it's untracked
+                return True
+
+            if part not in node:
+                return False
+
+            node = node[part]
+
+        return bool(node)
+
+    def invalidate(self):
+        """Forget every found change. Call this whenever files are written."""
+        with self._lock:
+            self._trie = None
+
+    def set_clean(self):
+        """Remember that the repository has no changes, e.g. just after a hard reset."""
+        with self._lock:
+            self._trie = dict()
+
+
+def _iter_changed_paths(output):
+    """Parse the paths from the output of ``git status --porcelain -z``.
+
+    Args:
+        output (str): The raw text which ``git status`` printed.
+
+    Yields:
+        str: Each path that has changes. Renamed files yield both paths.
+
+    """
+    entries = iter(output.split("\0"))
+
+    for entry in entries:
+        if not entry:
+            continue
+
+        status = entry[:2]
+        yield entry[3:]
+
+        if _RENAME_STATUSES.intersection(status):
+            # Renames and copies are followed by their original path
+            yield next(entries, "")
+
+
+def _make_trie(paths):
+    """Convert some paths into nested dictionaries, one dictionary per folder.
+
+    Args:
+        paths (iter[str]): Each path, relative to the root of a git repository.
+
+    Returns:
+        dict[str, dict]:
+            Every path's parts. The last part of each path contains a
+            special marker so that changed folders can be detected.
+
+    """
+    trie = dict()
+
+    for path in paths:
+        path = path.rstrip("/")
+
+        if not path:
+            continue
+
+        node = trie
+
+        for part in path.split("/"):
+            node = node.setdefault(part, dict())
+
+        node[_CHANGED] = True
+
+    return trie
+
+
+def get_oracle(repository):
+    """Get the shared :class:`StatusOracle` of a git repository.
+
+    Args:
+        repository (:class:`git.Repo`): A git repository on-disk.
+
+    Returns:
+        :class:`StatusOracle`: The oracle for `repository`.
+
+    """
+    with _ORACLES_LOCK:
+        oracle = _ORACLES.get(repository.working_dir)
+
+        if not oracle:
+            oracle = StatusOracle(repository)
+            _ORACLES[repository.working_dir] = oracle
+
+        return oracle
+
+
+def invalidate(repository):
+    """Forget every found change of a git repository. Call this whenever files are written.
+
+    Args:
+        repository (:class:`git.Repo`): A git repository on-disk.
+
+    """
+    get_oracle(repository).invalidate()
@@ -5,8 +5,8 @@
 
 import collections
 import itertools
-import json
 import logging
+import os
 import re
 import sys
 import tempfile
@@ -15,7 +15,7 @@ import github
 import github3
 from github3 import exceptions as github3_exceptions
 
-from . import base_adapter
+from . import base_adapter, user_cache
 
 try:
     from functools import lru_cache  # python 3
@@ -46,6 +46,8 @@ _CONVENTIONS = frozenset(
         ),
     )
 )
+_EMAIL_EXPRESSION = re.compile(r"[\w.+\-]+@[\w\-]+(?:\.[\w\-]+)+")
+_GRAM_SIZE = 3
 _LOGGER = logging.getLogger(__name__)
 _ParsedRepository = collections.namedtuple(
     "_ParsedRepository", "protocol base owner name"
@@ -226,12 +228,12 @@ class GithubAdapter(base_adapter.BaseAdapter):
 
         # Add another parameter for an optional assignee, here
         if assignee:
-            try:
-                assignee_ = next(user for user in user_data if user.login == assignee)
-            except StopIteration:
-                _LOGGER.exception('No user could be found for "%s".', assignee)
-            else:
+            assignee_ = user_data.get_login(assignee)
+
+            if assignee_:
                 pull_request.assignees = [assignee_]
+            else:
+                _LOGGER.error('No user could be found for "%s".', assignee)
 
         # This next line adds the reviewers to the already-created-pull
         # request. It's an awkward syntax but oh well.
@@ -239,6 +241,122 @@ class GithubAdapter(base_adapter.BaseAdapter):
         pull_request.create_review_requests(reviewers=reviewers)
 
 
+class UserIndex(object):
+    """A collection of GitHub users which can quickly match Rez package authors.
+
+    Rez package authors are matched to users with the same rules as
+    before. A user matches if its login or name is inside of the
+    author or if the author is inside of its bio. If several users
+    match, the first user wins. But instead of comparing every author
+    against every user, hash maps of logins and names and an n-gram
+    index of bios are built once and then queried.
+
+    """
+
+    def __init__(self, users):
+        """Index every user.
+
+        Args:
+            users (iter[:attr:`_User`]): The GitHub users to search through.
+
+        """
+        super(UserIndex, self).__init__()
+
+        self._users = list(users)
+        self._bio_grams = collections.defaultdict(set)
+        self._emails = dict()
+        self._logins = dict()
+        self._names = dict()
+
+        for position, user in enumerate(self._users):
+            self._logins.setdefault(user.login, position)
+            self._names.setdefault(user.name, position)
+
+            if user.email:
+                self._emails.setdefault(user.email.lower(), position)
+
+            for gram in _get_grams(user.bio):
+                self._bio_grams[gram].add(position)
+
+        self._longest = max(
+            [len(text) for text in itertools.chain(self._logins, self._names)] or [0]
+        )
+
+    def __iter__(self):
+        """iter[:attr:`_User`]: Every user, in their original order."""
+        return iter(self._users)
+
+    def __len__(self):
+        """int: The number of users."""
+        return len(self._users)
+
+    def _find_in_bios(self, author):
+        """int or NoneType: Find the first user whose bio contains `author`."""
+        if len(author) < _GRAM_SIZE:
+            positions = range(len(self._users))
+        else:
+            grams = iter(_get_grams(author))
+            positions = set(self._bio_grams.get(next(grams), ()))
+
+            for gram in grams:
+                if not positions:
+                    return None
+
+                positions &= self._bio_grams.get(gram, set())
+
+            positions = sorted(positions)
+
+        for position in positions:
+            if author in self._users[position].bio:
+                return position
+
+        return None
+
+    def find(self, author):
+        """Find the GitHub user that a Rez package author refers to.
+
+        Args:
+            author (str): Some text from a Rez package's list of `authors`.
+
+        Returns:
+            :attr:`_User` or NoneType: The found user, if any.
+
+        """
+        candidates = []
+
+        for text in _iter_substrings(author, self._longest):
+            for mapping in (self._logins, self._names):
+                position = mapping.get(text)
+
+                if position is not None:
+                    candidates.append(position)
+
+        position = self._find_in_bios(author)
+
+        if position is not None:
+            candidates.append(position)
+
+        if candidates:
+            return self._users[min(candidates)]
+
+        for email in _EMAIL_EXPRESSION.findall(author):
+            position = self._emails.get(email.lower())
+
+            if position is not None:
+                return self._users[position]
+
+        return None
+
+    def get_login(self, login):
+        """:attr:`_User` or NoneType: Find the user which has an exact login name."""
+        position = self._logins.get(login)
+
+        if position is None:
+            return None
+
+        return self._users[position]
+
+
 def _convert_to_github_user_names(package_authors, github_users):
     """Change the Rez package raw author list into GitHub logins.
 
@@ -258,7 +376,7 @@ def _convert_to_github_user_names(package_authors, github_users):
     Args:
         package_authors (list[str]):
             The people responsible for the Rez package.
-        github_users (list[:attr:`_User`]):
+        github_users (:class:`UserIndex` or list[:attr:`_User`]):
             Name, e-mail, login, etc details about every GitHub user.
             This will be used as a reference to get actual GitHub user names.
 
@@ -266,14 +384,16 @@ def _convert_to_github_user_names(package_authors, github_users):
         list[str]: The found GitHub user logins.
 
     """
+    if not isinstance(github_users, UserIndex):
+        github_users = UserIndex(github_users)
+
     output = []
 
     for author in package_authors:
-        for user in github_users:
-            if user.login in author or user.name in author or author in user.bio:
-                output.append(user.login)
+        user = github_users.find(author)
 
-                break
+        if user:
+            output.append(user.login)
         else:
             _LOGGER.warning(
                 'Author "%s" could not be converted into a GitHub user.', author
@@ -282,6 +402,13 @@ def _convert_to_github_user_names(package_authors, github_users):
     return output
 
 
+def _get_grams(text):
+    """set[str]: Get every overlapping, fixed-length piece of `text`."""
+    return {
+        text[index : index + _GRAM_SIZE] for index in range(len(text) - _GRAM_SIZE + 1)
+    }
+
+
 def _get_github_url_data(url):
     """Find information such as repository owner, repository name, etc from a GitHub URL.
 
@@ -305,6 +432,24 @@ def _get_github_url_data(url):
     return None
 
 
+def _iter_substrings(text, maximum):
+    """Get every substring of `text`, including the empty string.
+
+    Args:
+        text (str): The text to split.
+        maximum (int): The longest substring to get.
+
+    Yields:
+        str: Each substring. Repeated substrings are yielded more than once.
+
+    """
+    yield ""
+
+    for start in range(len(text)):
+        for end in range(start + 1, min(len(text), start + maximum) + 1):
+            yield text[start:end]
+
+
 @lru_cache()
 def _read_users_from_cache(path):
     """Parse a set of "cached_users" representing GitHub login data and return them.
@@ -314,29 +459,25 @@ def _read_users_from_cache(path):
 
     Args:
         path (str):
-            An absolute path to a JSON file to read from. It must
-            contain 4 keys, "login", "name", "email", and "bio".
-            All things that can be queried and retrieved using
-            :func:`get_all_users`.
+            An absolute path to a JSON or JSON-lines file to read from.
+            Each user must contain 4 keys, "login", "name", "email",
+            and "bio". All things that can be queried and retrieved
+            using :func:`get_all_users`. See :mod:`.user_cache` for details.
 
 
     Returns:
-        list[:attr:`_User`]: The found users.
+        :class:`UserIndex`: The found users.
 
     """
-    output = []
+    users, _ = user_cache.read(path)
 
-    with open(path, "r") as handler:
-        for user in json.load(handler):
-            output.append(
-                _User(user["login"], user["name"], user["email"], user["bio"])
-            )
-
-    return output
+    return UserIndex(
+        _User(user["login"], user["name"], user["email"], user["bio"]) for user in users
+    )
 
 
 def _write_user_data_cache(users):
-    """Serialize GitHub user data to JSON and write it to a file.
+    """Serialize GitHub user data to JSON-lines and write it to a file.
 
     Args:
         users (list[dict[str, str]]): The GitHub user data to serialize.
@@ -345,16 +486,18 @@ def _write_user_data_cache(users):
                          Most of the time, this attribute will not be useful. But you never know!
             "login" (str): The GitHub username.
             "name" (str): The display name (usually first and last name) of the person.
+            "id" (int): The GitHub user's unique number.
 
     """
-    with tempfile.NamedTemporaryFile(suffix=".json", mode="w") as handler:
-        json.dump(users, handler)
+    handle, path = tempfile.mkstemp(suffix=".jsonl")
+    os.close(handle)
+    user_cache.write(path, users, user_cache.get_since(users))
 
     _LOGGER.info(
         'GitHub users were cached and dumped to "%s". '
         'Re-run your command using "--cached-users %s" to use the cache.',
-        handler.name,
-        handler.name,
+        path,
+        path,
     )
 
 
@@ -385,42 +528,18 @@ def get_all_users(token, base_url="", verify=True, maximum=sys.maxsize, write=Fa
             Default is True.
 
     Returns:
-        list[:attr:`_User`]: The found, public GitHub users.
+        :class:`UserIndex`: The found, public GitHub users.
 
     """
-    if base_url:
-        # PyGitHub expects a URL to end with a special suffix
-        # Reference: https://pygithub.readthedocs.io/en/latest/introduction.html#very-short-tutorial
-        #
-        enterprise_suffix = "/api/v3"
-
-        if not base_url.endswith(enterprise_suffix):
-            base_url = base_url.rstrip("/") + enterprise_suffix
-
-        accessor = github.Github(login_or_token=token, base_url=base_url, verify=verify)
-    else:
-        accessor = github.Github(login_or_token=token, verify=verify)
-
-    users = list(itertools.islice(accessor.get_users(), maximum))
-    output = []
-
-    for user in users:
-        output.append(
-            {
-                "email": user.email or "",
-                "bio": user.bio or "",
-                "login": user.login,
-                "name": user.name or "",
-            }
-        )
+    output = query_users(token, base_url=base_url, verify=verify, maximum=maximum)
 
     if write:
         _write_user_data_cache(output)
 
-    return [
+    return UserIndex(
         _User(data["login"], data["name"], data["email"], data["bio"])
         for data in output
-    ]
+    )
 
 
 @lru_cache()
@@ -449,3 +568,59 @@ def get_user(token, url="", verify=True):
         return accessor
 
     return github3.login(token=token)
+
+
+def query_users(token, base_url="", verify=True, maximum=sys.maxsize, since=0):
+    """Download GitHub users, in the order that they were created.
+
+    Reference:
+        https://developer.github.com/v3/users/#get-all-users
+
+    Args:
+        token (str):
+            The GitHub authentication token that will be used to get user data.
+        base_url (str, optional):
+            The API URL that goes with the given `token`. If you're not
+            using GitHub Enterprise, just leave this parameter blank.
+        verify (bool, optional):
+            If True, require a valid SSL certificate in private If
+            networks. If False, accept all external SSL certificates.
+            Default is True.
+        maximum (int, optional):
+            The largest number of users to download.
+        since (int, optional):
+            Only download users whose ID is greater than this number.
+            If 0, every user is downloaded.
+
+    Returns:
+        list[dict[str, object]]: The "id", "login", "name", "email", and "bio" of each user.
+
+    """
+    if base_url:
+        # PyGitHub expects a URL to end with a special suffix
+        # Reference: https://pygithub.readthedocs.io/en/latest/introduction.html#very-short-tutorial
+        #
+        enterprise_suffix = "/api/v3"
+
+        if not base_url.endswith(enterprise_suffix):
+            base_url = base_url.rstrip("/") + enterprise_suffix
+
+        accessor = github.Github(login_or_token=token, base_url=base_url, verify=verify)
+    else:
+        accessor = github.Github(login_or_token=token, verify=verify)
+
+    users = list(itertools.islice(accessor.get_users(since=since), maximum))
+    output = []
+
+    for user in users:
+        output.append(
+            {
+                "email": user.email or "",
+                "bio": user.bio or "",
+                "login": user.login,
+                "id": user.id,
+                "name": user.name or "",
+            }
+        )
+
+    return output
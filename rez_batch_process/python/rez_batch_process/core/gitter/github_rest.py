@@ -0,0 +1,543 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""An adapter that sends pull requests to GitHub using its REST API directly.
+
+Unlike :class:`.GithubAdapter`, which goes through ``github3`` one
+request at a time, every :class:`GithubRestAdapter` shares one pooled
+HTTP session per token. Independent requests, such as finding the
+repository owner and its contributors or adding assignees and
+reviewers, are sent at the same time. GitHub's rate-limit headers are
+respected and failed requests are retried with an exponential backoff.
+
+Each adapter still makes one pull request at a time. Pull requests for
+packages in different repositories are only made at the same time when
+``--jobs`` runs those repositories in separate processes.
+
+"""
+
+import logging
+import threading
+import time
+from multiprocessing import pool as multiprocessing_pool
+
+import requests
+from requests import adapters as requests_adapters
+from six.moves.urllib import parse
+
+from . import base_adapter, github_link
+
+try:
+    from functools import lru_cache  # python 3
+except ImportError:
+    from backports.functools_lru_cache import lru_cache  # python 2
+
+_DEFAULT_API_URL = "https://api.github.com"
+_ENTERPRISE_SUFFIX = "/api/v3"
+_LOGGER = logging.getLogger(__name__)
+_MAXIMUM_RETRIES = 5
+_POOL_SIZE = 10
+_RATE_LIMIT_STATUSES = frozenset((403, 429))
+_RETRY_STATUSES = frozenset((500, 502, 503, 504))
+
+
+class RequestError(Exception):
+    """An exception for when GitHub refuses a request."""
+
+    def __init__(self, status, message):
+        """Keep track of the HTTP status code of the failed request.
+
+        Args:
+            status (int): The HTTP status code. e.g. 422.
+            message (str): The reason why the request failed.
+
+        """
+        super(RequestError, self).__init__(message)
+
+        self.status = status
+
+
+class Session(object):
+    """A thread-safe, pooled connection to GitHub's REST API."""
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        token,
+        base_url="",
+        verify=True,
+        pool_size=_POOL_SIZE,
+        maximum_retries=_MAXIMUM_RETRIES,
+        backoff=1.0,
+    ):
+        """Create the underlying HTTP session.
+
+        Args:
+            token (str):
+                The GitHub authentication token used for every request.
+            base_url (str, optional):
+                The GitHub Enterprise URL to connect to, if any. If no
+                URL is given, https://api.github.com is used.
+            verify (bool, optional):
+                If True, require a valid SSL certificate. Default is True.
+            pool_size (int, optional):
+                The number of connections to keep open at once.
+            maximum_retries (int, optional):
+                The number of times to re-send a request before giving up.
+            backoff (float, optional):
+                The seconds to wait before the first retry. Each retry
+                waits twice as long as the previous one.
+
+        """
+        super(Session, self).__init__()
+
+        self._api_url = _get_api_url(base_url)
+        self._backoff = backoff
+        self._lock = threading.Lock()
+        self._maximum_retries = maximum_retries
+        self._resume_time = 0.0
+        self._session = requests.Session()
+
+        adapter = requests_adapters.HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers.update(
+            {
+                "Accept": "application/vnd.github.v3+json",
+                "Authorization": "token {token}".format(token=token),
+            }
+        )
+        self._session.verify = verify
+
+    def _record_rate_limit(self, response):
+        """Pause every later request if `response` used up the rate limit."""
+        if response.headers.get("X-RateLimit-Remaining") != "0":
+            return
+
+        reset = float(response.headers.get("X-RateLimit-Reset") or 0)
+
+        with self._lock:
+            self._resume_time = max(self._resume_time, reset)
+
+    def _wait_for_rate_limit(self):
+        """Sleep until GitHub's rate limit has been reset, if needed."""
+        with self._lock:
+            delay = self._resume_time - time.time()
+
+        if delay > 0:
+            _LOGGER.info("GitHub rate limit reached. Waiting %.1f seconds.", delay)
+            time.sleep(delay)
+
+    def request(self, method, path, **kwargs):
+        """Send a request to GitHub, retrying whenever it makes sense to.
+
+        Args:
+            method (str): The HTTP method. e.g. "GET", "POST".
+            path (str):
+                A path relative to the API URL, such as "/repos/foo/bar",
+                or a full URL.
+            **kwargs: Extra options for :meth:`requests.Session.request`.
+
+        Raises:
+            :class:`RequestError`: If GitHub refused the request.
+
+        Returns:
+            :class:`requests.Response`: The successful response.
+
+        """
+        url = path if "://" in path else self._api_url + path
+
+        for attempt in range(self._maximum_retries + 1):
+            delay = self._backoff * 2 ** attempt
+            is_last = attempt == self._maximum_retries
+            self._wait_for_rate_limit()
+
+            try:
+                response = self._session.request(method, url, **kwargs)
+            except requests.ConnectionError:
+                if is_last:
+                    raise
+
+                _LOGGER.warning('Could not connect to "%s". Retrying.', url)
+                time.sleep(delay)
+
+                continue
+
+            self._record_rate_limit(response)
+            rate_limit_delay = _get_rate_limit_delay(response)
+
+            if not is_last and rate_limit_delay is not None:
+                _LOGGER.info(
+                    'Request "%s" was rate-limited. Waiting %.1f seconds.',
+                    url,
+                    rate_limit_delay,
+                )
+                time.sleep(rate_limit_delay)
+
+                continue
+
+            if not is_last and response.status_code in _RETRY_STATUSES:
+                _LOGGER.warning(
+                    'Request "%s" failed with "%s". Retrying.',
+                    url,
+                    response.status_code,
+                )
+                time.sleep(delay)
+
+                continue
+
+            if response.status_code >= 400:
+                raise RequestError(
+                    response.status_code,
+                    'Request "{method} {url}" failed with "{status}": {text}'.format(
+                        method=method,
+                        url=url,
+                        status=response.status_code,
+                        text=response.text,
+                    ),
+                )
+
+            return response
+
+        raise RuntimeError("Unreachable code.")
+
+    def get(self, path, **kwargs):
+        """Send a GET request. See :meth:`request` for details."""
+        return self.request("GET", path, **kwargs).json()
+
+    def post(self, path, data):
+        """Send a POST request with a JSON body. See :meth:`request` for details."""
+        return self.request("POST", path, json=data).json()
+
+    def get_all_pages(self, path, pool=None):
+        """Get every item of a paginated GitHub endpoint.
+
+        The first page is requested to find how many pages there are.
+        The remaining pages are then requested all at once.
+
+        Args:
+            path (str): A path relative to the API URL. e.g. "/repos/foo/bar/contributors".
+            pool (:class:`multiprocessing.pool.ThreadPool`, optional):
+                The threads used to request the remaining pages. If no
+                pool is given, the pages are requested one by one.
+
+        Returns:
+            list: Every found item, in the order that GitHub returned them.
+
+        """
+        response = self.request("GET", path, params={"per_page": 100})
+        items = list(response.json())
+        last = response.links.get("last", {}).get("url")
+
+        if not last:
+            next_ = response.links.get("next", {}).get("url")
+
+            while next_:
+                response = self.request("GET", next_)
+                items.extend(response.json())
+                next_ = response.links.get("next", {}).get("url")
+
+            return items
+
+        urls = [_replace_page(last, page) for page in range(2, _get_page(last) + 1)]
+        mapper = pool.map if pool else map
+
+        for page in mapper(self.get, urls):
+            items.extend(page)
+
+        return items
+
+
+class GithubRestAdapter(base_adapter.BaseAdapter):
+    """The class that submits pull requests to GitHub using a pooled session."""
+
+    def __init__(
+        self, package, token, fallback_reviewers=None, base_url="", verify=True
+    ):
+        """Create this instance and store Rez / GitHub information.
+
+        Args:
+            package (:class:`rez.packages_.Package`):
+                The Rez package which is queried to find find
+                information for the pull request. For example, who to
+                add as reviewers.
+            token (str): The authentication login that will be
+                used to connect to GitHub.
+            fallback_reviewers (list[str], optional): The GitHub users
+                that will be added to a review in case not enough
+                maintainers in the Rez package + repository could be
+                found to fill the review.
+            base_url (str, optional): The API url that is used if the
+                user needs to access a non-standard remote location. For
+                example, if the user is working in GitHub Enterprise and
+                not regular GitHub, they'll need to provide a `base_url`
+                to the GitHub Enterprise URL to authenticate. Default: "".
+            verify (bool, optional): If True, require a valid SSL
+                certificate in private If networks. False, accept all
+                external SSL certificates. Default is True.
+
+        """
+        super(GithubRestAdapter, self).__init__()
+
+        self._base_url = base_url
+        self._fallback_reviewers = fallback_reviewers or []
+        self._package = package
+        self._session = get_session(token, base_url=base_url, verify=verify)
+        self._token = token
+        self._verify = verify
+
+    def _get_reviewers(self, repository, package_maintainers, pool):
+        """Get the GitHub users that will be added to the pull request.
+
+        Reviewers are chosen in the same order as :class:`.GithubAdapter`.
+        Rez package authors first, then the repository owner, then
+        its contributors, and lastly the fallback reviewers.
+
+        Args:
+            repository (str): The "owner/name" of the GitHub repository.
+            package_maintainers (list[str]):
+                The GitHub login names written in the Rez package's list of authors.
+            pool (:class:`multiprocessing.pool.ThreadPool`):
+                The threads used to send requests at the same time.
+
+        Returns:
+            list[str]: The GitHub logins of each person to add the pull request.
+
+        """
+        details = pool.apply_async(
+            self._session.get, ("/repos/{repository}".format(repository=repository),)
+        )
+        contributors = self._session.get_all_pages(
+            "/repos/{repository}/contributors".format(repository=repository), pool=pool
+        )
+
+        authors = list(package_maintainers)
+
+        for login in [details.get()["owner"]["login"]] + [
+            user["login"] for user in contributors
+        ]:
+            if login not in authors:
+                authors.append(login)
+
+        return authors + self._fallback_reviewers
+
+    @staticmethod
+    def is_valid_url(url):
+        """Check if a site address is a valid "GitHub" URL.
+
+        Args:
+            url (str): The website / address to a GitHub repository.
+
+        Returns:
+            bool: If `url` is a GitHub repository.
+
+        """
+        return github_link.GithubAdapter.is_valid_url(url)
+
+    def create_pull_request(
+        self, title, body, pull_request_data, user_data="", assignee=""
+    ):
+        """Make a pull request to GitHub, using the given information.
+
+        Args:
+            title (str): The subject line of the pull request.
+            body (str): A description of the pull request's changes. Make it good!
+            pull_request_data (:attr:`.PullRequestDetails`):
+                The URL to a hosted Git repository, the source (feature)
+                branch to use for the pull request and the destination
+                branch (usually master) for it to merge into.
+            user_data (str, optional): A file path that is used to read cached user login,
+                e-mail, and name information. If no information is given
+                then it is queried before pull requests are created.
+            assignee (str, optional):
+                The name of a GitHub user to add to created PRs. Default: "".
+
+        Raises:
+            :class:`RequestError`:
+                If the pull request could not be made for any reason
+                other than it already existing.
+
+        """
+        if not user_data:
+            user_data = github_link.get_all_users(
+                self._token, self._base_url, verify=self._verify, write=True
+            )
+        else:
+            user_data = github_link._read_users_from_cache(  # pylint: disable=protected-access
+                user_data
+            )
+
+        data = github_link._get_github_url_data(  # pylint: disable=protected-access
+            pull_request_data.url
+        )
+        repository = "{data.owner}/{data.name}".format(data=data)
+        package_maintainers = github_link._convert_to_github_user_names(  # pylint: disable=protected-access
+            self._package.authors or [], user_data
+        )
+
+        pool = multiprocessing_pool.ThreadPool(_POOL_SIZE)
+
+        try:
+            pull_request = pool.apply_async(
+                self._session.post,
+                (
+                    "/repos/{repository}/pulls".format(repository=repository),
+                    {
+                        "base": pull_request_data.destination,
+                        "body": body,
+                        "head": pull_request_data.source,
+                        "title": title,
+                    },
+                ),
+            )
+            reviewers = self._get_reviewers(repository, package_maintainers, pool)
+
+            try:
+                pull_request = pull_request.get()
+            except RequestError as error:
+                if error.status != 422:
+                    _LOGGER.exception(
+                        'Pull request was prevented because of this error, "%s".',
+                        error,
+                    )
+
+                    raise
+
+                _LOGGER.warning(
+                    'Pull request failed. This may happen if "%s" already has a pull request '
+                    'but fould happen for basically any reason. Check output "%s" for details.',
+                    pull_request_data.source,
+                    error,
+                )
+
+                return
+
+            number = pull_request["number"]
+            requests_ = [
+                (
+                    "reviewers",
+                    pool.apply_async(
+                        self._session.post,
+                        (
+                            "/repos/{repository}/pulls/{number}/requested_reviewers".format(
+                                repository=repository, number=number
+                            ),
+                            {"reviewers": reviewers},
+                        ),
+                    ),
+                )
+            ]
+
+            if assignee:
+                if user_data.get_login(assignee):
+                    requests_.append(
+                        (
+                            "assignee",
+                            pool.apply_async(
+                                self._session.post,
+                                (
+                                    "/repos/{repository}/issues/{number}/assignees".format(
+                                        repository=repository, number=number
+                                    ),
+                                    {"assignees": [assignee]},
+                                ),
+                            ),
+                        )
+                    )
+                else:
+                    _LOGGER.error('No user could be found for "%s".', assignee)
+
+            for name, request in requests_:
+                try:
+                    request.get()
+                except RequestError as error:
+                    # The pull request already exists so don't stop the other packages
+                    _LOGGER.error(
+                        'Pull request "%s" was made but its %s could not be added. '
+                        'Check output "%s" for details.',
+                        number,
+                        name,
+                        error,
+                    )
+        finally:
+            pool.close()
+            pool.join()
+
+
+def _get_api_url(base_url):
+    """str: Convert a GitHub or GitHub Enterprise URL into its REST API URL."""
+    if not base_url:
+        return _DEFAULT_API_URL
+
+    base_url = base_url.rstrip("/")
+
+    if base_url.endswith(_ENTERPRISE_SUFFIX):
+        return base_url
+
+    return base_url + _ENTERPRISE_SUFFIX
+
+
+def _get_rate_limit_delay(response):
+    """Find how long to wait before GitHub accepts requests again.
+
+    Args:
+        response (:class:`requests.Response`): A response from GitHub.
+
+    Returns:
+        float or NoneType:
+            The seconds to wait, if `response` was rate-limited.
+
+    """
+    if response.status_code not in _RATE_LIMIT_STATUSES:
+        return None
+
+    retry_after = response.headers.get("Retry-After")
+
+    if retry_after:
+        return float(retry_after)
+
+    if response.headers.get("X-RateLimit-Remaining") == "0":
+        reset = float(response.headers.get("X-RateLimit-Reset") or 0)
+
+        return max(reset - time.time(), 0.0)
+
+    return None
+
+
+def _get_page(url):
+    """int: Find the page number of a paginated GitHub URL."""
+    query = parse.urlparse(url).query
+
+    return int(parse.parse_qs(query)["page"][0])
+
+
+def _replace_page(url, page):
+    """str: Change the page number of a paginated GitHub URL."""
+    parts = parse.urlparse(url)
+    query = parse.parse_qs(parts.query)
+    query["page"] = [str(page)]
+
+    return parse.urlunparse(parts._replace(query=parse.urlencode(query, doseq=True)))
+
+
+@lru_cache()
+def get_session(token, base_url="", verify=True):
+    """Get a pooled GitHub session which is shared by every adapter.
+
+    Args:
+        token (str):
+            The GitHub authentication token that will be used for every request.
+        base_url (str, optional):
+            The API URL that goes with the given `token`. If you're not
+            using GitHub Enterprise, just leave this parameter blank.
+        verify (bool, optional):
+            If True, require a valid SSL certificate in private If
+            networks. If False, accept all external SSL certificates.
+            Default is True.
+
+    Returns:
+        :class:`Session`: The found or created session.
+
+    """
+    return Session(token, base_url=base_url, verify=verify)
@@ -3,15 +3,51 @@
 
 """A module to help query and and serialize a list of GitHub users."""
 
-import json
+import logging
+import os
 import sys
 
-from . import github_link
+from . import github_link, user_cache
 
+_LOGGER = logging.getLogger(__name__)
 
-def write_cache(path, token, base_url="", verify=False, maximum=sys.maxsize):
+
+def _get_since(path):
+    """Find the largest user ID that an existing cache has already downloaded.
+
+    Args:
+        path (str): The absolute or relative path to a cache file.
+
+    Returns:
+        int or NoneType: The ID, if `path` is a cache which can be added to.
+
+    """
+    if not os.path.isfile(path):
+        return None
+
+    try:
+        _, since = user_cache.read(path)
+    except ValueError:
+        _LOGGER.warning('Path "%s" has an unknown format. It will be replaced.', path)
+
+        return None
+
+    if since is None:
+        _LOGGER.warning(
+            'Path "%s" is an older JSON cache. It will be replaced with a new cache.',
+            path,
+        )
+
+    return since
+
+
+def write_cache(  # pylint: disable=too-many-arguments
+    path, token, base_url="", verify=False, maximum=sys.maxsize, update=False
+):
     """Serialize a list of GitHub users to-disk.
 
+    The cache is written as JSON-lines. See :mod:`.user_cache` for details.
+
     Reference:
         https://help.github.com/en/github/authenticating-to-github/creating-a-personal-access-token-for-the-command-line
 
@@ -29,23 +65,22 @@ def write_cache(path, token, base_url="", verify=False, maximum=sys.maxsize):
             If True, require a valid SSL certificate in private If
             networks. If False, accept all external SSL certificates.
             Default is True.
+        maximum (int, optional):
+            The largest number of users to download.
+        update (bool, optional):
+            If True and `path` is an existing cache, only download the
+            users which were created since `path` was last written and
+            add them to the end of `path`. Users that changed their
+            details are not updated. If False, download every user
+            and replace `path`.
 
     """
-    users = github_link.get_all_users(
-        token, base_url=base_url, verify=verify, maximum=maximum, write=False
+    since = _get_since(path) if update else None
+    users = github_link.query_users(
+        token, base_url=base_url, verify=verify, maximum=maximum, since=since or 0
     )
 
-    data = []
-
-    for user in users:
-        data.append(
-            {
-                "email": user.email or "",
-                "bio": user.bio or "",
-                "login": user.login,
-                "name": user.name or "",
-            }
-        )
-
-    with open(path, "w") as handler:
-        json.dump(data, handler)
+    if since is None:
+        user_cache.write(path, users, user_cache.get_since(users))
+    else:
+        user_cache.append(path, users, user_cache.get_since(users, since=since))
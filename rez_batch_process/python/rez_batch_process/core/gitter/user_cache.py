@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Read and write cached GitHub users as JSON-lines files.
+
+The first line of every file is a header with the file's schema version.
+Every line after it is either one GitHub user or a "synced" marker,
+which records the largest user ID that was downloaded and when. New
+users are appended to the end of the file so that refreshing the cache
+only needs to download the users that were created since the last
+marker.
+
+Older caches, which are a single JSON list of users, can still be read.
+
+"""
+
+import collections
+import json
+import time
+
+SCHEMA_VERSION = 1
+_SCHEMA_KEY = "schema"
+_SINCE_KEY = "since"
+_SYNCED_KEY = "synced"
+
+
+def _write_users(handler, users, since):
+    """Write `users` and then a "synced" marker to an open file."""
+    for user in users:
+        handler.write(json.dumps(user, sort_keys=True) + "\n")
+
+    handler.write(
+        json.dumps({_SINCE_KEY: since, _SYNCED_KEY: time.time()}, sort_keys=True) + "\n"
+    )
+
+
+def get_since(users, since=0):
+    """int: Find the largest user ID in `users`, to use as the next "since" cursor."""
+    return max([since] + [user.get("id") or 0 for user in users])
+
+
+def append(path, users, since):
+    """Add new users to the end of an existing cache.
+
+    Args:
+        path (str): The absolute path to a cache file which was made by :func:`write`.
+        users (list[dict[str, object]]): The GitHub user data to add.
+        since (int): The largest user ID that has been downloaded.
+
+    """
+    with open(path, "a") as handler:
+        _write_users(handler, users, since)
+
+
+def read(path):
+    """Get every GitHub user from a cache file.
+
+    Args:
+        path (str): The absolute path to a JSON or JSON-lines file.
+
+    Raises:
+        ValueError: If `path` was written by a newer, unknown schema.
+
+    Returns:
+        tuple[list[dict[str, object]], int or NoneType]:
+            Every found user and the largest user ID that has been
+            downloaded. If the file is an older JSON cache, the ID is None.
+
+    """
+    with open(path, "r") as handler:
+        text = handler.read()
+
+    if text.lstrip().startswith("["):
+        return json.loads(text), None
+
+    lines = iter(text.splitlines())
+    header = json.loads(next(lines, "{}") or "{}")
+    schema = header.get(_SCHEMA_KEY)
+
+    if schema != SCHEMA_VERSION:
+        raise ValueError(
+            'Path "{path}" has schema "{schema}". Expected "{expected}".'.format(
+                path=path, schema=schema, expected=SCHEMA_VERSION
+            )
+        )
+
+    since = 0
+    users = collections.OrderedDict()
+
+    for line in lines:
+        if not line.strip():
+            continue
+
+        record = json.loads(line)
+
+        if _SINCE_KEY in record:
+            since = record[_SINCE_KEY]
+        else:
+            users[record.get("id") or record["login"]] = record
+
+    return list(users.values()), since
+
+
+def write(path, users, since):
+    """Replace a cache file with `users`.
+
+    Args:
+        path (str): The absolute path to a file to write to.
+        users (list[dict[str, object]]): The GitHub user data to write.
+        since (int): The largest user ID that has been downloaded.
+
+    """
+    with open(path, "w") as handler:
+        handler.write(json.dumps({_SCHEMA_KEY: SCHEMA_VERSION}) + "\n")
+        _write_users(handler, users, since)
@@ -0,0 +1,245 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Record how far each Rez package got during a ``rez_batch_process run``.
+
+Every run writes a small SQLite database, its "journal". Each Rez
+package's latest state is stored as it moves from being discovered, to
+its repository being cloned, to its command being run, pushed, and
+finally getting a pull request. If a run stops early, a new run can
+re-use the journal (using ``--resume``) to skip every package which
+already finished. Packages which stopped part-way, e.g. which were
+pushed but never got a pull request, are run again from the start.
+Once a run finishes without any errors, its journal is deleted.
+
+Packages are recorded by their family name, not their version. A run
+finds released Rez packages but changes the (possibly newer) version in
+each package's repository, so both must share the same record.
+
+"""
+
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+
+from rez_utilities import finder
+
+DISCOVERED = "discovered"
+CLONED = "cloned"
+COMMAND_RUN = "command_run"
+PUSHED = "pushed"
+PR_CREATED = "pr_created"
+FAILED = "failed"
+FINISHED = "finished"
+
+_ACTIVE = dict()
+_FINISHED_STATES = frozenset((PR_CREATED, FINISHED))
+_FOLDER_NAME = "rez_batch_process_journals"
+_SUFFIX = ".sqlite3"
+_TIMEOUT = 60
+
+
+class Journal(object):
+    """A SQLite database of every Rez package in a run and its latest state."""
+
+    def __init__(self, path, run_id):
+        """Keep track of the database file.
+
+        Args:
+            path (str): The absolute path to a SQLite database file.
+            run_id (str): The unique name of the run that this journal records.
+
+        """
+        super(Journal, self).__init__()
+
+        self._local = threading.local()
+        self._path = path
+        self.run_id = run_id
+
+    def _get_connection(self):
+        """:class:`sqlite3.Connection`: Connect to the database, once per process and thread."""
+        if getattr(self._local, "process", None) != os.getpid():
+            # Connections must not be shared between forked processes or threads
+            self._local.connection = sqlite3.connect(
+                self._path, timeout=_TIMEOUT, isolation_level=None
+            )
+            self._local.connection.execute(
+                "CREATE TABLE IF NOT EXISTS packages ("
+                "name TEXT NOT NULL, "
+                "version TEXT NOT NULL, "
+                "root TEXT NOT NULL, "
+                "state TEXT NOT NULL, "
+                "message TEXT NOT NULL, "
+                "updated REAL NOT NULL, "
+                "PRIMARY KEY (name))"
+            )
+            self._local.process = os.getpid()
+
+        return self._local.connection
+
+    def add(self, packages):
+        """Record Rez packages as discovered, unless they were already recorded.
+
+        Args:
+            packages (iter[:class:`rez.packages_.Package`]): The packages to add.
+
+        """
+        connection = self._get_connection()
+        now = time.time()
+
+        with connection:
+            connection.executemany(
+                "INSERT OR IGNORE INTO packages VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        package.name,
+                        str(package.version),
+                        finder.get_package_root(package) or "",
+                        DISCOVERED,
+                        "",
+                        now,
+                    )
+                    for package in packages
+                ],
+            )
+
+    def delete(self):
+        """Remove the database file, once the run that it records is done."""
+        if getattr(self._local, "process", None) == os.getpid():
+            self._local.connection.close()
+            del self._local.process
+
+        if os.path.isfile(self._path):
+            os.remove(self._path)
+
+    def get_state(self, package):
+        """str: Get the latest recorded state of `package`, if any."""
+        row = (
+            self._get_connection()
+            .execute("SELECT state FROM packages WHERE name = ?", (package.name,))
+            .fetchone()
+        )
+
+        if not row:
+            return ""
+
+        return row[0]
+
+    def is_finished(self, package):
+        """bool: Check if `package` already got all the way through a run."""
+        return self.get_state(package) in _FINISHED_STATES
+
+    def record(self, package, state, message=""):
+        """Change the state of a Rez package.
+
+        Args:
+            package (:class:`rez.packages_.Package`):
+                The Rez package to change. Any version of the package's
+                family changes the same record.
+            state (str): The package's new state. e.g. :attr:`PUSHED`.
+            message (str, optional): Any extra details, such as an error message.
+
+        """
+        connection = self._get_connection()
+
+        with connection:
+            connection.execute(
+                "INSERT OR IGNORE INTO packages VALUES (?, ?, ?, ?, ?, ?)",
+                (package.name, str(package.version), "", state, message, time.time()),
+            )
+            connection.execute(
+                "UPDATE packages SET state = ?, message = ?, updated = ? "
+                "WHERE name = ?",
+                (state, message, time.time(), package.name),
+            )
+
+
+def _get_path(directory, run_id):
+    """str: Get the database file of some run."""
+    return os.path.join(
+        directory or tempfile.gettempdir(), _FOLDER_NAME, run_id + _SUFFIX
+    )
+
+
+def create(directory=""):
+    """Make a journal for a new run.
+
+    Args:
+        directory (str, optional):
+            The folder which will contain the journal. If no folder
+            is given, a temporary folder is used.
+
+    Returns:
+        :class:`Journal`: The created journal.
+
+    """
+    run_id = "{time}-{suffix}".format(
+        time=time.strftime("%Y%m%d-%H%M%S"), suffix=uuid.uuid4().hex[:6]
+    )
+    path = _get_path(directory, run_id)
+    folder = os.path.dirname(path)
+
+    if not os.path.isdir(folder):
+        os.makedirs(folder)
+
+    journal = Journal(path, run_id)
+    journal.add([])  # Write the database file so that the run can be resumed
+
+    return journal
+
+
+def get(directory, run_id):
+    """Find the journal of an earlier run.
+
+    Args:
+        directory (str):
+            The folder which contains the journal. This must be the same
+            folder that was used for the earlier run.
+        run_id (str):
+            The unique name of the earlier run.
+
+    Raises:
+        ValueError: If no journal exists for `run_id`.
+
+    Returns:
+        :class:`Journal`: The found journal.
+
+    """
+    path = _get_path(directory, run_id)
+
+    if not os.path.isfile(path):
+        raise ValueError(
+            'Run "{run_id}" has no journal at "{path}".'.format(
+                run_id=run_id, path=path
+            )
+        )
+
+    return Journal(path, run_id)
+
+
+def get_active():
+    """:class:`Journal` or NoneType: Get the journal of the current run, if any."""
+    return _ACTIVE.get("journal")
+
+
+def record(package, state, message=""):
+    """Change the state of a Rez package in the current run's journal, if there is one.
+
+    Args:
+        package (:class:`rez.packages_.Package`): The Rez package to change.
+        state (str): The package's new state. e.g. :attr:`PUSHED`.
+        message (str, optional): Any extra details, such as an error message.
+
+    """
+    journal = get_active()
+
+    if journal:
+        journal.record(package, state, message=message)
+
+
+def set_active(journal):
+    """Make `journal` the journal of the current run. Use None to unset it."""
+    _ACTIVE["journal"] = journal
@@ -40,6 +40,35 @@ class BaseCommand(object):
 
     """
 
+    @staticmethod
+    def is_thread_safe():
+        """Check if :meth:`run` may be called on several Rez packages at the same time.
+
+        If True, the Rez packages of each repository are run at the
+        same time, in separate threads, and each in its own copy of
+        the repository. See :mod:`.git_phase` for details.
+
+        Returns:
+            bool: If :meth:`run` is safe to call from several threads at once.
+
+        """
+        return False
+
+    @staticmethod
+    def prepare(run, arguments):  # pylint: disable=unused-argument
+        """Do any work which must finish before :meth:`run` changes any Rez package.
+
+        Args:
+            run (callable[callable[:class:`rez.packages_.Package`] -> str] -> tuple):
+                Call a function on every Rez package which :meth:`run`
+                will be called on, each in a clone of its repository.
+                Nothing is recorded to the run's journal. See
+                :func:`.worker.run` for what it returns.
+            arguments (:class:`argparse.Namespace`):
+                The plug-in specific arguments that were given by the user.
+
+        """
+
     @staticmethod
     def parse_arguments(text):
         """Split the user's command-line input to get whatever this class requires to run.
@@ -13,10 +13,9 @@ Important:
 import argparse
 import collections
 import contextlib
+import functools
 import logging
 import os
-import shlex
-import subprocess
 import textwrap
 
 import wurlitzer
@@ -24,8 +23,8 @@ from git import exc
 from github3 import exceptions as github3_exceptions
 from rez_utilities import finder
 
-from .. import exceptions, rez_git
-from ..gitter import base_adapter, git_link, git_registry
+from .. import exceptions, git_phase, journal, result_cache, rez_git, subprocess_pool
+from ..gitter import base_adapter, git_link, git_registry, git_status
 from . import base
 
 _LOGGER = logging.getLogger(__name__)
@@ -98,22 +97,54 @@ class RezShellCommand(base.BaseCommand):
         Raises:
             :class:`.CoreException`:
                 If ``exit_on_error`` is enabled and the user-provided
-                command fails, for any reason.
+                command fails or times out, for any reason.
 
         Returns:
             str: Any error message that occurred from this command, if any.
 
         """
+        no_changes_message = (
+            'Command "{arguments.command}" ran but nothing on-disk changed. '
+            "No PR is needed!".format(arguments=arguments)
+        )
+        cache = result_cache.get_active()
+        key = ""
+
+        if cache:
+            key = result_cache.get_key(package, arguments)
+
+            if key and cache.is_unchanged(key):
+                _LOGGER.info(
+                    'Skipping package "%s". It had no changes in an earlier run.',
+                    package.name,
+                )
+
+                return no_changes_message
+
         command = 'cd "{root}";{arguments.command}'.format(
             root=finder.get_package_root(package), arguments=arguments
         )
         _LOGGER.debug('Command to run "%s".', command)
 
-        process = subprocess.Popen(
-            command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE
-        )
-        stdout, stderr = process.communicate()
-        _LOGGER.debug('stdout "%s".', stdout)
+        pool = subprocess_pool.get_pool()
+        result = pool.run(command)
+        stderr = result.stderr
+        git_status.invalidate(rez_git.get_repository(package))
+
+        if result.timed_out:
+            message = (
+                'Package "{package.name}" did not finish "{command}" within '
+                "{timeout} seconds.".format(
+                    package=package, command=command, timeout=pool.timeout
+                )
+            )
+
+            _LOGGER.error(message)
+
+            if arguments.exit_on_error:
+                raise exceptions.CoreException(message)
+
+            return message
 
         if stderr:
             message = (
@@ -133,24 +164,56 @@ class RezShellCommand(base.BaseCommand):
             return message
 
         if not has_changes(package):
-            return (
-                'Command "{arguments.command}" ran but nothing on-disk changed. '
-                "No PR is needed!".format(arguments=arguments)
-            )
+            if key:
+                cache.add_unchanged(key)
+
+            return no_changes_message
 
         return ""
 
     @classmethod
-    def _create_pull_request(  # pylint: disable=too-many-arguments,too-many-locals
+    def _create_pull_request(  # pylint: disable=too-many-arguments
         cls,
         package,
         configuration,
         cached_users="",
         fallback_reviewers=None,
         base_url="",
+        adapter="",
     ):
         """Make a pull request for whatever changes were done to a Rez package.
 
+        If the Rez packages of the repository are being run at the same
+        time, the pull request is only made once every package's command
+        has run. See :mod:`.git_phase` for details. The arguments are
+        the same as :meth:`_push_pull_request`.
+
+        """
+        git_phase.defer(
+            package,
+            functools.partial(
+                cls._push_pull_request,
+                package,
+                configuration,
+                cached_users=cached_users,
+                fallback_reviewers=fallback_reviewers,
+                base_url=base_url,
+                adapter=adapter,
+            ),
+        )
+
+    @classmethod
+    def _push_pull_request(  # pylint: disable=too-many-arguments,too-many-locals
+        cls,
+        package,
+        configuration,
+        cached_users="",
+        fallback_reviewers=None,
+        base_url="",
+        adapter="",
+    ):
+        """Commit and push the changes of a Rez package and make a pull request for them.
+
         Args:
             package (:class:`rez.packages_.Package`):
                 The object that should either have a git repository defined
@@ -177,6 +240,10 @@ class RezShellCommand(base.BaseCommand):
                 user is working in GitHub Enterprise and not regular
                 GitHub, they'll need to provide a `base_url` to the
                 GitHub Enterprise URL to authenticate. Default: "".
+            adapter (str, optional):
+                The name of the class which submits the pull request.
+                If no name is given, the first class that supports the
+                package's repository is used. Default: "".
 
         Raises:
             NotImplementedError:
@@ -198,6 +265,7 @@ class RezShellCommand(base.BaseCommand):
             fallback_reviewers=fallback_reviewers,
             base_url=base_url,
             verify=configuration.ssl_no_verify,
+            name=adapter,
         )
 
         if not adapter:
@@ -266,6 +334,8 @@ class RezShellCommand(base.BaseCommand):
             elif stderr.read():
                 raise RuntimeError(stderr)
 
+            journal.record(package, journal.PUSHED)
+
             try:
                 adapter.create_pull_request(
                     title,
@@ -286,6 +356,13 @@ class RezShellCommand(base.BaseCommand):
                 # Reference: https://github.com/psf/issues/2364
                 #
                 _LOGGER.exception("Connection was interrupted.")
+            else:
+                journal.record(package, journal.PR_CREATED)
+
+    @staticmethod
+    def is_thread_safe():
+        """bool: Commands only run as separate processes so packages may run at the same time."""
+        return True
 
     @staticmethod
     def parse_arguments(text):
@@ -354,6 +431,8 @@ class RezShellCommand(base.BaseCommand):
         if error:
             return error
 
+        journal.record(package, journal.COMMAND_RUN)
+
         cls._create_pull_request(
             package,
             Configuration(
@@ -366,6 +445,7 @@ class RezShellCommand(base.BaseCommand):
             cached_users=arguments.cached_users,
             fallback_reviewers=arguments.fallback_reviewers,
             base_url=arguments.base_url,
+            adapter=arguments.git_adapter,
         )
 
         return ""
@@ -374,8 +454,9 @@ class RezShellCommand(base.BaseCommand):
 def has_changes(package):
     """Check if a Rez package is part of a git repository that has uncommitted or untracked changes.
 
-    Reference:
-        https://unix.stackexchange.com/a/155077
+    The repository's ``git status`` is only run once and shared by
+    every Rez package in the repository until something writes to it.
+    See :mod:`.git_status` for details.
 
     Args:
         package (:class:`rez.packages_.Package`):
@@ -390,13 +471,8 @@ def has_changes(package):
     relative_path = os.path.relpath(
         finder.get_package_root(package), repository.working_dir
     )
-    command = shlex.split(
-        'git status --porcelain -- "{relative_path}"'.format(
-            relative_path=relative_path
-        )
-    )
 
-    return bool(repository.git.execute(command))
+    return git_status.get_oracle(repository).has_changes(relative_path)
 
 
 def add_git_arguments(parser):
@@ -439,6 +515,14 @@ def add_git_arguments(parser):
     parser.add_argument(
         "-s", "--ssl-no-verify", action="store_false", help="Disable SSL verification"
     )
+    parser.add_argument(
+        "--git-adapter",
+        default="",
+        choices=git_registry.get_adapter_names(),
+        help='How pull requests are submitted. "github_rest" sends requests '
+        "concurrently over a pooled connection. Default: The first adapter "
+        "that supports the repository.",
+    )
 
 
 def _get_unique_branch(repository, base_branch_name):
@@ -501,3 +585,4 @@ def _reset_repository_state(repository, branch):
         )
         repository.git.clean("-df")  # Delete all untracked files and folders
         branch.checkout()
+        git_status.get_oracle(repository).set_clean()
@@ -9,8 +9,8 @@ import sys
 from python_compatibility.sphinx import conf_manager
 from rez_utilities import finder, inspection
 
-from .. import exceptions, rez_git
-from ..gitter import git_link
+from .. import discovery, exceptions, rez_git, worker
+from ..gitter import clone_cache, git_link
 
 
 def _is_keep_temporary_files_enabled():
@@ -46,6 +46,49 @@ def _get_temporary_directory():
     return namespace.temporary_directory
 
 
+def _get_clone_strategy():
+    """str: The user's preferred way to clone git repositories."""
+    user_input = sys.argv[1:]
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument(
+        "--clone-strategy",
+        choices=git_link.CLONE_STRATEGIES,
+        default=git_link.FULL,
+        help="How much of each git repository to download.",
+    )
+
+    namespace, _ = parser.parse_known_args(user_input)
+
+    return namespace.clone_strategy
+
+
+def _get_clone_cache():
+    """:class:`.MirrorCache` or NoneType: The user's cache of mirrored repositories, if any."""
+    user_input = sys.argv[1:]
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument(
+        "--clone-cache",
+        help="A folder on-disk where git repositories are mirrored between runs.",
+    )
+    parser.add_argument(
+        "--clone-cache-size",
+        default=clone_cache.DEFAULT_MAXIMUM_SIZE // 1024 ** 2,
+        type=int,
+        help="The number of megabytes that --clone-cache may use.",
+    )
+
+    namespace, _ = parser.parse_known_args(user_input)
+
+    if not namespace.clone_cache:
+        return None
+
+    return clone_cache.get_cache(
+        namespace.clone_cache, maximum_size=namespace.clone_cache_size * 1024 ** 2,
+    )
+
+
 def has_documentation(package):
     """Check if the given Rez package has documentation already.
 
@@ -101,7 +144,12 @@ def has_documentation(package):
     directory = _get_temporary_directory()
 
     remote_file = git_link.has_package_conf(
-        repository, package.name, directory=directory, keep=keep
+        repository,
+        package.name,
+        directory=directory,
+        keep=keep,
+        cache=_get_clone_cache(),
+        strategy=_get_clone_strategy(),
     )
 
     if remote_file:
@@ -126,6 +174,8 @@ def is_not_a_python_package(package):
 def get_default_latest_packages(paths=None):
     """Get the latest version of every Rez package family.
 
+    Each path is scanned once, concurrently. See :mod:`.discovery` for details.
+
     Args:
         paths (list[str], optional):
             The directories to search for Rez package families,
@@ -138,6 +188,22 @@ def get_default_latest_packages(paths=None):
             valid but must be skipped, for some reason.
 
     """
-    packages = list(inspection.iter_latest_packages(paths=paths))
+    packages = list(discovery.iter_latest_packages(paths=paths))
 
     return packages, [], []
+
+
+def iter_default_latest_packages(paths=None):
+    """Get the latest version of every Rez package family, as each one is found.
+
+    Args:
+        paths (list[str], optional):
+            The directories to search for Rez package families,
+            Default: :attr:`rez.config.config.packages_path`.
+
+    Yields:
+        :attr:`.worker.Classification`: Each found Rez package.
+
+    """
+    for package in discovery.iter_latest_packages(paths=paths):
+        yield worker.Classification(worker.FOUND, package, None)
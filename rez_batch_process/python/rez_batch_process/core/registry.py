@@ -6,12 +6,22 @@
 By default, the registered plugins will skip a Rez package if it is not
 a Python package or already has documentation.
 
+A package finder is either a function that returns found, invalid, and
+skipped Rez packages as 3 lists or a generator function which yields
+each package, as a :attr:`.worker.Classification`, as soon as it's
+found. Generator functions let "report" show results while the finder
+is still running.
+
 """
 
+import functools
+import inspect
+
+from . import worker
 from .plugins import command, conditional
 
 _COMMANDS = {"shell": command.RezShellCommand}
-_PLUGINS = {"shell": conditional.get_default_latest_packages}
+_PLUGINS = {"shell": conditional.iter_default_latest_packages}
 
 
 def get_command(name):
@@ -37,6 +47,24 @@ def get_plugin_keys():
     return set(_PLUGINS.keys())
 
 
+def _get_plugin(name):
+    """Find a registered package finder.
+
+    Raises:
+        ValueError: If `name` is not registered.
+
+    Returns:
+        callable: The found function.
+
+    """
+    if name not in _PLUGINS:
+        raise ValueError(
+            'Command "{name}" has no registered package function.'.format(name=name)
+        )
+
+    return _PLUGINS[name]
+
+
 def get_package_finder(name):
     """Get a function that's used to find Rez packages.
 
@@ -51,12 +79,42 @@ def get_package_finder(name):
             (and thus, not processed).
 
     """
-    if name not in _PLUGINS:
-        raise ValueError(
-            'Command "{name}" has no registered package function.'.format(name=name)
-        )
+    plugin = _get_plugin(name)
 
-    return _PLUGINS[name]
+    if not inspect.isgeneratorfunction(plugin):
+        return plugin
+
+    @functools.wraps(plugin)
+    def _find(*args, **kwargs):
+        return worker.split_classifications(plugin(*args, **kwargs))
+
+    return _find
+
+
+def iter_package_finder(name):
+    """Get a function that's used to find Rez packages, one at a time.
+
+    Raises:
+        ValueError: If `name` is not registered.
+
+    Returns:
+        callable[list[str]] -> iter[:attr:`.worker.Classification`]:
+            A function that takes Rez package paths as its only
+            argument and yields each found, invalid, or skipped Rez
+            package. If the registered finder returns lists, the
+            packages are yielded once it is done.
+
+    """
+    plugin = _get_plugin(name)
+
+    if inspect.isgeneratorfunction(plugin):
+        return plugin
+
+    @functools.wraps(plugin)
+    def _iter(*args, **kwargs):
+        return worker.iter_classifications(*plugin(*args, **kwargs))
+
+    return _iter
 
 
 def clear_command(name):
@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""A persistent cache of Rez packages which a command is known not to change.
+
+Re-running a sweep normally runs the command on every Rez package
+again, even the packages which it already ran on without changing
+anything. This module remembers those packages by a key made from
+
+- The command
+- The git tree hash of the package's folder
+- The rest of the plugin's arguments
+
+If the key is found on a later run, the package is skipped because
+the command would produce no changes again. Once the package's files
+change, its tree hash changes too and the command is run normally.
+
+The cache is chosen once per-run (see :func:`set_active`) so that
+every command plug-in uses it without needing an argument of its own.
+
+"""
+
+import hashlib
+import json
+import logging
+import os
+
+from git import exc
+from rez_utilities import finder
+
+from . import rez_git
+
+_ACTIVE = dict()
+_IGNORED_ARGUMENTS = frozenset(("token",))
+_LOGGER = logging.getLogger(__name__)
+
+
+class ResultCache(object):
+    """A folder which records every command + Rez package that had no changes."""
+
+    def __init__(self, root):
+        """Keep track of the folder that contains every cached result.
+
+        Args:
+            root (str):
+                An absolute path to a folder on-disk. It will be created
+                if it does not already exist.
+
+        """
+        super(ResultCache, self).__init__()
+
+        self._root = root
+
+    def _get_path(self, key):
+        """str: Find the file which marks `key` as unchanged."""
+        return os.path.join(self._root, key[:2], key)
+
+    def add_unchanged(self, key):
+        """Remember that running a command described by `key` changes nothing.
+
+        Args:
+            key (str): The output of :func:`get_key`.
+
+        """
+        path = self._get_path(key)
+        directory = os.path.dirname(path)
+
+        try:
+            os.makedirs(directory)
+        except OSError:  # Another process may have made it first
+            if not os.path.isdir(directory):
+                raise
+
+        open(path, "a").close()
+
+    def is_unchanged(self, key):
+        """bool: Check if a command described by `key` is known to change nothing."""
+        return os.path.isfile(self._get_path(key))
+
+
+def _get_tree_hash(package):
+    """Find the git hash of the folder of a Rez package.
+
+    Args:
+        package (:class:`rez.packages_.Package`):
+            A Rez package which is inside of a git repository.
+
+    Returns:
+        str: The found hash or an empty string, if the hash cannot be found.
+
+    """
+    repository = rez_git.get_repository(package)
+    relative_path = os.path.relpath(
+        finder.get_package_root(package), repository.working_dir
+    )
+
+    if relative_path == os.curdir:
+        relative_path = ""
+
+    try:
+        return repository.git.rev_parse(
+            "HEAD:{path}".format(path=relative_path.replace(os.sep, "/"))
+        )
+    except exc.GitCommandError:
+        _LOGGER.debug('Package "%s" has no committed tree.', package.name)
+
+        return ""
+
+
+def get_active():
+    """:class:`ResultCache` or NoneType: Get the cache of the current run, if any."""
+    return _ACTIVE.get("cache")
+
+
+def get_key(package, arguments):
+    """Describe running a command on a Rez package as a single, unique string.
+
+    Args:
+        package (:class:`rez.packages_.Package`):
+            A Rez package which is inside of a git repository.
+        arguments (:class:`argparse.Namespace`):
+            The user-provided, plug-in specific arguments. It must
+            include the command that will be run on `package`.
+
+    Returns:
+        str:
+            The found key or an empty string, if `package` cannot be
+            described, e.g. because its folder is not committed to git.
+
+    """
+    tree = _get_tree_hash(package)
+
+    if not tree:
+        return ""
+
+    options = {
+        name: value
+        for name, value in vars(arguments).items()
+        if name not in _IGNORED_ARGUMENTS
+    }
+    text = json.dumps([arguments.command, tree, options], sort_keys=True, default=str)
+
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def set_active(cache):
+    """Make `cache` the cache of the current run. Use None to unset it."""
+    _ACTIVE["cache"] = cache
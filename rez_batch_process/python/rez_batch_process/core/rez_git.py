@@ -1,8 +1,19 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-"""Functions for querying git repository information from Rez packges."""
+"""Functions for querying git repository information from Rez packges.
 
+Finding a Rez package's repository is cached by package root. Packages
+that share a repository also share one :class:`git.Repo` object, so
+that a repository's remote URL is only queried once. The caches have no
+size limit because a run walks every package more than once. Instead,
+call :func:`forget` once a folder (such as a temporary clone) is no
+longer needed and :func:`clear_caches` before using the caches from a
+new process.
+
+"""
+
+import functools
 import logging
 import os
 
@@ -13,6 +24,38 @@ from rez_utilities import finder
 from . import exceptions
 
 _LOGGER = logging.getLogger(__name__)
+_REPOSITORIES = dict()
+_ROOTS = dict()
+_URLS = dict()
+
+
+def _cache(results):
+    """Save the results of a function which takes one path, by that path.
+
+    Args:
+        results (dict[str, object]): The place to save each path's result.
+
+    Returns:
+        callable: A decorator which adds the cache to a function.
+
+    """
+
+    def _decorator(function):
+        @functools.wraps(function)
+        def _wrapper(path):
+            try:
+                return results[path]
+            except KeyError:
+                pass
+
+            result = function(path)
+            results[path] = result
+
+            return result
+
+        return _wrapper
+
+    return _decorator
 
 
 def _guess_repository_from_symlinks(directory):
@@ -51,7 +94,13 @@ def _guess_repository_from_symlinks(directory):
 
         raise RuntimeError(message)
 
-    packages = {finder.get_nearest_rez_package(path).name for path in symlinks}
+    packages = set()
+
+    for path in symlinks:
+        packages.add(finder.get_nearest_rez_package(path).name)
+
+        if len(packages) > 1:
+            break
 
     if len(packages) != 1:
         raise RuntimeError(
@@ -65,6 +114,116 @@ def _guess_repository_from_symlinks(directory):
     return git.Repo(real_path, search_parent_directories=True)
 
 
+def _find_top_directory(path):
+    """str: Find the nearest folder that contains a ".git" folder or file, if any."""
+    while True:
+        if os.path.exists(os.path.join(path, ".git")):
+            return path
+
+        parent = os.path.dirname(path)
+
+        if parent == path:
+            return ""
+
+        path = parent
+
+
+@_cache(_REPOSITORIES)
+def _get_repository_from_directory(directory):
+    """:class:`git.Repo`: Get the repository whose working tree is `directory`."""
+    return git.Repo(directory)
+
+
+@_cache(_ROOTS)
+def _get_repository_from_root(path):
+    """Find the git repository of a Rez package.
+
+    This function is cached so each package root is only searched once.
+    If no repository is found, that result is cached too.
+
+    Args:
+        path (str): The root folder of some Rez package.
+
+    Raises:
+        :class:`git.exc.NoSuchPathError`: If `path` does not exist on-disk.
+
+    Returns:
+        :class:`git.Repo` or NoneType: The found repository, if any.
+
+    """
+    if os.path.isdir(path):
+        top = _find_top_directory(path)
+
+        if top:
+            try:
+                return _get_repository_from_directory(top)
+            except exc.InvalidGitRepositoryError:  # pylint: disable=no-member
+                pass
+
+    try:
+        return git.Repo(path, search_parent_directories=True)
+    except exc.InvalidGitRepositoryError:  # pylint: disable=no-member
+        try:
+            return _guess_repository_from_symlinks(path)
+        except (
+            RuntimeError,
+            exc.InvalidGitRepositoryError,  # pylint: disable=no-member
+        ):
+            return None
+
+
+@_cache(_URLS)
+def _get_repository_url(directory):
+    """str: Get the remote URL of the repository whose git folder is `directory`."""
+    return get_repository_url_from_repository(git.Repo(directory))
+
+
+def _is_inside(path, directory):
+    """bool: Check if `path` is `directory` or anything inside of it."""
+    return path == directory or path.startswith(directory.rstrip(os.sep) + os.sep)
+
+
+def clear_caches():
+    """Forget every repository that was found for every Rez package."""
+    _REPOSITORIES.clear()
+    _ROOTS.clear()
+    _URLS.clear()
+
+
+def forget(directory):
+    """Forget and close every cached repository which is inside of `directory`.
+
+    Call this once `directory` (e.g. a temporary clone) is no longer
+    needed, so that its :class:`git.Repo` objects, and any git processes
+    that they keep open, don't stay around for the rest of the run.
+
+    Args:
+        directory (str): The folder on-disk which won't be used anymore.
+
+    """
+    closed = [
+        _REPOSITORIES.pop(path)
+        for path in list(_REPOSITORIES)
+        if _is_inside(path, directory)
+    ]
+
+    for path, repository in list(_ROOTS.items()):
+        if _is_inside(path, directory) or (
+            repository and _is_inside(repository.working_dir, directory)
+        ):
+            del _ROOTS[path]
+
+            if repository:
+                closed.append(repository)
+
+    for path in [path for path in _URLS if _is_inside(path, directory)]:
+        del _URLS[path]
+
+    for repository in closed:
+        # Closing a repository twice is harmless
+        repository.close()
+
+
 def get_repository(package):
     """Get the git repository of a Rez package.
 
@@ -92,18 +251,12 @@ def get_repository(package):
     if not path:
         raise exceptions.InvalidPackage(package, path, "no path on-disk.")
 
-    try:
-        return git.Repo(path, search_parent_directories=True)
-    except exc.InvalidGitRepositoryError:  # pylint: disable=no-member
-        try:
-            return _guess_repository_from_symlinks(path)
-        except (
-            RuntimeError,
-            exc.InvalidGitRepositoryError,  # pylint: disable=no-member
-        ):
-            raise exceptions.NoGitRepository(
-                package, path, "is not in a Git repository."
-            )
+    repository = _get_repository_from_root(path)
+
+    if not repository:
+        raise exceptions.NoGitRepository(package, path, "is not in a Git repository.")
+
+    return repository
 
 
 def get_repository_url_from_repository(repository):
@@ -176,4 +329,4 @@ def get_repository_url(package):
 
     repository = get_repository(package)
 
-    return get_repository_url_from_repository(repository)
+    return _get_repository_url(repository.git_dir)
@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Run shell commands with a shared limit on how many may run at once.
+
+When ``rez_batch_process run --jobs`` processes several repositories at
+the same time, every repository runs its command in a separate process.
+Cloning is mostly network-bound so many repositories can clone at once
+but the commands themselves (formatting, building, etc) are usually
+CPU-bound. :class:`SubprocessPool` limits how many commands run at the
+same time, across every worker process, and stops commands which run
+for too long. Thread-safe commands also run the Rez packages of each
+repository in separate threads (see :mod:`.git_phase`), which share
+the same limit.
+
+Important:
+    The pool must be created by the main process before any worker
+    processes are forked so that they all share the same limit.
+
+"""
+
+import collections
+import logging
+import multiprocessing
+import os
+import signal
+import subprocess
+import threading
+
+Result = collections.namedtuple("Result", "returncode stdout stderr timed_out")
+_LOGGER = logging.getLogger(__name__)
+_POOL = dict()
+
+
+class SubprocessPool(object):
+    """A limited number of "slots" which shell commands must wait for, to run."""
+
+    def __init__(self, size=0, timeout=0):
+        """Create the slots of the pool.
+
+        Args:
+            size (int, optional):
+                The number of commands that may run at the same time.
+                If the value is less than 1, one command per-CPU is allowed.
+            timeout (float, optional):
+                The number of seconds that each command may run for,
+                unless :meth:`run` is given a different value. If 0,
+                commands may run forever.
+
+        """
+        super(SubprocessPool, self).__init__()
+
+        if size < 1:
+            size = multiprocessing.cpu_count()
+
+        self._slots = multiprocessing.BoundedSemaphore(size)
+        self.size = size
+        self.timeout = timeout
+
+    def run(self, command, directory="", timeout=None):
+        """Run a shell command once a slot is free.
+
+        Args:
+            command (str):
+                The shell command to run.
+            directory (str, optional):
+                The folder to run `command` from. If no folder is given,
+                the current directory is used.
+            timeout (float, optional):
+                The number of seconds that `command` may run for. If it
+                runs any longer, it is killed. If 0, it may run forever.
+                Default: The pool's timeout.
+
+        Returns:
+            :attr:`Result`: The exit code, output, and if the command timed out.
+
+        """
+        if timeout is None:
+            timeout = self.timeout
+
+        with self._slots:
+            return _run(command, directory=directory, timeout=timeout)
+
+
+def _kill(process):
+    """Stop a process and every process that it started."""
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except OSError:  # The process already exited
+        pass
+
+
+def _read(stream, lines, name):
+    """Store and log every line from `stream` as soon as it is printed.
+
+    Lines are read as bytes and any text which isn't UTF-8 is replaced
+    so that a command's odd output can't stop this function early.
+    Otherwise, the process could fill its pipe and never exit.
+
+    Args:
+        stream (file): The stdout or stderr of a process, opened as bytes.
+        lines (list[str]): A list to add each found line to.
+        name (str): A label for the log messages. e.g. "stdout".
+
+    """
+    try:
+        for line in iter(stream.readline, b""):
+            line = line.decode("utf-8", "replace").replace("\r\n", "\n")
+            lines.append(line)
+            _LOGGER.debug("%s: %s", name, line.rstrip("\n"))
+    finally:
+        stream.close()
+
+
+def _run(command, directory="", timeout=0):
+    """Run a shell command, streaming its output to the log, and wait for it.
+
+    Args:
+        command (str): The shell command to run.
+        directory (str, optional): The folder to run `command` from.
+        timeout (float, optional): The number of seconds to wait before killing `command`.
+
+    Returns:
+        :attr:`Result`: The exit code, output, and if the command timed out.
+
+    """
+    process = subprocess.Popen(
+        command,
+        cwd=directory or None,
+        shell=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        # Put the command in its own process group so that it can be killed
+        # along with anything that it starts.
+        #
+        preexec_fn=getattr(os, "setsid", None),
+    )
+    stdout = []
+    stderr = []
+    readers = [
+        threading.Thread(target=_read, args=(process.stdout, stdout, "stdout")),
+        threading.Thread(target=_read, args=(process.stderr, stderr, "stderr")),
+    ]
+
+    for reader in readers:
+        reader.daemon = True
+        reader.start()
+
+    timed_out = threading.Event()
+    timer = None
+
+    if timeout > 0:
+        timer = threading.Timer(timeout, lambda: (timed_out.set(), _kill(process)))
+        timer.daemon = True
+        timer.start()
+
+    try:
+        returncode = process.wait()
+    finally:
+        if timer:
+            timer.cancel()
+
+    for reader in readers:
+        reader.join()
+
+    return Result(returncode, "".join(stdout), "".join(stderr), timed_out.is_set())
+
+
+def get_pool():
+    """:class:`SubprocessPool`: Get the pool which commands should run in."""
+    if "pool" not in _POOL:
+        _POOL["pool"] = SubprocessPool()
+
+    return _POOL["pool"]
+
+
+def set_pool(pool):
+    """Replace the pool which commands run in. Call this before forking any processes."""
+    _POOL["pool"] = pool
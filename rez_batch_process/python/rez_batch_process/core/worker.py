@@ -9,12 +9,16 @@ details. This module does the actual work.
 """
 
 import collections
+import functools
 import logging
+import multiprocessing
 import operator
 import os
+import posixpath
 import shutil
 import sys
 import tempfile
+from multiprocessing import pool as pool_
 
 import git
 from git import exc
@@ -22,12 +26,25 @@ from rez import exceptions as rez_exceptions
 from rez import packages_
 from rez.vendor.schema import schema
 from rez_utilities import finder, rez_configuration
+from six.moves import cPickle as pickle
 
-from . import exceptions, rez_git
+from . import exceptions, git_phase, rez_git, subprocess_pool
+from . import journal as journal_
+from . import result_cache as result_cache_
 from .gitter import git_link
 
+FOUND = "found"
+IGNORED = "ignored"
+INVALID = "invalid"
+NEEDS_RUN = "needs_run"
+SKIPPED = "skipped"
+Classification = collections.namedtuple("Classification", "status package details")
 Skip = collections.namedtuple("Skip", "package path reason")
+_RunOptions = collections.namedtuple(
+    "_RunOptions", "temporary_directory cache strategy concurrent"
+)
 _LOGGER = logging.getLogger(__name__)
+_PROCESS_STATE = dict()
 
 
 def _is_permissions_issue(error):
@@ -38,7 +55,7 @@ def _is_permissions_issue(error):
     return error.stderr.endswith("403'")
 
 
-def _clone(url, directory):
+def _clone(url, directory, cache=None, strategy=git_link.FULL):
     """Clone a Git repository listed at `url` to to some folder, `directory`.
 
     If `directory` is already a Git repository then load it. But if the
@@ -51,6 +68,19 @@ def _clone(url, directory):
             e.g. https://github.com/ColinKennedy/rez_developer_packages or
             git@github.com:ColinKennedy/rez_developer_packages.git or
             /some/path/to/a/cloned/rez_developer_packages.git
+        directory (str):
+            The folder on-disk where `url` will be cloned to.
+        cache (:class:`.MirrorCache`, optional):
+            If included, `url` is cloned from a local mirror of the
+            repository instead of from `url` directly. And if
+            `directory` is an existing clone, it is updated to the
+            latest commit. Default is None.
+        strategy (str, optional):
+            How much of `url` to download. See :func:`.git_link.clone`
+            for details. Commands are run on the whole repository so
+            :attr:`.git_link.SPARSE` and :attr:`.git_link.TREE` are
+            replaced with :attr:`.git_link.BLOBLESS`. This is ignored if `cache` is
+            given. Default: :attr:`.git_link.FULL`.
 
     Returns:
         :class:`git.Repo`: The created repository.
@@ -58,20 +88,37 @@ def _clone(url, directory):
     """
     if os.path.isdir(directory):
         try:
-            return git.Repo(directory)
+            repository = git.Repo(directory)
         except exc.InvalidGitRepositoryError:
             _LOGGER.warning(
                 'Could not clone URL "%s" to directory "%s".', url, directory
             )
+        else:
+            if cache:
+                cache.update(repository, url)
+
+            return repository
+
+    if cache:
+        return cache.clone(url, directory)
 
-    return git.Repo.clone_from(url, directory)
+    if strategy in (git_link.SPARSE, git_link.TREE):
+        _LOGGER.debug(
+            'Repository "%s" needs a full working tree. A blobless clone is used.', url
+        )
+        strategy = git_link.BLOBLESS
 
+    return git_link.clone(url, directory, strategy=strategy)
 
-def _find_package_definitions(directory, name):
+
+def _find_package_definitions(directory, paths, name):
     """Find every Rez package matching some name in a folder on-disk.
 
     Args:
         directory (str): An absolute path to a folder that has Rez packages in it.
+        paths (iter[str]):
+            Every Rez package file in `directory`, relative to `directory`.
+            See :func:`.git_link.iter_tree_files`.
         name (str): The name of the Rez package to search for.
 
     Returns:
@@ -83,64 +130,63 @@ def _find_package_definitions(directory, name):
     """
     matches = set()
 
-    for root, _, files in os.walk(directory):
-        for name_ in files:
-            if name_ in rez_configuration.REZ_PACKAGE_NAMES:
-                try:
-                    package = packages_.get_developer_package(root)
-                except IndexError:
-                    # You can't access a Rez package after modifying it
-                    # so if we encounter a package that was already modified
-                    # in the same repository, just ignore this error.
-                    #
-                    # Reference: https://github.com/nerdvegas/rez/issues/857
-                    #
-                    # TODO : If the issue above is ever solved, remove this try/except
-                    #
-                    continue
-                except schema.SchemaError:
-                    # The package is invalid. Just skip it
-                    _LOGGER.warning('Folder "%s" has an invalid Rez package.', root)
-
-                    continue
-                except (
-                    rez_exceptions.InvalidPackageError,
-                    rez_exceptions.PackageMetadataError,
-                ):
-                    # This happens in one of two scenarios:
-                    # 1. The Rez package file found is invalid
-                    # 2. There's a package.py file in the Rez package itself
-                    #    and is being parsed as if it's a Rez package file, even though it isn't.
-                    #
-                    # There's not a lot that can be done about either case. So just ignore it.
-                    _LOGGER.warning(
-                        'Folder "%s" thought it found a Rez package but it has broken metadata. '
-                        "Maybe it's not a Rez package?",
-                        root,
-                    )
-
-                    continue
-                except rez_exceptions.ResourceError:
-                    # This happens when there's a file like package.py
-                    # but it's not actually a Rez package. An error
-                    # occurs because there's some kind of import in the
-                    # file which Rez cannot load.
-                    #
-                    _LOGGER.warning(
-                        'Folder "%s" contains a Rez package file which can\'t be imported. '
-                        "Maybe it's not a Rez package?",
-                        root,
-                    )
-                except rez_exceptions.RezError:
-                    _LOGGER.exception(
-                        'Folder "%s" found a package file but it raised a Rez error.',
-                        root,
-                    )
-
-                    continue
-
-                if package.name == name:
-                    matches.add(package)
+    for root in sorted({posixpath.dirname(path) for path in paths}):
+        root = os.path.normpath(os.path.join(directory, root))
+
+        try:
+            package = packages_.get_developer_package(root)
+        except IndexError:
+            # You can't access a Rez package after modifying it
+            # so if we encounter a package that was already modified
+            # in the same repository, just ignore this error.
+            #
+            # Reference: https://github.com/nerdvegas/rez/issues/857
+            #
+            # TODO : If the issue above is ever solved, remove this try/except
+            #
+            continue
+        except schema.SchemaError:
+            # The package is invalid. Just skip it
+            _LOGGER.warning('Folder "%s" has an invalid Rez package.', root)
+
+            continue
+        except (
+            rez_exceptions.InvalidPackageError,
+            rez_exceptions.PackageMetadataError,
+        ):
+            # This happens in one of two scenarios:
+            # 1. The Rez package file found is invalid
+            # 2. There's a package.py file in the Rez package itself
+            #    and is being parsed as if it's a Rez package file, even though it isn't.
+            #
+            # There's not a lot that can be done about either case. So just ignore it.
+            _LOGGER.warning(
+                'Folder "%s" thought it found a Rez package but it has broken metadata. '
+                "Maybe it's not a Rez package?",
+                root,
+            )
+
+            continue
+        except rez_exceptions.ResourceError:
+            # This happens when there's a file like package.py
+            # but it's not actually a Rez package. An error
+            # occurs because there's some kind of import in the
+            # file which Rez cannot load.
+            #
+            _LOGGER.warning(
+                'Folder "%s" contains a Rez package file which can\'t be imported. '
+                "Maybe it's not a Rez package?",
+                root,
+            )
+        except rez_exceptions.RezError:
+            _LOGGER.exception(
+                'Folder "%s" found a package file but it raised a Rez error.', root
+            )
+
+            continue
+
+        if package.name == name:
+            matches.add(package)
 
     return matches
 
@@ -177,11 +223,191 @@ def handle_generic_exception(error, package):
     return path, str(message)
 
 
+def iter_report(
+    packages_to_report,
+    maximum_repositories=sys.maxsize,
+    maximum_rez_packages=sys.maxsize,
+):
+    """Check Rez packages for their git repositories, one package at a time.
+
+    Each package is yielded as soon as it is checked. Checking stops
+    exactly once `maximum_rez_packages` packages are found or once a
+    package from a repository past `maximum_repositories` is found.
+
+    Args:
+        packages_to_report (iter[:class:`rez.packages_.Package`]):
+            The Rez packages to check for a command.
+        maximum_repositories (int, optional):
+            The number of unique repositories to check for packages.
+            Default: :attr:`sys.maxsize`.
+        maximum_rez_packages (int, optional):
+            The number of unique Rez packages to potentially report.
+            Default: :attr:`sys.maxsize`.
+
+    Yields:
+        :attr:`Classification`:
+            A package that needs to have a command run on it, with
+            its repository URL as details. Or a package which couldn't
+            be checked because something is wrong with it, with an
+            :class:`.InvalidPackage` as details.
+
+    """
+    if maximum_rez_packages < 1:
+        return
+
+    repositories = set()
+    count = 0
+
+    for package in packages_to_report:
+        try:
+            repository = rez_git.get_repository_url(package)
+        except (
+            exceptions.InvalidPackage,
+            exceptions.NoRepositoryRemote,
+            # If a USD is found for `package` but it points to a file
+            # location on-disk and that path does not exist.
+            #
+            exc.NoSuchPathError,
+        ) as error:
+            yield Classification(
+                INVALID,
+                package,
+                exceptions.InvalidPackage(
+                    package, finder.get_package_root(package), str(error)
+                ),
+            )
+
+            continue
+
+        if repository not in repositories:
+            if len(repositories) >= maximum_repositories:
+                return
+
+            repositories.add(repository)
+
+        count += 1
+
+        yield Classification(NEEDS_RUN, package, repository)
+
+        if count >= maximum_rez_packages:
+            return
+
+
+def iter_classifications(packages, invalids, skips):
+    """Convert the lists of a package finder into :attr:`Classification` objects.
+
+    Args:
+        packages (iter[:class:`rez.packages_.Package`]): Every found Rez package.
+        invalids (iter[:class:`.InvalidPackage`]): Every broken Rez package.
+        skips (iter[:attr:`Skip`]): Every Rez package which must not be processed.
+
+    Yields:
+        :attr:`Classification`: Each skipped, invalid, and then found Rez package.
+
+    """
+    for skip in skips:
+        yield Classification(SKIPPED, skip.package, skip)
+
+    for invalid in invalids:
+        yield Classification(INVALID, invalid.get_package(), invalid)
+
+    for package in packages:
+        yield Classification(FOUND, package, None)
+
+
+def iter_found_report(
+    classifications, maximum_repositories=sys.maxsize, maximum_rez_packages=sys.maxsize,
+):
+    """Run :func:`iter_report` on every found Rez package, as soon as it's found.
+
+    Args:
+        classifications (iter[:attr:`Classification`]):
+            The output of a package finder. Found packages are checked
+            by :func:`iter_report`. Every other package is yielded as-is.
+        maximum_repositories (int, optional):
+            The number of unique repositories to check for packages.
+            Default: :attr:`sys.maxsize`.
+        maximum_rez_packages (int, optional):
+            The number of unique Rez packages to potentially report.
+            Default: :attr:`sys.maxsize`.
+
+    Yields:
+        :attr:`Classification`:
+            Each package, in the order that `classifications` lists
+            them. Once a maximum is reached, nothing else is read
+            from `classifications`.
+
+    """
+    pending = collections.deque()
+
+    def _iter_found():
+        for classification in classifications:
+            if classification.status == FOUND:
+                yield classification.package
+            else:
+                pending.append(classification)
+
+    for classification in iter_report(
+        _iter_found(),
+        maximum_repositories=maximum_repositories,
+        maximum_rez_packages=maximum_rez_packages,
+    ):
+        while pending:
+            yield pending.popleft()
+
+        yield classification
+
+    while pending:
+        yield pending.popleft()
+
+
+def split_classifications(classifications):
+    """Convert the output of a package finder into separate lists.
+
+    Args:
+        classifications (iter[:attr:`Classification`]):
+            Every found, invalid, and skipped Rez package.
+
+    Raises:
+        ValueError: If any of `classifications` has some other status.
+
+    Returns:
+        tuple[list[:class:`rez.packages_.Package`], list[:class:`.InvalidPackage`], list[:attr:`Skip`]]:
+            Every found Rez package, any package that's invalid, and
+            any package that should be skipped.
+
+    """
+    packages = []
+    invalids = []
+    skips = []
+
+    for classification in classifications:
+        if classification.status == FOUND:
+            packages.append(classification.package)
+        elif classification.status == INVALID:
+            invalids.append(classification.details)
+        elif classification.status == SKIPPED:
+            skips.append(classification.details)
+        else:
+            raise ValueError(
+                'Status "{classification.status}" cannot come from a package finder.'.format(
+                    classification=classification
+                )
+            )
+
+    return packages, invalids, skips
+
+
 def report(
-    packages_to_report, maximum_repositories=sys.maxsize, maximum_rez_packages=sys.maxsize
+    packages_to_report,
+    maximum_repositories=sys.maxsize,
+    maximum_rez_packages=sys.maxsize,
 ):
     """Check Rez packages for missing documentation and return them all.
 
+    See Also:
+        :func:`iter_report`
+
     Args:
         packages_to_report (iter[:class:`rez.packages_.Package`]):
             The Rez packages to check for a command.
@@ -207,42 +433,572 @@ def report(
             package.
 
     """
-    repositories = []
     packages = []
     invalids = []
 
-    for package in packages_to_report:
-        if len(repositories) > maximum_repositories:
-            break
-        elif len(packages) > maximum_rez_packages:
-            break
+    for classification in iter_report(
+        packages_to_report,
+        maximum_repositories=maximum_repositories,
+        maximum_rez_packages=maximum_rez_packages,
+    ):
+        if classification.status == INVALID:
+            invalids.append(classification.details)
+        else:
+            packages.append(classification.package)
+
+    return packages, invalids
+
+
+def _is_not_found(error):
+    """bool: Check if `error` was raised because a git repository doesn't exist."""
+    if error.status != 128:
+        # It cannot be a "not found" if it is not a 128 error
+        return False
+
+    # Note: There's probably a better way to do this...
+    message = str(error).rstrip("'\"").rstrip()
+
+    return message.endswith(" not found")
+
+
+def _get_picklable_error(error):
+    """Get an error which can be sent from a child process of :func:`run`.
+
+    Args:
+        error (str or Exception): Some message or exception from :func:`_run_repository`.
+
+    Returns:
+        str or Exception:
+            `error`, as-is, if it can be pickled. Otherwise, a
+            :class:`.CoreException` with the same message.
+
+    """
+    try:
+        pickle.loads(pickle.dumps(error))
+    except Exception:  # pylint: disable=broad-except
+        return exceptions.CoreException(str(error))
+
+    return error
+
+
+def _initialize_process(runner, groups, options):
+    """Store the data that every child process of :func:`run` will need.
+
+    The child processes are forked from the main process so `runner`
+    and `groups` are inherited as-is and never need to be pickled. Only
+    the repository URLs are sent to each child process.
+
+    Args:
+        runner (callable[:class:`rez.packages_.Package`] -> str):
+            The function that runs a command on one Rez package.
+        groups (dict[str, list[:class:`rez.packages_.Package`]]):
+            Each repository URL and the Rez packages that are inside of it.
+        options (:attr:`_RunOptions`):
+            The settings which control how each repository is cloned and run.
+
+    """
+    # Forked processes must not share the parent's `git.Repo` objects
+    rez_git.clear_caches()
+
+    _PROCESS_STATE["runner"] = runner
+    _PROCESS_STATE["groups"] = groups
+    _PROCESS_STATE["options"] = options
+
+
+def _get_clone_directory(repository_url, temporary_directory=""):
+    """Find the folder on-disk where `repository_url` will be cloned to.
+
+    Args:
+        repository_url (str):
+            The URL or file path to some git repository.
+        temporary_directory (str, optional):
+            The folder where git repositories will be cloned to. If no
+            folder is given, a new temporary folder is chosen. Default: "".
+
+    Returns:
+        str: The found folder. This folder may or may not exist.
+
+    """
+    # TODO : Add thing to make this more quiet, if needed
+    if temporary_directory:
+        return git_link.make_repository_folder(temporary_directory, repository_url)
+
+    clone_directory = tempfile.mkdtemp(
+        suffix="_{name}_pull_request_location".format(
+            name=repository_url.split("/")[-1]
+        )
+    )
+    # `git.Repo.clone_from` requires that the directory not already exist.
+    # But we need the temporary directory name. So remove the directory
+    #
+    shutil.rmtree(clone_directory)
+
+    return clone_directory
+
+
+def _record_results(ran, un_ran):
+    """Save the results of one repository to the current run's journal, if any.
+
+    Args:
+        ran (set[:class:`rez.packages_.Package`]):
+            Every Rez package that was successfully "ran" by the command.
+        un_ran (set[tuple[:class:`rez.packages_.Package`, object]]):
+            Every Rez package that did not get run and its error.
+
+    """
+    journal = journal_.get_active()
+
+    if not journal:
+        return
+
+    for package in ran:
+        journal.record(package, journal_.FINISHED)
+
+    for package, error in un_ran:
+        if not journal.is_finished(package):
+            journal.record(package, journal_.FAILED, message=str(error))
+
+
+def _copy_repository(repository, name):
+    """Make a local copy of a cloned repository, for one Rez package to change on its own.
+
+    The copy shares the git objects of `repository` so it is quick to
+    make and it pushes to the same remote as `repository`.
+
+    Args:
+        repository (:class:`git.Repo`): The cloned repository to copy.
+        name (str): The name of the Rez package which will use the copy.
+
+    Returns:
+        :class:`git.Repo`: The new copy.
+
+    """
+    directory = tempfile.mkdtemp(suffix="_{name}_package_copy".format(name=name))
+    # `git.Repo.clone_from` requires that the directory not already exist.
+    shutil.rmtree(directory)
+
+    copy = git.Repo.clone_from(
+        repository.working_dir,
+        directory,
+        shared=True,
+        branch=repository.active_branch.name,
+    )
+    copy.git.remote(
+        "set-url", "origin", rez_git.get_repository_url_from_repository(repository)
+    )
+
+    return copy
+
+
+def _run_package(function, package):
+    """Run one step of a command on a Rez package and catch any of its errors.
+
+    Args:
+        function (callable[] -> str):
+            The step to run. e.g. The command or its git work.
+        package (:class:`rez.packages_.Package`):
+            The Rez package which `function` changes.
+
+    Returns:
+        str or Exception: The error that the step returned or raised, if any.
+
+    """
+    try:
+        return function()
+    except exceptions.CoreException as error:
+        return error
+    except exc.GitCommandError as error:
+        if not _is_permissions_issue(error):
+            _LOGGER.exception("Uncaught exception. Not sure what to do!")
+
+            return error
+
+        _LOGGER.warning(
+            'Package "%s" tried to interact with git but got error "%s".',
+            package.name,
+            error,
+        )
+
+        return error
+    except NotImplementedError as error:
+        _LOGGER.error('Package "%s" couldn\'t be run.', package.name)
+
+        return error
+    except Exception as error:  # pylint: disable=broad-except
+        _LOGGER.exception(
+            'An unknown, general exception was found. "%s" cannot be run.',
+            package.name,
+        )
+
+        return error
+
+
+def _run_packages_at_once(runner, repository, packages):
+    """Run a command on several Rez packages of one repository, at the same time.
+
+    The first package is run in `repository`. Every other package is
+    run in its own copy of `repository`, so that its git work only
+    includes its own changes. Once every command has run, the git work
+    of each package is done one package at a time, in order.
+
+    Args:
+        runner (callable[:class:`rez.packages_.Package`] -> str):
+            The thread-safe function that runs a command on one Rez package.
+        repository (:class:`git.Repo`): The cloned repository of `packages`.
+        packages (list[:class:`rez.packages_.DeveloperPackage`]):
+            The Rez packages to run, from `repository`.
+
+    Returns:
+        list[str or Exception]: The error of each package, if any.
+
+    """
+    copies = []
+    items = [packages[0]]
+
+    try:
+        for package in packages[1:]:
+            copy = _copy_repository(repository, package.name)
+            copies.append(copy.working_dir)
+            relative = os.path.relpath(
+                finder.get_package_root(package), repository.working_dir
+            )
+            items.append(
+                packages_.get_developer_package(
+                    os.path.join(copy.working_dir, relative)
+                )
+            )
+
+        queue = git_phase.Queue()
+        previous = git_phase.get_active()
+        git_phase.set_active(queue)
+        # Commands run as separate processes so threads are enough to wait for them
+        threads = pool_.ThreadPool(
+            processes=min(subprocess_pool.get_pool().size, len(items))
+        )
 
         try:
-            repository = rez_git.get_repository_url(package)
-        except (exceptions.InvalidPackage, exceptions.NoRepositoryRemote) as error:
-            invalids.append(
-                exceptions.InvalidPackage(
-                    package, finder.get_package_root(package), str(error)
+            errors = threads.map(
+                lambda item: _run_package(functools.partial(runner, item), item), items,
+            )
+        except BaseException:
+            threads.terminate()
+
+            raise
+        else:
+            threads.close()
+        finally:
+            threads.join()
+            git_phase.set_active(previous)
+
+        for index, item in enumerate(items):
+            for function in queue.pop(item):
+                if errors[index]:
+                    break
+
+                errors[index] = _run_package(function, item)
+
+        return errors
+    finally:
+        for directory in copies:
+            rez_git.forget(directory)
+            shutil.rmtree(directory, ignore_errors=True)
+
+
+def _run_repository(runner, repository_url, packages, options):
+    """Clone a git repository and run a command on every Rez package inside of it.
+
+    Args:
+        runner (callable[:class:`rez.packages_.Package`] -> str):
+            The function that runs a command on one Rez package.
+        repository_url (str):
+            The URL or file path to the git repository which contains `packages`.
+        packages (iter[:class:`rez.packages_.Package`]):
+            The Rez packages to run a command on.
+        options (:attr:`_RunOptions`):
+            The folder where git repositories will be cloned to (if
+            empty, a temporary directory is used), the local mirrors
+            that repositories are cloned from (if any), the clone
+            strategy to use, and if the repository's Rez packages may
+            run at the same time.
+
+    Returns:
+        tuple[
+            set[:class:`rez.packages_.Package`],
+            set[tuple[:class:`rez.packages_.Package`, :class:`.CoreException`]],
+            str,
+        ]:
+            Every Rez package that was successfully "ran" by the
+            command, every Rez package did not get run for some reason,
+            and the root of the cloned repository. If the repository
+            could not be cloned, the root is an empty string.
+
+    """
+    ran = set()
+    un_ran = set()
+    packages = sorted(packages, key=operator.attrgetter("name"))
+    clone_directory = _get_clone_directory(
+        repository_url, temporary_directory=options.temporary_directory
+    )
+
+    # TODO : Replace this with ls-remote or something
+    #
+    # Reference: https://stackoverflow.com/a/27668138/3626104
+    #
+    # git ls-remote git@github.com:foo/bar.git
+    # git ls-remote http://github.com/foo/bar
+    #
+    try:
+        repository = _clone(
+            repository_url,
+            clone_directory,
+            cache=options.cache,
+            strategy=options.strategy,
+        )
+    except exc.GitCommandError as error:
+        if _is_permissions_issue(error):
+            template = 'The Git repository "{repository_url}" failed to push/pull.'
+        elif _is_not_found(error):
+            template = 'The Git repository "{repository_url}" was not found.'
+        else:
+            template = 'The Git repository "{repository_url}" failed to clone.'
+
+        message = template.format(repository_url=repository_url)
+
+        for package in packages:
+            un_ran.add((package, message))
+
+        _record_results(ran, un_ran)
+
+        return ran, un_ran, ""
+    except exc.InvalidGitRepositoryError:
+        _LOGGER.error('Directory "%s" is not a valid Git repository.', clone_directory)
+
+        for package in packages:
+            un_ran.add(
+                (
+                    package,
+                    'The Git repository "{repository_url}" failed to clone.'.format(
+                        repository_url=repository_url
+                    ),
                 )
             )
 
-            continue
-        except exc.NoSuchPathError as error:
-            # If a USD is found for `package` but it points to a file
-            # location on-disk and that path does not exist.
-            #
-            invalids.append(
-                exceptions.InvalidPackage(
-                    package, finder.get_package_root(package), str(error)
+        _record_results(ran, un_ran)
+
+        return ran, un_ran, ""
+
+    for package in packages:
+        journal_.record(package, journal_.CLONED)
+
+    repository_root = repository.working_dir
+    package_files = list(
+        git_link.iter_tree_files(repository, rez_configuration.REZ_PACKAGE_NAMES)
+    )
+
+    found = []
+
+    for package in packages:
+        definitions = list(
+            _find_package_definitions(repository_root, package_files, package.name)
+        )
+
+        try:
+            latest = sorted(definitions, key=operator.attrgetter("version"))[-1]
+        except IndexError:
+            un_ran.add(
+                (
+                    package,
+                    'Could not find "{package.name}" in repository "{repository_root}".'
+                    "".format(package=package, repository_root=repository_root),
                 )
             )
 
             continue
 
-        repositories.append(repository)
-        packages.append(package)
+        found.append(latest)
 
-    return packages, invalids
+    if options.concurrent and len(found) > 1 and subprocess_pool.get_pool().size > 1:
+        errors = _run_packages_at_once(runner, repository, found)
+    else:
+        errors = [
+            _run_package(functools.partial(runner, latest), latest) for latest in found
+        ]
+
+    for latest, error in zip(found, errors):
+        if error:
+            un_ran.add((latest, error))
+        else:
+            ran.add(latest)
+
+    _record_results(ran, un_ran)
+    # The clone is only deleted once Python exits. Until then, don't keep
+    # its repositories (and their git processes) for the rest of the run.
+    #
+    rez_git.forget(repository_root)
+
+    return ran, un_ran, repository_root
+
+
+def _run_repository_in_process(repository_url):
+    """Run :func:`_run_repository` from a child process of :func:`run`.
+
+    Rez packages and exceptions don't pickle reliably. So the results
+    of :func:`_run_repository` are flattened into paths and errors
+    before they are sent back to the main process.
+
+    Args:
+        repository_url (str):
+            The URL or file path to a git repository that was given to
+            :func:`_initialize_process`.
+
+    Returns:
+        tuple[str, str, list[str], list[tuple[str, str, str or Exception]]]:
+            The given `repository_url`, the root of the cloned
+            repository, the root of every Rez package that ran, and the
+            name, root, and error of every Rez package that did not run.
+
+    """
+    ran, un_ran, repository_root = _run_repository(
+        _PROCESS_STATE["runner"],
+        repository_url,
+        _PROCESS_STATE["groups"][repository_url],
+        _PROCESS_STATE["options"],
+    )
+
+    return (
+        repository_url,
+        repository_root,
+        sorted(finder.get_package_root(package) for package in ran),
+        sorted(
+            (
+                (
+                    package.name,
+                    finder.get_package_root(package) or "",
+                    _get_picklable_error(error),
+                )
+                for package, error in un_ran
+            ),
+            key=lambda item: (item[0], item[1], str(item[2])),
+        ),
+    )
+
+
+def _run_repositories_in_parallel(runner, groups, jobs, options):
+    """Run :func:`_run_repository` on several git repositories at once.
+
+    Each repository is cloned and processed in a separate process.
+    Results are merged in repository order, regardless of the order
+    that each process finishes in.
+
+    Args:
+        runner (callable[:class:`rez.packages_.Package`] -> str):
+            The function that runs a command on one Rez package.
+        groups (list[tuple[str, set[:class:`rez.packages_.Package`]]]):
+            Each repository URL and the Rez packages that are inside of it.
+        jobs (int):
+            The number of repositories to process at the same time.
+        options (:attr:`_RunOptions`):
+            The settings which control how each repository is cloned and run.
+
+    Returns:
+        list[tuple[
+            set[:class:`rez.packages_.Package`],
+            set[tuple[:class:`rez.packages_.Package`, str or Exception]],
+            str,
+        ]]:
+            The output of :func:`_run_repository`, once per-repository.
+            Any error which can't be pickled becomes a :class:`.CoreException`.
+
+    """
+    names = {
+        repository_url: {package.name: package for package in packages}
+        for repository_url, packages in groups
+    }
+    pool = multiprocessing.Pool(
+        processes=jobs,
+        initializer=_initialize_process,
+        initargs=(runner, dict(groups), options),
+    )
+    results = []
+
+    try:
+        for index, result in enumerate(
+            pool.imap_unordered(
+                _run_repository_in_process,
+                [repository_url for repository_url, _ in groups],
+            ),
+            1,
+        ):
+            _LOGGER.info(
+                'Finished repository "%s" (%s/%s).', result[0], index, len(groups)
+            )
+            results.append(result)
+    except BaseException:
+        pool.terminate()
+
+        raise
+    else:
+        pool.close()
+    finally:
+        pool.join()
+
+    output = []
+
+    for repository_url, repository_root, ran_roots, un_ran_data in sorted(
+        results, key=operator.itemgetter(0)
+    ):
+        ran = {packages_.get_developer_package(root) for root in ran_roots}
+        un_ran = set()
+
+        for name, root, error in un_ran_data:
+            if repository_root and root.startswith(repository_root):
+                package = packages_.get_developer_package(root)
+            else:
+                package = names[repository_url][name]
+
+            un_ran.add((package, error))
+
+        output.append((ran, un_ran, repository_root))
+
+    return output
+
+
+def _run_groups(runner, groups, jobs, options):
+    """Run :func:`_run_repository` on every repository, serially or in parallel.
+
+    Args:
+        runner (callable[:class:`rez.packages_.Package`] -> str):
+            The function that runs a command on one Rez package.
+        groups (list[tuple[str, set[:class:`rez.packages_.Package`]]]):
+            Each repository URL and the Rez packages that are inside of it.
+        jobs (int):
+            The number of repositories to process at the same time.
+        options (:attr:`_RunOptions`):
+            The settings which control how each repository is cloned and run.
+
+    Returns:
+        list[tuple[
+            set[:class:`rez.packages_.Package`],
+            set[tuple[:class:`rez.packages_.Package`, object]],
+            str,
+        ]]:
+            The output of :func:`_run_repository`, once per-repository.
+
+    """
+    if jobs == 1 or len(groups) < 2:
+        results = []
+
+        for index, (repository_url, packages) in enumerate(groups, 1):
+            results.append(_run_repository(runner, repository_url, packages, options))
+            _LOGGER.info(
+                'Finished repository "%s" (%s/%s).', repository_url, index, len(groups)
+            )
+    else:
+        results = _run_repositories_in_parallel(
+            runner, groups, min(jobs, len(groups)), options
+        )
+
+    return results
 
 
 def run(  # pylint: disable=too-many-arguments,too-many-locals
@@ -252,6 +1008,14 @@ def run(  # pylint: disable=too-many-arguments,too-many-locals
     maximum_rez_packages=sys.maxsize,
     keep_temporary_files=False,
     temporary_directory="",
+    jobs=1,
+    cache=None,
+    clone_strategy=git_link.FULL,
+    journal=None,
+    command_jobs=0,
+    command_timeout=0,
+    result_cache=None,
+    concurrent_packages=False,
 ):
     """Run a command on the given Rez packages.
 
@@ -275,6 +1039,37 @@ def run(  # pylint: disable=too-many-arguments,too-many-locals
             The folder where git repositories will be cloned to. If no
             folder is given, each repository is cloned to a separate
             temporary directory. Default: "".
+        jobs (int, optional):
+            The number of repositories to clone and run on at the same
+            time. Each repository is processed in its own process. If
+            the value is less than 1, every CPU is used. Default: 1.
+        cache (:class:`.MirrorCache`, optional):
+            If included, repositories are cloned from local mirrors
+            which persist between runs, instead of from their remotes.
+            Default is None.
+        clone_strategy (str, optional):
+            How much of each repository to download. See
+            :func:`.git_link.clone` for details. Default: :attr:`.git_link.FULL`.
+        journal (:class:`.Journal`, optional):
+            If included, the progress of every Rez package is recorded
+            here and any package which already finished in an earlier
+            run is not run again. Default is None.
+        command_jobs (int, optional):
+            The number of shell commands which may run at the same time,
+            across every repository. If the value is less than 1, one
+            command per-CPU is allowed. Default: 0.
+        command_timeout (float, optional):
+            The number of seconds that a shell command may run on one
+            Rez package before it is stopped. If 0, commands may run
+            forever. Default: 0.
+        result_cache (:class:`.ResultCache`, optional):
+            If included, Rez packages which the command didn't change in
+            an earlier run are skipped. Default is None.
+        concurrent_packages (bool, optional):
+            If True, `runner` is thread-safe and the Rez packages of
+            each repository are run at the same time, up to `command_jobs`
+            at once. Their git work is still done one package at a
+            time. See :mod:`.git_phase` for details. Default is False.
 
     Returns:
         tuple[
@@ -289,16 +1084,6 @@ def run(  # pylint: disable=too-many-arguments,too-many-locals
 
     """
 
-    def _is_not_found(error):
-        if error.status != 128:
-            # It cannot be a "not found" if it is not a 128 error
-            return False
-
-        # Note: There's probably a better way to do this...
-        message = str(error).rstrip("'\"").rstrip()
-
-        return message.endswith(" not found")
-
     def _group_by_repository(packages):
         output = collections.defaultdict(set)
 
@@ -312,153 +1097,49 @@ def run(  # pylint: disable=too-many-arguments,too-many-locals
         maximum_repositories=maximum_repositories,
         maximum_rez_packages=maximum_rez_packages,
     )
+    finished = set()
 
-    ran = set()
-    un_ran = set()
-
-    for repository_url, packages in _group_by_repository(filtered_packages):
-        packages = sorted(packages, key=operator.attrgetter("name"))
-
-        # TODO : Add thing to make this more quiet, if needed
-        if not temporary_directory:
-            clone_directory = tempfile.mkdtemp(
-                suffix="_{name}_pull_request_location".format(
-                    name=repository_url.split("/")[-1]
-                )
-            )
-            # `git.Repo.clone_from` requires that the directory not already exist.
-            # But we need the temporary directory name. So remove the directory
-            #
-            shutil.rmtree(clone_directory)
-        else:
-            clone_directory = git_link.make_repository_folder(
-                temporary_directory, repository_url
-            )
-
-        # TODO : Replace this with ls-remote or something
-        #
-        # Reference: https://stackoverflow.com/a/27668138/3626104
-        #
-        # git ls-remote git@github.com:foo/bar.git
-        # git ls-remote http://github.com/foo/bar
-        #
-        try:
-            repository = _clone(repository_url, clone_directory)
-        except exc.GitCommandError as error:
-            if _is_permissions_issue(error):
-                for package in packages:
-                    un_ran.add(
-                        (
-                            package,
-                            'The Git repository "{repository_url}" failed to push/pull.'.format(
-                                repository_url=repository_url
-                            ),
-                        )
-                    )
-
-                continue
-
-            if _is_not_found(error):
-                for package in packages:
-                    un_ran.add(
-                        (
-                            package,
-                            'The Git repository "{repository_url}" was not found.'.format(
-                                repository_url=repository_url
-                            ),
-                        )
-                    )
-
-                continue
-
-            for package in packages:
-                un_ran.add(
-                    (
-                        package,
-                        'The Git repository "{repository_url}" failed to clone.'.format(
-                            repository_url=repository_url
-                        ),
-                    )
-                )
-
-            continue
-        except exc.InvalidGitRepositoryError:
-            _LOGGER.error(
-                'Directory "%s" is not a valid Git repository.', clone_directory
-            )
+    if journal:
+        journal.add(filtered_packages)
+        finished = {
+            package for package in filtered_packages if journal.is_finished(package)
+        }
+        filtered_packages = [
+            package for package in filtered_packages if package not in finished
+        ]
 
-            for package in packages:
-                un_ran.add(
-                    (
-                        package,
-                        'The Git repository "{repository_url}" failed to clone.'.format(
-                            repository_url=repository_url
-                        ),
-                    )
-                )
+        _LOGGER.info("Skipping %s already-finished packages.", len(finished))
 
-            continue
+    if jobs < 1:
+        jobs = multiprocessing.cpu_count()
 
-        repository_root = repository.working_dir
+    groups = _group_by_repository(filtered_packages)
+    options = _RunOptions(
+        temporary_directory, cache, clone_strategy, concurrent_packages
+    )
+    # Create the pool before forking so that every process shares its limit
+    subprocess_pool.set_pool(
+        subprocess_pool.SubprocessPool(command_jobs, timeout=command_timeout)
+    )
+    previous = journal_.get_active()
+    previous_cache = result_cache_.get_active()
+    journal_.set_active(journal)
+    result_cache_.set_active(result_cache)
+
+    try:
+        results = _run_groups(runner, groups, jobs, options)
+    finally:
+        journal_.set_active(previous)
+        result_cache_.set_active(previous_cache)
+
+    ran = set(finished)
+    un_ran = set()
 
-        if not keep_temporary_files:
+    for ran_, un_ran_, repository_root in results:
+        if repository_root and not keep_temporary_files:
             git_link.add_directory_to_delete(repository_root)
 
-        for package in packages:
-            definitions = list(_find_package_definitions(repository_root, package.name))
-
-            try:
-                latest = sorted(definitions, key=operator.attrgetter("version"))[-1]
-            except IndexError:
-                un_ran.add(
-                    (
-                        package,
-                        'Could not find "{package.name}" in repository "{repository_root}".'
-                        "".format(package=package, repository_root=repository_root),
-                    )
-                )
-
-                continue
-
-            try:
-                error = runner(latest)
-            except exceptions.CoreException as error:  # pylint: disable=broad-except
-                un_ran.add((latest, error))
-
-                continue
-            except exc.GitCommandError as error:
-                if not _is_permissions_issue(error):
-                    _LOGGER.exception("Uncaught exception. Not sure what to do!")
-                    un_ran.add((latest, error))
-
-                    continue
-
-                _LOGGER.warning(
-                    'Package "%s" tried to interact with git but got error "%s".',
-                    latest.name,
-                    error,
-                )
-
-                un_ran.add((latest, error))
-
-                continue
-            except NotImplementedError as error:
-                _LOGGER.error('Package "%s" couldn\'t be run.', latest.name)
-                un_ran.add((latest, error))
-
-                continue
-            except Exception as error:
-                _LOGGER.exception(
-                    'An unknown, general exception was found. "%s" cannot be run.',
-                    latest.name,
-                )
-                un_ran.add((latest, error))
-
-                continue
-
-            if error:
-                un_ran.add((latest, error))
-            else:
-                ran.add(latest)
+        ran.update(ran_)
+        un_ran.update(un_ran_)
 
     return ran, un_ran, invalids
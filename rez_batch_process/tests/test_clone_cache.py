@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Make sure that :mod:`.clone_cache` mirrors and re-uses git repositories correctly."""
+
+import os
+import tempfile
+
+import git
+from python_compatibility.testing import common
+from rez_batch_process.core.gitter import clone_cache
+from six.moves import mock
+
+
+class Clone(common.Common):
+    """Clone repositories through a :class:`.MirrorCache`."""
+
+    def _make_remote(self):
+        """:class:`git.Repo`: Create a repository with 1 commit and a bare remote."""
+        root = tempfile.mkdtemp(suffix="_clone_cache_source")
+        self.delete_item_later(root)
+
+        repository = git.Repo.init(root)
+
+        with open(os.path.join(root, "package.py"), "w") as handler:
+            handler.write('name = "foo"')
+
+        repository.index.add(["package.py"])
+        repository.index.commit("initial commit")
+
+        remote = tempfile.mkdtemp(suffix="_clone_cache_remote.git")
+        self.delete_item_later(remote)
+        git.Repo.clone_from(root, remote, bare=True)
+        repository.create_remote("remote", url=remote)
+
+        return repository
+
+    def _make_cache(self, maximum_size=clone_cache.DEFAULT_MAXIMUM_SIZE):
+        """:class:`.MirrorCache`: Make a cache in a new, temporary folder."""
+        root = tempfile.mkdtemp(suffix="_clone_cache")
+        self.delete_item_later(root)
+
+        return clone_cache.MirrorCache(root, maximum_size=maximum_size)
+
+    def _make_directory(self):
+        """str: Get a folder path, which doesn't exist yet, to clone into."""
+        directory = tempfile.mkdtemp(suffix="_clone_cache_destination")
+        self.delete_item_later(directory)
+
+        return os.path.join(directory, "clone")
+
+    def test_clone(self):
+        """Clone a repository and keep the original remote as "origin"."""
+        source = self._make_remote()
+        url = source.remotes.remote.url
+        cache = self._make_cache()
+
+        repository = cache.clone(url, self._make_directory())
+
+        self.assertEqual(url, repository.remotes.origin.url)
+        self.assertTrue(
+            os.path.isfile(os.path.join(repository.working_dir, "package.py"))
+        )
+
+    def test_update(self):
+        """Fetch new commits into an existing clone."""
+        source = self._make_remote()
+        url = source.remotes.remote.url
+        cache = self._make_cache()
+        repository = cache.clone(url, self._make_directory())
+
+        with open(os.path.join(source.working_dir, "package.py"), "w") as handler:
+            handler.write('name = "bar"')
+
+        source.index.add(["package.py"])
+        source.index.commit("changed the name")
+        source.remotes.remote.push(
+            refspec="{branch}:{branch}".format(branch=source.active_branch.name)
+        )
+
+        cache.update(repository, url)
+
+        self.assertEqual(source.head.commit.hexsha, repository.head.commit.hexsha)
+
+    def test_evict(self):
+        """Delete older mirrors once the cache is too big."""
+        cache = self._make_cache(maximum_size=1)
+        first = self._make_remote().remotes.remote.url
+        second = self._make_remote().remotes.remote.url
+
+        first_mirror = cache.get_mirror(first)
+        second_mirror = cache.get_mirror(second)
+
+        self.assertFalse(os.path.isdir(first_mirror))
+        self.assertTrue(os.path.isdir(second_mirror))
+
+    def test_locked_while_cloning(self):
+        """Lock the mirror once, from its update until the clone is finished."""
+        cache = self._make_cache()
+        url = self._make_remote().remotes.remote.url
+        mirror = cache.get_mirror(url)
+        clone_from = git.Repo.clone_from
+        locked = []
+
+        def _clone_from(source, *args, **kwargs):
+            with clone_cache._lock(  # pylint: disable=protected-access
+                mirror + ".lock", blocking=False
+            ) as acquired:
+                locked.append(not acquired)
+
+            return clone_from(source, *args, **kwargs)
+
+        with mock.patch.object(
+            clone_cache.git.Repo, "clone_from", _clone_from
+        ), mock.patch.object(
+            clone_cache,
+            "_lock",
+            wraps=clone_cache._lock,  # pylint: disable=protected-access
+        ) as lock:
+            cache.clone(url, self._make_directory())
+
+        self.assertEqual([True], locked)
+        self.assertEqual(
+            [mirror + ".lock"],
+            [call[0][0] for call in lock.call_args_list if not call[1]],
+        )
+
+    def test_sizes(self):
+        """Only measure the size of a mirror when it changes."""
+        cache = self._make_cache()
+        first = self._make_remote().remotes.remote.url
+        second = self._make_remote().remotes.remote.url
+        first_mirror = cache.get_mirror(first)
+
+        with mock.patch.object(
+            clone_cache,
+            "_get_disk_usage",
+            wraps=clone_cache._get_disk_usage,  # pylint: disable=protected-access
+        ) as get_disk_usage:
+            second_mirror = cache.get_mirror(second)
+
+        self.assertEqual(
+            [second_mirror], [call[0][0] for call in get_disk_usage.call_args_list]
+        )
+        self.assertTrue(os.path.isdir(first_mirror))
+
+
+class Key(common.Common):
+    """Make sure that :func:`.get_key` normalizes remote URLs."""
+
+    def test_equivalent(self):
+        """Give every spelling of the same GitHub repository the same key."""
+        expected = clone_cache.get_key("https://github.com/foo/bar")
+
+        for url in (
+            "https://github.com/foo/bar.git",
+            "https://github.com/foo/bar/",
+            "http://GitHub.com/foo/bar",
+            "git@github.com:foo/bar.git",
+            "ssh://git@github.com/foo/bar.git",
+        ):
+            self.assertEqual(expected, clone_cache.get_key(url))
+
+    def test_different(self):
+        """Give different repositories different keys."""
+        self.assertNotEqual(
+            clone_cache.get_key("https://github.com/foo/bar"),
+            clone_cache.get_key("https://github.com/fizz/bar"),
+        )
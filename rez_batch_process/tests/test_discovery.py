@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Make sure that :mod:`.discovery` finds the same packages as Rez does."""
+
+import os
+import tempfile
+import textwrap
+
+from python_compatibility.testing import common
+from rez_batch_process.core import discovery
+from rez_utilities import finder, inspection
+
+
+def _make_packages(versions):
+    """Make a folder of released Rez packages.
+
+    Args:
+        versions (dict[str, list[str]]): Each Rez package family and its versions.
+
+    Returns:
+        str: The created packages path.
+
+    """
+    root = tempfile.mkdtemp(suffix="_discovery")
+
+    for name, versions_ in versions.items():
+        for version in versions_:
+            directory = os.path.join(root, name, version)
+            os.makedirs(directory)
+
+            with open(os.path.join(directory, "package.py"), "w") as handler:
+                handler.write(
+                    textwrap.dedent(
+                        """\
+                        name = "{name}"
+                        version = "{version}"
+                        """
+                    ).format(name=name, version=version)
+                )
+
+    return root
+
+
+def _summarize(packages):
+    """list[tuple[str, str, str]]: Get the name, version, and folder of each package."""
+    return [
+        (package.name, str(package.version), finder.get_package_root(package))
+        for package in packages
+    ]
+
+
+class IterLatestPackages(common.Common):
+    """Find the latest version of every package family."""
+
+    def _test(self, paths, jobs=None):
+        """Compare :mod:`.discovery` against Rez's own search."""
+        for path in paths:
+            self.delete_item_later(path)
+
+        expected = _summarize(inspection.iter_latest_packages(paths=paths))
+
+        self.assertEqual(
+            expected, _summarize(discovery.iter_latest_packages(paths=paths, jobs=jobs))
+        )
+
+        return expected
+
+    def test_one_path(self):
+        """Find the latest package of each family in a single path."""
+        found = self._test(
+            [_make_packages({"foo": ["1.0.0", "1.10.0", "1.2.0"], "bar": ["2.0.0"]})]
+        )
+
+        self.assertEqual(
+            [("bar", "2.0.0"), ("foo", "1.10.0")],
+            [(name, version) for name, version, _ in found],
+        )
+
+    def test_several_paths(self):
+        """Find the latest package of each family across every path."""
+        self._test(
+            [
+                _make_packages({"foo": ["1.0.0", "3.0.0"], "bar": ["2.0.0"]}),
+                _make_packages({"foo": ["2.0.0"], "fizz": ["1.0.0"]}),
+                _make_packages({"bar": ["2.1.0"], "fizz": ["0.1.0"]}),
+            ]
+        )
+
+    def test_serial(self):
+        """Get the same packages when paths are scanned one at a time."""
+        self._test(
+            [
+                _make_packages({"foo": ["1.0.0"]}),
+                _make_packages({"foo": ["1.1.0"], "bar": ["1.0.0"]}),
+            ],
+            jobs=1,
+        )
+
+    def test_same_version(self):
+        """Prefer earlier paths if several paths have the same latest version."""
+        first = _make_packages({"foo": ["1.0.0"]})
+        found = self._test([first, _make_packages({"foo": ["1.0.0"]})])
+
+        self.assertEqual(os.path.join(first, "foo", "1.0.0"), found[0][2].rstrip("/"))
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Make sure that :mod:`.git_link` only downloads and checks out what it needs."""
+
+import os
+import tempfile
+import unittest
+
+import git
+from python_compatibility.testing import common
+from rez_batch_process.core.gitter import git_link
+
+
+class Clone(common.Common):
+    """Clone repositories using each of the clone strategies."""
+
+    def _make_remote(self):
+        """str: Create a repository with a Rez package, 2 commits, and return its URL."""
+        root = tempfile.mkdtemp(suffix="_git_link_source")
+        self.delete_item_later(root)
+
+        common.make_files(
+            {
+                "project_a": {
+                    "package.py": None,
+                    "documentation": {"conf.py": None},
+                    "python": {"some_module.py": None},
+                }
+            },
+            root,
+        )
+
+        repository = git.Repo.init(root)
+        repository.index.add(["project_a"])
+        repository.index.commit("initial commit")
+        open(os.path.join(root, "README.md"), "w").close()
+        repository.index.add(["README.md"])
+        repository.index.commit("Added a README")
+
+        # `--depth` and `--filter` are ignored for plain file paths
+        return "file://" + root
+
+    def _make_directory(self):
+        """str: Get a folder path, which doesn't exist yet, to clone into."""
+        directory = tempfile.mkdtemp(suffix="_git_link_destination")
+        self.delete_item_later(directory)
+
+        return os.path.join(directory, "clone")
+
+    def test_full(self):
+        """Clone everything."""
+        repository = git_link.clone(self._make_remote(), self._make_directory())
+
+        self.assertEqual(2, len(list(repository.iter_commits())))
+        self.assertTrue(
+            os.path.isfile(
+                os.path.join(
+                    repository.working_dir, "project_a", "python", "some_module.py"
+                )
+            )
+        )
+
+    def test_shallow(self):
+        """Only clone the latest commit."""
+        repository = git_link.clone(
+            self._make_remote(), self._make_directory(), strategy=git_link.SHALLOW
+        )
+
+        self.assertEqual(1, len(list(repository.iter_commits())))
+
+    def test_sparse(self):
+        """Only check out Rez package files and Sphinx conf.py files."""
+        repository = git_link.clone(
+            self._make_remote(), self._make_directory(), strategy=git_link.SPARSE
+        )
+        root = os.path.join(repository.working_dir, "project_a")
+
+        self.assertTrue(os.path.isfile(os.path.join(root, "package.py")))
+        self.assertTrue(os.path.isfile(os.path.join(root, "documentation", "conf.py")))
+        self.assertFalse(os.path.isdir(os.path.join(root, "python")))
+        self.assertFalse(
+            os.path.isfile(os.path.join(repository.working_dir, "README.md"))
+        )
+
+    def test_tree(self):
+        """Find and check out Rez package files without a working tree."""
+        repository = git_link.clone(
+            self._make_remote(), self._make_directory(), strategy=git_link.TREE
+        )
+
+        self.assertEqual([".git"], os.listdir(repository.working_dir))
+
+        paths = list(git_link.iter_tree_files(repository, {"package.py"}))
+        git_link.materialize(repository, paths)
+
+        self.assertEqual(["project_a/package.py"], paths)
+        self.assertEqual(
+            ["package.py"],
+            os.listdir(os.path.join(repository.working_dir, "project_a")),
+        )
+
+    def test_unknown(self):
+        """Fail early if the strategy is not known."""
+        with self.assertRaises(ValueError):
+            git_link.clone(
+                self._make_remote(), self._make_directory(), strategy="something"
+            )
+
+
+class MakeRepositoryFolder(unittest.TestCase):
+    """Choose a separate folder for each git repository."""
+
+    def test_same_name(self):
+        """Give repositories with the same name, from different owners, different folders."""
+        first = git_link.make_repository_folder(
+            "/tmp", "https://github.com/foo/bar.git"
+        )
+        second = git_link.make_repository_folder("/tmp", "https://github.com/fizz/bar")
+
+        self.assertNotEqual(first, second)
+        self.assertTrue(os.path.basename(first).startswith("bar_"))
+        self.assertTrue(os.path.basename(second).startswith("bar_"))
+        self.assertEqual(
+            first,
+            git_link.make_repository_folder("/tmp", "https://github.com/foo/bar.git/"),
+        )
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Make sure that :mod:`.git_status` finds changes with a single ``git status``."""
+
+import os
+import tempfile
+
+import git
+from python_compatibility.testing import common
+from rez_batch_process.core.gitter import git_status
+
+
+class StatusOracle(common.Common):
+    """Check which folders of a git repository have changes."""
+
+    def setUp(self):
+        """Make a git repository with a few committed files."""
+        super(StatusOracle, self).setUp()
+
+        self._root = tempfile.mkdtemp(suffix="_git_status")
+        self.delete_item_later(self._root)
+        self._repository = git.Repo.init(self._root)
+
+        for path in ("foo/package.py", "bar/package.py", "bar/old_name.py"):
+            self._write(path)
+
+        self._repository.index.add(
+            [
+                os.path.join(self._root, path)
+                for path in self._repository.untracked_files
+            ]
+        )
+        self._repository.index.commit("Initial commit")
+
+    def _write(self, path, text="text"):
+        """Write a file into the repository, creating its parent folders as needed."""
+        path = os.path.join(self._root, path)
+        directory = os.path.dirname(path)
+
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        with open(path, "w") as handler:
+            handler.write(text)
+
+    def test_clean(self):
+        """Report no changes for a repository that was just committed."""
+        oracle = git_status.StatusOracle(self._repository)
+
+        self.assertFalse(oracle.has_changes(os.curdir))
+        self.assertFalse(oracle.has_changes("foo"))
+
+    def test_modified(self):
+        """Find modified and untracked files, but only in their own folders."""
+        self._write("foo/package.py", "changed")
+        self._write("fizz/buzz/new_file.py")
+        oracle = git_status.StatusOracle(self._repository)
+
+        self.assertTrue(oracle.has_changes(os.curdir))
+        self.assertTrue(oracle.has_changes("foo"))
+        self.assertTrue(oracle.has_changes("foo/package.py"))
+        self.assertTrue(oracle.has_changes("fizz/buzz"))
+        self.assertFalse(oracle.has_changes("bar"))
+        self.assertFalse(oracle.has_changes("fo"))
+
+    def test_renamed(self):
+        """Count both paths of a renamed file as changed."""
+        self._repository.index.move(["bar/old_name.py", "foo/new_name.py"])
+        oracle = git_status.StatusOracle(self._repository)
+
+        self.assertTrue(oracle.has_changes("foo"))
+        self.assertTrue(oracle.has_changes("bar"))
+
+    def test_invalidate(self):
+        """Only run ``git status`` again after the oracle is invalidated."""
+        oracle = git_status.get_oracle(self._repository)
+        self.assertFalse(oracle.has_changes("foo"))
+
+        self._write("foo/package.py", "changed")
+        self.assertFalse(oracle.has_changes("foo"))
+
+        git_status.invalidate(self._repository)
+        self.assertTrue(oracle.has_changes("foo"))
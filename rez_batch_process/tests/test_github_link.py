@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Make sure that :mod:`.github_link` matches Rez package authors to GitHub users."""
+
+import unittest
+
+from rez_batch_process.core.gitter import github_link
+
+_USERS = [
+    github_link._User(  # pylint: disable=protected-access
+        "jdoe", "John Doe", "john@example.com", "Pipeline TD"
+    ),
+    github_link._User(  # pylint: disable=protected-access
+        "asmith", "Anna Smith", "anna.smith@example.com", ""
+    ),
+    github_link._User(  # pylint: disable=protected-access
+        "bob", "Robert Jones", "", "Maintainer of rez_utilities and friends"
+    ),
+    github_link._User("john", "Johnny", "", ""),  # pylint: disable=protected-access
+]
+
+
+def _convert_slowly(authors, users):
+    """list[str]: Match every author to a user by checking every user."""
+    output = []
+
+    for author in authors:
+        for user in users:
+            if user.login in author or user.name in author or author in user.bio:
+                output.append(user.login)
+
+                break
+
+    return output
+
+
+class Convert(unittest.TestCase):
+    """Match Rez package authors to GitHub users."""
+
+    def _test(self, authors, users=None):
+        """Check that the index finds the same users as a full search."""
+        users = users or _USERS
+
+        self.assertEqual(
+            _convert_slowly(authors, users),
+            github_link._convert_to_github_user_names(  # pylint: disable=protected-access
+                authors, github_link.UserIndex(users)
+            ),
+        )
+
+    def test_login(self):
+        """Find users whose login is part of the author."""
+        self._test(["jdoe", "asmith (asmith@example.com)", "john"])
+
+    def test_name(self):
+        """Find users whose name is part of the author."""
+        self._test(["Anna Smith", "Robert Jones <rjones@foo.com>"])
+
+    def test_bio(self):
+        """Find users whose bio contains the author."""
+        self._test(["rez_utilities", "TD", "Pipeline"])
+
+    def test_first_match(self):
+        """Prefer the first user if several users match."""
+        self._test(["john jdoe"])
+
+    def test_empty_name(self):
+        """Match users without a name, just like a full search does."""
+        self._test(
+            ["Someone Else"],
+            users=_USERS
+            + [
+                github_link._User(  # pylint: disable=protected-access
+                    "nobody", "", "", ""
+                )
+            ],
+        )
+
+    def test_email(self):
+        """Fall back to finding users with the same e-mail."""
+        self.assertEqual(
+            ["asmith"],
+            github_link._convert_to_github_user_names(  # pylint: disable=protected-access
+                ["A. S. (Anna.Smith@example.com)"], github_link.UserIndex(_USERS)
+            ),
+        )
+
+    def test_missing(self):
+        """Skip authors that don't match anyone."""
+        self.assertEqual(
+            [],
+            github_link._convert_to_github_user_names(  # pylint: disable=protected-access
+                ["Someone Else"], github_link.UserIndex(_USERS)
+            ),
+        )
@@ -0,0 +1,267 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Make sure that :mod:`.github_rest` talks to GitHub's REST API correctly."""
+
+import json
+import tempfile
+import threading
+import time
+
+from python_compatibility.testing import common
+from rez_batch_process.core.gitter import base_adapter, github_rest
+from six.moves import BaseHTTPServer
+
+_PREFIX = "/api/v3"
+
+
+class _Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+    """A fake GitHub Enterprise server which replies using pre-made responses."""
+
+    def _reply(self):
+        """Send the next queued response for this request's path."""
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or "null") if length else None
+        self.server.calls.append((self.command, self.path, body))
+
+        path = self.path.split("?")[0][len(_PREFIX) :]
+        responses = self.server.responses[(self.command, path)]
+        status, headers, data = responses.pop(0) if len(responses) > 1 else responses[0]
+
+        if (self.command, path) == ("GET", "/repos/foo/bar/contributors"):
+            if "page=2" in self.path:
+                data = [{"login": "second_page_contributor"}]
+            else:
+                headers = dict(headers)
+                headers["Link"] = (
+                    '<http://{host}{prefix}{path}?per_page=100&page=2>; rel="next", '
+                    '<http://{host}{prefix}{path}?per_page=100&page=2>; rel="last"'.format(
+                        host=self.headers["Host"], prefix=_PREFIX, path=path
+                    )
+                )
+
+        content = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+
+        for key, value in headers.items():
+            self.send_header(key, value)
+
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Reply to a GET request."""
+        self._reply()
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Reply to a POST request."""
+        self._reply()
+
+    def log_message(self, *_):  # pylint: disable=arguments-differ
+        """Keep the test output quiet."""
+
+
+class _Package(object):  # pylint: disable=too-few-public-methods
+    """A fake Rez package which only has authors."""
+
+    authors = ["Some Maintainer"]
+
+
+class CreatePullRequest(common.Common):
+    """Make pull requests against a local, fake GitHub server."""
+
+    def setUp(self):
+        """Start the fake server in a background thread."""
+        super(CreatePullRequest, self).setUp()
+
+        self._server = BaseHTTPServer.HTTPServer(("127.0.0.1", 0), _Handler)
+        self._server.calls = []
+        self._server.responses = {
+            ("GET", "/repos/foo/bar"): [(200, {}, {"owner": {"login": "owner"}})],
+            ("GET", "/repos/foo/bar/contributors"): [
+                (200, {}, [{"login": "contributor"}, {"login": "owner"}])
+            ],
+            ("POST", "/repos/foo/bar/pulls"): [(201, {}, {"number": 12})],
+            ("POST", "/repos/foo/bar/pulls/12/requested_reviewers"): [(201, {}, {})],
+            ("POST", "/repos/foo/bar/issues/12/assignees"): [(201, {}, {})],
+        }
+
+        thread = threading.Thread(target=self._server.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+        _, port = self._server.server_address
+        self._base_url = "http://127.0.0.1:{port}".format(port=port)
+
+        with tempfile.NamedTemporaryFile(
+            suffix=".json", mode="w", delete=False
+        ) as handler:
+            json.dump(
+                [
+                    {
+                        "login": "maintainer",
+                        "name": "Some Maintainer",
+                        "email": "",
+                        "bio": "",
+                    },
+                    {"login": "assigned", "name": "", "email": "", "bio": ""},
+                ],
+                handler,
+            )
+
+        self._users = handler.name
+        self.delete_item_later(self._users)
+
+    def tearDown(self):
+        """Stop the fake server."""
+        self._server.shutdown()
+        self._server.server_close()
+
+        super(CreatePullRequest, self).tearDown()
+
+    def _create(self):
+        """Make a pull request using a new adapter, without any real waiting."""
+        github_rest.get_session.cache_clear()
+        adapter = github_rest.GithubRestAdapter(
+            _Package(),
+            "some_token",
+            fallback_reviewers=["fallback"],
+            base_url=self._base_url,
+        )
+        adapter._session._backoff = 0  # pylint: disable=protected-access
+
+        adapter.create_pull_request(
+            "Some title",
+            "Some body",
+            base_adapter.PullRequestDetails(
+                "https://github.com/foo/bar.git", "feature", "master"
+            ),
+            user_data=self._users,
+            assignee="assigned",
+        )
+
+    def _get_body(self, method, path):
+        """Find the JSON that was sent for some request."""
+        return next(
+            body
+            for method_, path_, body in self._server.calls
+            if (method_, path_) == (method, _PREFIX + path)
+        )
+
+    def test_create(self):
+        """Create a pull request with reviewers and an assignee."""
+        self._create()
+
+        self.assertEqual(
+            {
+                "base": "master",
+                "body": "Some body",
+                "head": "feature",
+                "title": "Some title",
+            },
+            self._get_body("POST", "/repos/foo/bar/pulls"),
+        )
+        self.assertEqual(
+            {
+                "reviewers": [
+                    "maintainer",
+                    "owner",
+                    "contributor",
+                    "second_page_contributor",
+                    "fallback",
+                ]
+            },
+            self._get_body("POST", "/repos/foo/bar/pulls/12/requested_reviewers"),
+        )
+        self.assertEqual(
+            {"assignees": ["assigned"]},
+            self._get_body("POST", "/repos/foo/bar/issues/12/assignees"),
+        )
+
+    def test_rate_limit(self):
+        """Wait and retry after GitHub says that the rate limit was reached."""
+        self._server.responses[("POST", "/repos/foo/bar/pulls")] = [
+            (
+                403,
+                {
+                    "X-RateLimit-Remaining": "0",
+                    "X-RateLimit-Reset": str(int(time.time())),
+                },
+                {"message": "API rate limit exceeded"},
+            ),
+            (201, {}, {"number": 12}),
+        ]
+
+        self._create()
+
+        self.assertEqual(
+            2,
+            sum(
+                1
+                for call in self._server.calls
+                if call[:2] == ("POST", _PREFIX + "/repos/foo/bar/pulls")
+            ),
+        )
+
+    def test_retry(self):
+        """Retry requests which failed because of a server error."""
+        self._server.responses[
+            ("POST", "/repos/foo/bar/pulls/12/requested_reviewers")
+        ] = [
+            (502, {}, {}),
+            (503, {}, {}),
+            (201, {}, {}),
+        ]
+
+        self._create()
+
+        self.assertEqual(
+            3,
+            sum(
+                1
+                for call in self._server.calls
+                if call[:2]
+                == ("POST", _PREFIX + "/repos/foo/bar/pulls/12/requested_reviewers")
+            ),
+        )
+
+    def test_already_exists(self):
+        """Don't add reviewers if the pull request could not be created."""
+        self._server.responses[("POST", "/repos/foo/bar/pulls")] = [
+            (422, {}, {"message": "A pull request already exists"})
+        ]
+
+        self._create()
+
+        self.assertFalse(
+            any("requested_reviewers" in path for _, path, _ in self._server.calls)
+        )
+
+    def test_reviewer_failure(self):
+        """Keep going if reviewers can't be added to a created pull request."""
+        self._server.responses[
+            ("POST", "/repos/foo/bar/pulls/12/requested_reviewers")
+        ] = [
+            (
+                422,
+                {},
+                {"message": "Review cannot be requested from pull request author."},
+            )
+        ]
+
+        self._create()
+
+        self.assertEqual(
+            {"assignees": ["assigned"]},
+            self._get_body("POST", "/repos/foo/bar/issues/12/assignees"),
+        )
+
+    def test_failure(self):
+        """Raise an exception if GitHub rejects the pull request for other reasons."""
+        self._server.responses[("POST", "/repos/foo/bar/pulls")] = [
+            (404, {}, {"message": "Not Found"})
+        ]
+
+        with self.assertRaises(github_rest.RequestError):
+            self._create()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Make sure that :mod:`.github_user` writes and refreshes cached GitHub users."""
+
+import json
+import os
+import tempfile
+
+from python_compatibility.testing import common
+from rez_batch_process.core.gitter import github_link, github_user, user_cache
+from six.moves import mock
+
+
+def _make_user(identifier):
+    """dict[str, object]: Make some fake GitHub user data."""
+    return {
+        "bio": "",
+        "email": "",
+        "id": identifier,
+        "login": "user_{identifier}".format(identifier=identifier),
+        "name": "",
+    }
+
+
+class WriteCache(common.Common):
+    """Write and update cache files."""
+
+    def _make_path(self):
+        """str: Get a file path, which doesn't exist yet, to write a cache to."""
+        directory = tempfile.mkdtemp(suffix="_github_user")
+        self.delete_item_later(directory)
+
+        return os.path.join(directory, "users.jsonl")
+
+    def test_write(self):
+        """Write every user to a new file."""
+        path = self._make_path()
+
+        with mock.patch.object(
+            github_link, "query_users", return_value=[_make_user(1), _make_user(4)]
+        ) as query:
+            github_user.write_cache(path, "token")
+
+        self.assertEqual(0, query.call_args[1]["since"])
+        self.assertEqual(([_make_user(1), _make_user(4)], 4), user_cache.read(path))
+
+    def test_update(self):
+        """Only download and add users which are newer than the cache."""
+        path = self._make_path()
+        user_cache.write(path, [_make_user(1), _make_user(4)], 4)
+
+        with mock.patch.object(
+            github_link, "query_users", return_value=[_make_user(7)]
+        ) as query:
+            github_user.write_cache(path, "token", update=True)
+
+        self.assertEqual(4, query.call_args[1]["since"])
+        self.assertEqual(
+            ([_make_user(1), _make_user(4), _make_user(7)], 7), user_cache.read(path)
+        )
+        self.assertEqual(
+            ["user_1", "user_4", "user_7"],
+            [
+                user.login
+                for user in github_link._read_users_from_cache(  # pylint: disable=protected-access
+                    path
+                )
+            ],
+        )
+
+    def test_update_nothing_new(self):
+        """Keep the cache's cursor if there are no new users."""
+        path = self._make_path()
+        user_cache.write(path, [_make_user(1)], 1)
+
+        with mock.patch.object(github_link, "query_users", return_value=[]):
+            github_user.write_cache(path, "token", update=True)
+
+        self.assertEqual(([_make_user(1)], 1), user_cache.read(path))
+
+    def test_update_old_format(self):
+        """Replace older JSON caches because they don't know which users were downloaded."""
+        path = self._make_path()
+
+        with open(path, "w") as handler:
+            json.dump([_make_user(1)], handler)
+
+        self.assertEqual(([_make_user(1)], None), user_cache.read(path))
+
+        with mock.patch.object(
+            github_link, "query_users", return_value=[_make_user(1), _make_user(2)]
+        ) as query:
+            github_user.write_cache(path, "token", update=True)
+
+        self.assertEqual(0, query.call_args[1]["since"])
+        self.assertEqual(([_make_user(1), _make_user(2)], 2), user_cache.read(path))
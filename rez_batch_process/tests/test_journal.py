@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Make sure that :mod:`.journal` records runs and lets them be resumed."""
+
+import collections
+import os
+import tempfile
+
+from python_compatibility.testing import common
+from rez_batch_process.core import journal, worker
+from six.moves import mock
+
+from . import package_common
+
+_Package = collections.namedtuple("_Package", "name version")
+
+
+class Journal(common.Common):
+    """Record the state of Rez packages."""
+
+    def setUp(self):
+        """Make a folder for the journals of each test."""
+        super(Journal, self).setUp()
+
+        self._directory = tempfile.mkdtemp(suffix="_journal")
+        self.delete_item_later(self._directory)
+
+        patcher = mock.patch.object(
+            journal.finder, "get_package_root", side_effect=lambda package: ""
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_record(self):
+        """Keep the latest state of each package."""
+        journal_ = journal.create(self._directory)
+        package = _Package("foo", "1.0.0")
+
+        self.assertEqual("", journal_.get_state(package))
+
+        journal_.add([package])
+        self.assertEqual(journal.DISCOVERED, journal_.get_state(package))
+
+        journal_.record(package, journal.PUSHED)
+        self.assertFalse(journal_.is_finished(package))
+
+        journal_.record(package, journal.PR_CREATED)
+        self.assertTrue(journal_.is_finished(package))
+
+    def test_add_keeps_state(self):
+        """Don't reset packages which an earlier run already got through."""
+        journal_ = journal.create(self._directory)
+        package = _Package("foo", "1.0.0")
+        journal_.record(package, journal.FINISHED)
+        journal_.add([package, _Package("bar", "2.0.0")])
+
+        self.assertEqual(journal.FINISHED, journal_.get_state(package))
+        self.assertEqual(
+            journal.DISCOVERED, journal_.get_state(_Package("bar", "2.0.0"))
+        )
+
+    def test_resume(self):
+        """Read the state that an earlier run wrote."""
+        package = _Package("foo", "1.0.0")
+        first = journal.create(self._directory)
+        first.record(package, journal.FINISHED)
+        second = journal.create(self._directory)
+
+        self.assertTrue(journal.get(self._directory, first.run_id).is_finished(package))
+        self.assertEqual(
+            "", journal.get(self._directory, second.run_id).get_state(package)
+        )
+
+    def test_delete(self):
+        """Don't leave a finished run's journal behind."""
+        journal_ = journal.create(self._directory)
+        journal_.record(_Package("foo", "1.0.0"), journal.FINISHED)
+        journal_.delete()
+
+        with self.assertRaises(ValueError):
+            journal.get(self._directory, journal_.run_id)
+
+    def test_missing(self):
+        """Fail early if the run to resume has no journal."""
+        with self.assertRaises(ValueError):
+            journal.get(self._directory, "does_not_exist")
+
+
+class Run(common.Common):
+    """Make sure that :func:`.worker.run` skips packages which already finished."""
+
+    def test_skip_finished(self):
+        """Only run on packages which did not finish in an earlier run."""
+        directory = tempfile.mkdtemp(suffix="_journal")
+        self.delete_item_later(directory)
+
+        done = _Package("done", "1.0.0")
+        not_done = _Package("not_done", "1.0.0")
+
+        with mock.patch.object(journal.finder, "get_package_root", return_value=""):
+            journal_ = journal.create(directory)
+            journal_.record(done, journal.PR_CREATED)
+            journal_.record(not_done, journal.PUSHED)
+
+            with mock.patch.object(
+                worker, "report", return_value=([done, not_done], [])
+            ), mock.patch.object(
+                worker.rez_git, "get_repository_url", return_value="url"
+            ), mock.patch.object(
+                worker, "_run_repository", return_value=({not_done}, set(), "")
+            ) as run_repository:
+                ran, un_ran, _ = worker.run(
+                    lambda package: "", [done, not_done], journal=journal_
+                )
+
+        self.assertEqual({done, not_done}, ran)
+        self.assertEqual(set(), un_ran)
+        self.assertEqual({not_done}, run_repository.call_args[0][2])
+        self.assertIsNone(journal.get_active())
+
+    def test_resume_newer_version(self):
+        """Skip finished packages whose repository has a different version than the release."""
+        root = tempfile.mkdtemp(suffix="_journal")
+        self.delete_item_later(root)
+        repository, _, remote_root = package_common.make_fake_repository(
+            [
+                package_common.make_package(
+                    "project_a", root, package_common.make_source_python_package
+                )
+            ],
+            root,
+        )
+        self.delete_item_later(os.path.dirname(repository.working_dir))
+        self.delete_item_later(remote_root)
+
+        released = _Package("project_a", "0.9.0")
+        get_package_root = journal.finder.get_package_root
+
+        def _finish(package):
+            # Like :class:`.RezShellCommand`, record the package that was changed
+            journal.record(package, journal.PR_CREATED)
+
+            return ""
+
+        runner = mock.MagicMock(side_effect=_finish)
+
+        with mock.patch.object(
+            journal.finder,
+            "get_package_root",
+            side_effect=lambda package: ""
+            if package is released
+            else get_package_root(package),
+        ), mock.patch.object(
+            worker, "report", return_value=([released], [])
+        ), mock.patch.object(
+            worker.rez_git, "get_repository_url", return_value=remote_root
+        ):
+            journal_ = journal.create(root)
+            worker.run(runner, [released], journal=journal_)
+            ran, un_ran, _ = worker.run(
+                runner, [released], journal=journal.get(root, journal_.run_id)
+            )
+
+        self.assertEqual(1, runner.call_count)
+        self.assertEqual("1.0.0", str(runner.call_args[0][0].version))
+        self.assertEqual({released}, ran)
+        self.assertEqual(set(), un_ran)
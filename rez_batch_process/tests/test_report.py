@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Make sure that :func:`.worker.iter_report` streams packages and stops at its limits."""
+
+import collections
+import unittest
+
+from rez_batch_process.core import exceptions, worker
+from six.moves import mock
+
+_Package = collections.namedtuple("_Package", "name repository")
+
+
+def _get_repository_url(package):
+    """str: Get the fake repository of `package` or raise an exception if it has none."""
+    if not package.repository:
+        raise exceptions.NoRepositoryRemote("No remote.")
+
+    return package.repository
+
+
+class IterReport(unittest.TestCase):
+    """Check the packages that :func:`.worker.iter_report` yields."""
+
+    def setUp(self):
+        """Replace repository lookups with fake ones."""
+        super(IterReport, self).setUp()
+
+        for patcher in (
+            mock.patch.object(
+                worker.rez_git, "get_repository_url", side_effect=_get_repository_url
+            ),
+            mock.patch.object(
+                worker.finder, "get_package_root", side_effect=lambda package: ""
+            ),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _report(self, packages, **kwargs):
+        """list[tuple[str, str]]: The status and name of every yielded package."""
+        return [
+            (classification.status, classification.package.name)
+            for classification in worker.iter_report(packages, **kwargs)
+        ]
+
+    def test_streaming(self):
+        """Yield invalid and valid packages in the order they are found."""
+        packages = [_Package("a", "foo"), _Package("b", ""), _Package("c", "bar")]
+
+        self.assertEqual(
+            [(worker.NEEDS_RUN, "a"), (worker.INVALID, "b"), (worker.NEEDS_RUN, "c")],
+            self._report(packages),
+        )
+
+    def test_lazy(self):
+        """Don't check packages which come after the maximum."""
+        packages = iter([_Package("a", "foo"), _Package("b", "foo")])
+
+        self.assertEqual(
+            [(worker.NEEDS_RUN, "a")], self._report(packages, maximum_rez_packages=1)
+        )
+        self.assertEqual(_Package("b", "foo"), next(packages))
+
+    def test_maximum_rez_packages(self):
+        """Stop at exactly the maximum number of packages."""
+        packages = [_Package(name, "foo") for name in "abcd"]
+
+        self.assertEqual(
+            [(worker.NEEDS_RUN, "a"), (worker.NEEDS_RUN, "b")],
+            self._report(packages, maximum_rez_packages=2),
+        )
+
+    def test_maximum_repositories(self):
+        """Count unique repositories and stop before one repository too many."""
+        packages = [
+            _Package("a", "foo"),
+            _Package("b", "foo"),
+            _Package("c", "bar"),
+            _Package("d", "fizz"),
+        ]
+
+        self.assertEqual(
+            [(worker.NEEDS_RUN, "a"), (worker.NEEDS_RUN, "b"), (worker.NEEDS_RUN, "c")],
+            self._report(packages, maximum_repositories=2),
+        )
+
+
+class IterFoundReport(IterReport):
+    """Check the packages that :func:`.worker.iter_found_report` yields."""
+
+    def _report(self, packages, **kwargs):
+        """list[tuple[str, str]]: The status and name of every yielded package."""
+        return [
+            (classification.status, classification.package.name)
+            for classification in worker.iter_found_report(
+                (
+                    worker.Classification(worker.FOUND, package, None)
+                    for package in packages
+                ),
+                **kwargs
+            )
+        ]
+
+    def test_finder_streaming(self):
+        """Yield each package before the package finder finds the next one."""
+        found = []
+
+        def _find():
+            for name in "ab":
+                found.append(name)
+
+                yield worker.Classification(worker.FOUND, _Package(name, "foo"), None)
+
+            skip = worker.Skip(_Package("c", "foo"), "", "Some reason.")
+            found.append("c")
+
+            yield worker.Classification(worker.SKIPPED, skip.package, skip)
+
+        classifications = worker.iter_found_report(_find())
+
+        self.assertEqual(worker.NEEDS_RUN, next(classifications).status)
+        self.assertEqual(["a"], found)
+        self.assertEqual(worker.NEEDS_RUN, next(classifications).status)
+        self.assertEqual(["a", "b"], found)
+        self.assertEqual(worker.SKIPPED, next(classifications).status)
+        self.assertEqual(["a", "b", "c"], found)
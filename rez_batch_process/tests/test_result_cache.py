@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Make sure that :mod:`.result_cache` skips Rez packages which a command didn't change."""
+
+import argparse
+import os
+import tempfile
+
+import git
+from python_compatibility.testing import common
+from rez_batch_process.core import result_cache, rez_git
+from rez_batch_process.core.plugins import command
+from six.moves import mock
+
+
+class _Package(object):  # pylint: disable=too-few-public-methods
+    """A fake Rez package which only knows its name and root folder."""
+
+    def __init__(self, name, root):
+        """Keep track of the package's name and folder."""
+        super(_Package, self).__init__()
+
+        self.name = name
+        self.root = root
+
+
+class ResultCache(common.Common):
+    """Skip Rez packages whose result is already known."""
+
+    def setUp(self):
+        """Make a git repository with one Rez package inside of it."""
+        super(ResultCache, self).setUp()
+
+        rez_git.clear_caches()
+        patcher = mock.patch.object(
+            result_cache.finder,
+            "get_package_root",
+            side_effect=lambda package: package.root,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        root = tempfile.mkdtemp(suffix="_result_cache_repository")
+        self.delete_item_later(root)
+        self._repository = git.Repo.init(root)
+        self._package = _Package("foo", os.path.join(root, "foo"))
+        os.makedirs(self._package.root)
+        self._write("package.py", 'name = "foo"')
+
+        self._cache = tempfile.mkdtemp(suffix="_result_cache")
+        self.delete_item_later(self._cache)
+        result_cache.set_active(result_cache.ResultCache(self._cache))
+        self.addCleanup(result_cache.set_active, None)
+
+    def _write(self, name, text):
+        """Add a file to the Rez package and commit it."""
+        path = os.path.join(self._package.root, name)
+
+        with open(path, "w") as handler:
+            handler.write(text)
+
+        self._repository.index.add([path])
+        self._repository.index.commit("Added " + name)
+
+    def _get_arguments(self, text="true"):
+        """:class:`argparse.Namespace`: Make the arguments of a shell command."""
+        return argparse.Namespace(command=text, exit_on_error=False, token="abc")
+
+    def test_key(self):
+        """Change the key whenever the package, command, or arguments change."""
+        key = result_cache.get_key(self._package, self._get_arguments())
+
+        self.assertEqual(
+            key, result_cache.get_key(self._package, self._get_arguments())
+        )
+        self.assertNotEqual(
+            key, result_cache.get_key(self._package, self._get_arguments("ls"))
+        )
+
+        arguments = self._get_arguments()
+        arguments.token = "another_token"
+        self.assertEqual(key, result_cache.get_key(self._package, arguments))
+
+        arguments.exit_on_error = True
+        self.assertNotEqual(key, result_cache.get_key(self._package, arguments))
+
+        self._write("README.md", "Some text")
+        self.assertNotEqual(
+            key, result_cache.get_key(self._package, self._get_arguments())
+        )
+
+    def test_skip_unchanged(self):
+        """Don't run a command again if it changed nothing the last time."""
+        arguments = self._get_arguments()
+        first = command.RezShellCommand._run_command(  # pylint: disable=protected-access
+            self._package, arguments
+        )
+
+        with mock.patch.object(command.subprocess_pool, "get_pool") as get_pool:
+            second = command.RezShellCommand._run_command(  # pylint: disable=protected-access
+                self._package, arguments
+            )
+
+        self.assertEqual(first, second)
+        self.assertIn("nothing on-disk changed", second)
+        self.assertFalse(get_pool.called)
+
+    def test_run_changed(self):
+        """Run the command again once the package's files change."""
+        arguments = self._get_arguments()
+        command.RezShellCommand._run_command(  # pylint: disable=protected-access
+            self._package, arguments
+        )
+        self._write("README.md", "Some text")
+
+        self.assertFalse(
+            result_cache.ResultCache(self._cache).is_unchanged(
+                result_cache.get_key(self._package, arguments)
+            )
+        )
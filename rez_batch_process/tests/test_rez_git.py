@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Make sure that :mod:`.rez_git` finds and caches the repositories of Rez packages."""
+
+import os
+import tempfile
+
+import git
+from python_compatibility.testing import common
+from rez_batch_process.core import exceptions, rez_git
+from six.moves import mock
+
+
+class _Package(object):  # pylint: disable=too-few-public-methods
+    """A fake, unreleased Rez package which only knows its root folder."""
+
+    def __init__(self, root):
+        """Keep track of the package's folder."""
+        super(_Package, self).__init__()
+
+        self.root = root
+
+
+class GetRepository(common.Common):
+    """Find and cache git repositories."""
+
+    def setUp(self):
+        """Start every test with empty caches and fake package roots."""
+        super(GetRepository, self).setUp()
+
+        rez_git.clear_caches()
+        patcher = mock.patch.object(
+            rez_git.finder, "get_package_root", side_effect=lambda package: package.root
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _make_directory(self):
+        """str: Make a temporary folder which is deleted after the test."""
+        directory = tempfile.mkdtemp(suffix="_rez_git")
+        self.delete_item_later(directory)
+
+        return directory
+
+    def test_shared(self):
+        """Re-use the same repository for packages which live in one repository."""
+        root = self._make_directory()
+        repository = git.Repo.init(root)
+        repository.create_remote("origin", url="https://github.com/foo/bar.git")
+
+        first = os.path.join(root, "first")
+        second = os.path.join(root, "nested", "second")
+        os.makedirs(first)
+        os.makedirs(second)
+
+        self.assertIs(
+            rez_git.get_repository(_Package(first)),
+            rez_git.get_repository(_Package(second)),
+        )
+        self.assertEqual(
+            "https://github.com/foo/bar.git",
+            rez_git.get_repository_url(_Package(second)),
+        )
+
+    def test_missing(self):
+        """Only search for missing repositories once."""
+        package = _Package(self._make_directory())
+
+        with mock.patch.object(
+            rez_git,
+            "_guess_repository_from_symlinks",
+            side_effect=RuntimeError("No symlinks"),
+        ) as guess:
+            for _ in range(2):
+                with self.assertRaises(exceptions.NoGitRepository):
+                    rez_git.get_repository(package)
+
+        self.assertEqual(1, guess.call_count)
+
+    def test_many(self):
+        """Keep every package's repository, even for runs with hundreds of packages."""
+        root = self._make_directory()
+        git.Repo.init(root)
+        packages = []
+
+        for index in range(300):
+            path = os.path.join(root, "package_{index}".format(index=index))
+            os.makedirs(path)
+            packages.append(_Package(path))
+
+        for package in packages:
+            rez_git.get_repository(package)
+
+        with mock.patch.object(
+            rez_git,
+            "_find_top_directory",
+            wraps=rez_git._find_top_directory,  # pylint: disable=protected-access
+        ) as find_top_directory:
+            for package in packages:
+                rez_git.get_repository(package)
+
+        self.assertFalse(find_top_directory.called)
+
+    def test_forget(self):
+        """Drop the repositories of a folder once it's no longer needed."""
+        clone = self._make_directory()
+        other = self._make_directory()
+        git.Repo.init(clone)
+        git.Repo.init(other)
+        package = _Package(clone)
+        other_package = _Package(other)
+        repository = rez_git.get_repository(package)
+        other_repository = rez_git.get_repository(other_package)
+
+        with mock.patch.object(repository, "close") as close:
+            rez_git.forget(clone)
+
+        self.assertTrue(close.called)
+        self.assertIsNot(repository, rez_git.get_repository(package))
+        self.assertIs(other_repository, rez_git.get_repository(other_package))
@@ -7,6 +7,7 @@
 
 """
 
+import functools
 import logging
 import os
 import tempfile
@@ -16,7 +17,7 @@ import git
 import wurlitzer
 from rez import packages_
 from rez.config import config
-from rez_batch_process.core import exceptions, worker
+from rez_batch_process.core import exceptions, registry, worker
 from rez_utilities import creator, finder, inspection, rez_configuration
 from six.moves import mock
 
@@ -242,6 +243,89 @@ class Fix(package_common.Tests):
 
         self.assertEqual(7, run_command.call_count)
 
+    def _run_in_parallel(self):
+        """Run a command on Rez packages from 2 repositories, at the same time.
+
+        Returns:
+            tuple[set, set, list]: The ran, un-ran, and invalid Rez packages.
+
+        """
+        paths = []
+
+        for name in ("project_a", "project_b"):
+            root = os.path.join(tempfile.mkdtemp(), "test_folder")
+            os.makedirs(root)
+            self.delete_item_later(root)
+
+            repository, _, remote_root = package_common.make_fake_repository(
+                [
+                    package_common.make_package(
+                        name, root, package_common.make_source_python_package
+                    )
+                ],
+                root,
+            )
+            self.delete_item_later(repository.working_dir)
+            self.delete_item_later(remote_root)
+            paths.append(repository.working_dir)
+
+        arguments = mock.MagicMock()
+        arguments.command = "echo 'foo'"
+
+        with rez_configuration.patch_packages_path(paths):
+            packages, _, _ = registry.get_package_finder("shell")(paths=paths)
+
+            return worker.run(
+                functools.partial(
+                    registry.get_command("shell").run, arguments=arguments
+                ),
+                packages,
+                jobs=2,
+            )
+
+    @mock.patch("rez_batch_process.core.plugins.command.RezShellCommand.run")
+    def test_multiple_jobs(self, run_command):
+        """Run command on Rez packages from 2 repositories, at the same time.
+
+        Args:
+            run_command (:class:`mock.MagicMock`):
+                A replacement for the function that would normally run
+                as part of the commands that run on a Rez package.
+
+        """
+        run_command.return_value = ""
+        ran, un_ran, invalids = self._run_in_parallel()
+
+        self.assertEqual(
+            ["project_a", "project_b"], sorted(package.name for package in ran)
+        )
+        self.assertEqual(set(), un_ran)
+        self.assertEqual([], invalids)
+
+    @mock.patch("rez_batch_process.core.plugins.command.RezShellCommand.run")
+    def test_multiple_jobs_errors(self, run_command):
+        """Return the same error types from parallel runs as from serial runs.
+
+        Args:
+            run_command (:class:`mock.MagicMock`):
+                A replacement for the function that would normally run
+                as part of the commands that run on a Rez package.
+
+        """
+        run_command.side_effect = exceptions.CoreException("Some error.")
+        ran, un_ran, _ = self._run_in_parallel()
+
+        self.assertEqual(set(), ran)
+        self.assertEqual(
+            [
+                ("project_a", exceptions.CoreException, "Some error."),
+                ("project_b", exceptions.CoreException, "Some error."),
+            ],
+            sorted(
+                (package.name, type(error), str(error)) for package, error in un_ran
+            ),
+        )
+
     @mock.patch(
         "rez_batch_process.core.plugins.command.RezShellCommand._create_pull_request"
     )
@@ -274,6 +358,70 @@ class Fix(package_common.Tests):
             self.assertEqual([], invalids)
             self.assertEqual([], skips)
 
+    def test_packages_at_once(self):
+        """Run the Rez packages of one repository at the same time, then push them in order."""
+        root = os.path.join(tempfile.mkdtemp(), "test_folder")
+        os.makedirs(root)
+        self.delete_item_later(root)
+        started = tempfile.mkdtemp(suffix="_started")
+        self.delete_item_later(started)
+
+        repository, _, remote_root = package_common.make_fake_repository(
+            [
+                package_common.make_package(
+                    name, root, package_common.make_source_python_package
+                )
+                for name in ("project_a", "project_b")
+            ],
+            root,
+        )
+        self.delete_item_later(repository.working_dir)
+        self.delete_item_later(remote_root)
+        paths = [repository.working_dir]
+
+        # Each command waits for the other one to start. If they ran one
+        # at a time, the first command would time out.
+        #
+        arguments = mock.MagicMock()
+        arguments.command = (
+            'touch "{started}/$(basename $PWD)"; '
+            'while [ $(ls "{started}" | wc -l) -lt 2 ]; do sleep 0.05; done; '
+            "touch new_file.txt".format(started=started)
+        )
+        pushes = []
+
+        def _push(package, *_, **__):
+            repository_ = git.Repo(
+                finder.get_package_root(package), search_parent_directories=True
+            )
+            pushes.append((package.name, sorted(repository_.untracked_files)))
+
+        with rez_configuration.patch_packages_path(paths), mock.patch.object(
+            registry.get_command("shell"), "_push_pull_request", side_effect=_push
+        ):
+            packages, _, _ = registry.get_package_finder("shell")(paths=paths)
+            ran, un_ran, _ = worker.run(
+                functools.partial(
+                    registry.get_command("shell").run, arguments=arguments
+                ),
+                packages,
+                command_jobs=2,
+                command_timeout=10,
+                concurrent_packages=True,
+            )
+
+        self.assertEqual(set(), un_ran)
+        self.assertEqual(
+            ["project_a", "project_b"], sorted(package.name for package in ran)
+        )
+        self.assertEqual(
+            [
+                ("project_a", ["project_a/new_file.txt"]),
+                ("project_b", ["project_b/new_file.txt"]),
+            ],
+            pushes,
+        )
+
 
 class Variations(package_common.Tests):
     """Check that different types of Rez packages execute correctly.
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Make sure that :mod:`.subprocess_pool` runs, limits, and stops shell commands."""
+
+import os
+import tempfile
+import time
+import unittest
+from multiprocessing import pool as multiprocessing_pool
+
+from rez_batch_process.core import subprocess_pool
+
+
+class Run(unittest.TestCase):
+    """Run shell commands in a :class:`.SubprocessPool`."""
+
+    def test_output(self):
+        """Capture the exit code and output of a command."""
+        result = subprocess_pool.SubprocessPool(1).run("echo foo; echo bar >&2; exit 3")
+
+        self.assertEqual(subprocess_pool.Result(3, "foo\n", "bar\n", False), result)
+
+    def test_directory(self):
+        """Run the command from the given folder."""
+        directory = tempfile.gettempdir()
+        result = subprocess_pool.SubprocessPool(1).run("pwd -P", directory=directory)
+
+        self.assertEqual(os.path.realpath(directory), result.stdout.strip())
+
+    def test_timeout(self):
+        """Stop commands, and anything that they start, which run for too long."""
+        start = time.time()
+        result = subprocess_pool.SubprocessPool(1).run("sleep 30 | cat", timeout=0.5)
+
+        self.assertTrue(result.timed_out)
+        self.assertLess(time.time() - start, 10)
+
+    def test_default_timeout(self):
+        """Stop commands using the pool's timeout, if no other timeout is given."""
+        result = subprocess_pool.SubprocessPool(1, timeout=0.5).run("sleep 30 | cat")
+
+        self.assertTrue(result.timed_out)
+
+    def test_bad_encoding(self):
+        """Keep reading output which isn't UTF-8 instead of hanging."""
+        result = subprocess_pool.SubprocessPool(1).run(
+            "printf 'foo\\377\\n'; printf '\\376bar\\n' >&2; echo fizz"
+        )
+
+        self.assertEqual(0, result.returncode)
+        self.assertEqual(u"foo\ufffd\nfizz\n", result.stdout)
+        self.assertEqual(u"\ufffdbar\n", result.stderr)
+
+    def test_limit(self):
+        """Never run more commands at once than the pool's size."""
+        pool = subprocess_pool.SubprocessPool(1)
+        threads = multiprocessing_pool.ThreadPool(3)
+        start = time.time()
+
+        try:
+            results = threads.map(lambda _: pool.run("sleep 0.3"), range(3))
+        finally:
+            threads.close()
+            threads.join()
+
+        self.assertEqual([0, 0, 0], [result.returncode for result in results])
+        self.assertGreaterEqual(time.time() - start, 0.9)
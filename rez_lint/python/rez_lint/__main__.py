@@ -13,7 +13,7 @@ import os
 import sys
 
 from . import cli
-from .core import exceptions, exit_code, message_description
+from .core import exceptions, exit_code, message_description, package_discovery
 
 _LOGGER = logging.getLogger("rez_lint")
 __HANDLER = logging.StreamHandler(stream=sys.stdout)
@@ -78,6 +78,31 @@ def _parse_arguments(text):
         help="Enable this flag to search for all Rez packages under the given --folder.",
     )
 
+    parser.add_argument(
+        "-i",
+        "--ignore",
+        default=",".join(package_discovery.DEFAULT_IGNORE_PATTERNS),
+        help="A comma-separated list of folder name glob patterns "
+        "which --recursive will not search.",
+    )
+
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Save the issues of each Rez package and re-use them if the package "
+        "hasn't changed. Issues are saved in $REZ_LINT_CACHE_DIRECTORY "
+        "or ~/.cache/rez_lint.",
+    )
+
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="The number of Rez packages to check at the same time. "
+        "Use 0 to use every CPU.",
+    )
+
     parser.add_argument(
         "-c",
         "--concise",
@@ -111,26 +136,29 @@ def _resolve_arguments(arguments):
         arguments (:class:`argparse.Namespace`): The parsed user input.
 
     Returns:
-        tuple[str, set[str]]:
-            The absolute folder where to search for Rez package(s) and
-            every issue code that will be ignored from the final report.
+        tuple[str, set[str], set[str]]:
+            The absolute folder where to search for Rez package(s),
+            every issue code that will be ignored from the final report,
+            and every folder name pattern that won't be searched.
 
     """
     rules = (rule.lstrip() for rule in arguments.disable.split(","))
     rules = set(filter(None, rules))
+    ignore_patterns = (pattern.strip() for pattern in arguments.ignore.split(","))
+    ignore_patterns = set(filter(None, ignore_patterns))
 
     folder = arguments.folder
 
     if not os.path.isabs(folder):
         folder = os.path.normpath(os.path.join(os.getcwd(), folder))
 
-    return folder, rules
+    return folder, rules, ignore_patterns
 
 
 def main():
     """Run the main execution of the current script."""
     arguments = _parse_arguments(sys.argv[1:])
-    folder, disable = _resolve_arguments(arguments)
+    folder, disable, ignore_patterns = _resolve_arguments(arguments)
 
     _LOGGER.setLevel(_get_log_level(arguments.verbose))
 
@@ -140,6 +168,9 @@ def main():
             disable=disable,
             recursive=arguments.recursive,
             verbose=not arguments.concise,
+            jobs=arguments.jobs,
+            ignore_patterns=ignore_patterns,
+            cache=arguments.cache,
         )
     except exceptions.NoPackageFound as error:
         print(str(error), file=sys.stderr)
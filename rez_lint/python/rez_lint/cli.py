@@ -3,9 +3,11 @@
 
 """The main module that prints lint messages to the user."""
 
+import collections
 import importlib
 import itertools
 import logging
+import multiprocessing
 import operator
 import os
 
@@ -13,8 +15,16 @@ from python_compatibility import wrapping
 from rez import exceptions as rez_exceptions
 from rez import packages_
 from rez.vendor.schema import schema
-
-from .core import exceptions, message_description, registry
+from rez_utilities import url_help
+
+from .core import (
+    exceptions,
+    lint_cache,
+    message_description,
+    package_discovery,
+    registry,
+    url_prober,
+)
 from .plugins import check_context
 from .plugins.checkers import (
     base_checker,
@@ -25,9 +35,49 @@ from .plugins.checkers import (
 )
 from .plugins.contexts import base_context, packaging, parsing
 
+try:
+    from functools import lru_cache  # python 3
+except ImportError:
+    from backports.functools_lru_cache import lru_cache  # python 2
+
+_DIRECTORIES = []
 _LOGGER = logging.getLogger(__name__)
 
 
+class _PackageSequence(collections.Sequence):  # pylint: disable=too-few-public-methods
+    """A list of Rez packages which are only loaded once they're needed.
+
+    Worker processes use this class so that each package doesn't have
+    to load every package that was processed before it.
+
+    """
+
+    def __init__(self, directories):
+        """Keep track of the Rez packages to load.
+
+        Args:
+            directories (list[str]): The folder of each Rez package, in order.
+
+        """
+        super(_PackageSequence, self).__init__()
+
+        self._directories = directories
+
+    def __getitem__(self, index):
+        """:class:`rez.packages_.DeveloperPackage`: Load the Rez package(s) at `index`."""
+        if isinstance(index, slice):
+            return [
+                _get_developer_package(directory)
+                for directory in self._directories[index]
+            ]
+
+        return _get_developer_package(self._directories[index])
+
+    def __len__(self):
+        """int: Get the number of Rez packages in this instance."""
+        return len(self._directories)
+
+
 def _search_current_folder(directory):
     """Find the user's Rez package or die trying.
 
@@ -62,7 +112,11 @@ def _search_current_folder(directory):
     )
 
 
-def _find_rez_packages(directory, recursive=False):
+def _find_rez_packages(
+    directory,
+    recursive=False,
+    ignore_patterns=package_discovery.DEFAULT_IGNORE_PATTERNS,
+):
     """Get every Rez package starting from the current directory.
 
     Args:
@@ -73,6 +127,10 @@ def _find_rez_packages(directory, recursive=False):
             If False, only get the Rez package in the current folder. If
             True, get all Rez packages found on-or-below `directory`.
             Default is False.
+        ignore_patterns (iter[str], optional):
+            If `recursive` is True, never search folders whose name
+            matches any of these glob patterns.
+            Default: :attr:`.DEFAULT_IGNORE_PATTERNS`.
 
     Raises:
         :class:`.NoPackageFound`: If No Rez package could be found.
@@ -100,14 +158,15 @@ def _find_rez_packages(directory, recursive=False):
 
         return {package}, set()
 
-    packages, invalids = _get_safe_package(directory)
+    packages = set()
+    invalids = set()
 
-    for root, folders, _ in os.walk(directory):
-        for folder in folders:
-            path = os.path.join(root, folder)
-            inner_packages, invalids_ = _get_safe_package(path)
-            packages.update(inner_packages)
-            invalids.update(invalids_)
+    for path in package_discovery.iter_package_directories(
+        directory, ignore_patterns=ignore_patterns
+    ):
+        inner_packages, invalids_ = _get_safe_package(path)
+        packages.update(inner_packages)
+        invalids.update(invalids_)
 
     if not packages and not invalids:
         raise exceptions.NoPackageFound(
@@ -185,8 +244,283 @@ def _register_internal_plugins():
     registry.register_context(parsing.ParsePackageDefinition)
 
 
-def lint(
-    directory, disable=frozenset(), vimgrep=False, recursive=False, verbose=False,
+def _get_package_directory(package):
+    """str: Find the folder on-disk which defines a Rez package."""
+    return os.path.dirname(package.filepath)
+
+
+@lru_cache()
+def _get_developer_package(directory):
+    """:class:`rez.packages_.DeveloperPackage`: Load (and cache) the Rez package in `directory`."""
+    return packages_.get_developer_package(directory)
+
+
+def _get_provided_keys(plugin):
+    """set[str]: Get the keys that a context plugin adds, if it says."""
+    return set(getattr(plugin, "get_provided_keys", set)())
+
+
+def _get_providers(contexts):
+    """Find the context plugin which adds each key.
+
+    Args:
+        contexts (iter[:class:`.BaseContext`]):
+            Every context plugin, sorted from first-to-run to last-to-run.
+
+    Returns:
+        dict[str, :class:`.BaseContext`]: Each key and the first plugin which adds it.
+
+    """
+    providers = dict()
+
+    for manager in contexts:
+        for key in _get_provided_keys(manager):
+            providers.setdefault(key, manager)
+
+    return providers
+
+
+def _get_sort_key(description):
+    """Get a key which sorts lint issues the same way, every run.
+
+    Args:
+        description (:class:`.Description`): Some found issue.
+
+    Returns:
+        tuple: The issue's summary, then its file path and code, to break ties.
+
+    """
+    return (
+        description.get_summary(),
+        description.get_location().path,
+        description.get_code(),
+    )
+
+
+def _initialize_worker(directories, url_cache):
+    """Tell a worker process about every Rez package and URL result that :func:`lint` knows."""
+    _DIRECTORIES[:] = directories
+    url_prober.set_cache(url_cache)
+
+
+def _is_cacheable(checker, providers):
+    """Check if the issues of `checker` may be saved by :mod:`.lint_cache`.
+
+    Args:
+        checker (:class:`.BaseChecker`): The checker plugin to check.
+        providers (dict[str, :class:`.BaseContext`]): Each key and the plugin which adds it.
+
+    Returns:
+        bool: If `checker` and every context plugin that it reads are cacheable.
+
+    """
+    if not getattr(checker, "is_cacheable", lambda: True)():
+        return False
+
+    for key in getattr(checker, "get_context_keys", set)():
+        manager = providers.get(key)
+
+        if manager and not getattr(manager, "is_cacheable", lambda: True)():
+            return False
+
+    return True
+
+
+def _lint_package(
+    package, processed_packages, disable=frozenset(), vimgrep=False, verbose=False,
+):
+    """Run every context and checker plugin on one Rez package.
+
+    Args:
+        package (:class:`rez.packages_.DeveloperPackage`):
+            The Rez package to check for issues.
+        processed_packages (list[:class:`rez.packages_.DeveloperPackage`]):
+            Every Rez package that was checked before `package`.
+        disable (set[str], optional):
+            The issue codes that should be skipped by during this run.
+        vimgrep (bool, optional):
+            If True, plugins should add path, row, and column information.
+        verbose (bool, optional):
+            If True, plugins should not summarize their messages.
+
+    Returns:
+        set[:class:`.Description`]: The found issues.
+
+    """
+    output = set()
+    contexts = sorted(
+        registry.get_contexts(), key=operator.methodcaller("get_order"), reverse=True,
+    )
+    checkers = sorted(
+        registry.get_checkers(), key=operator.methodcaller("get_order"), reverse=True,
+    )
+    providers = _get_providers(contexts)
+    context = check_context.Context(
+        package,
+        processed_packages,
+        vimgrep=vimgrep,
+        verbose=verbose,
+        providers=providers,
+    )
+    context["processed_checker"] = []
+    context["processed_contexts"] = []
+    required = set()
+
+    for checker in checkers:
+        if checker.get_long_code() not in disable:
+            required.update(getattr(checker, "get_context_keys", set)())
+
+    for manager in contexts:
+        provided = _get_provided_keys(manager)
+
+        if provided and not provided & required:
+            # No enabled checker needs this plugin up-front. If a checker
+            # reads one of its keys anyway, `context` runs the plugin then.
+            #
+            continue
+
+        context.run_context(manager)
+
+    for checker in checkers:
+        if checker.get_long_code() in disable:
+            context["processed_contexts"].append(
+                {"checker": checker, "status": "skipped"}
+            )
+
+            continue
+
+        results = checker.run(package, context)
+        context["processed_contexts"].append(
+            {"checker": checker, "status": "ran", "results": results}
+        )
+        output.update(results)
+
+    return output
+
+
+def _lint_package_at_index(item):
+    """Lint one of the Rez packages given to :func:`_initialize_worker`.
+
+    This function is run by worker processes, which is why it takes
+    a package index instead of a Rez package.
+
+    Args:
+        item (tuple[int, set[str], bool, bool]):
+            The index of the Rez package to check followed by the
+            `disable`, `vimgrep`, and `verbose` arguments of :func:`lint`.
+
+    Returns:
+        set[:class:`.Description`]: The found issues.
+
+    """
+    index, disable, vimgrep, verbose = item
+    package = _get_developer_package(_DIRECTORIES[index])
+    processed_packages = _PackageSequence(_DIRECTORIES[:index])
+
+    return _lint_package(
+        package, processed_packages, disable=disable, vimgrep=vimgrep, verbose=verbose,
+    )
+
+
+def _lint_packages(  # pylint: disable=too-many-arguments
+    packages, indices, jobs, disable, vimgrep, verbose
+):
+    """Lint some Rez packages, possibly in separate processes.
+
+    Args:
+        packages (list[:class:`rez.packages_.DeveloperPackage`]):
+            Every Rez package, in the order they should be processed.
+        indices (list[int]):
+            The Rez packages in `packages` to check. Packages which are
+            not checked are still passed to plugins as processed packages.
+        jobs (int):
+            The number of Rez packages to check at the same time. If
+            the value is less than 1, every CPU is used.
+        disable (set[str]):
+            The issue codes that should be skipped by during this run.
+        vimgrep (bool):
+            If True, plugins should add path, row, and column information.
+        verbose (bool):
+            If True, plugins should not summarize their messages.
+
+    Returns:
+        list[set[:class:`.Description`]]: The found issues of each index.
+
+    """
+    if jobs < 1:
+        jobs = multiprocessing.cpu_count()
+
+    jobs = min(jobs, len(indices))
+
+    if jobs < 2 or multiprocessing.current_process().daemon:
+        # Processes of a :class:`multiprocessing.Pool` may not start processes
+        return [
+            _lint_package(
+                packages[index],
+                packages[:index],
+                disable=disable,
+                vimgrep=vimgrep,
+                verbose=verbose,
+            )
+            for index in indices
+        ]
+
+    directories = [_get_package_directory(package) for package in packages]
+    items = [(index, disable, vimgrep, verbose) for index in indices]
+    pool = multiprocessing.Pool(
+        processes=jobs,
+        initializer=_initialize_worker,
+        initargs=(directories, url_prober.get_cache()),
+    )
+
+    try:
+        results = pool.map(_lint_package_at_index, items)
+    except BaseException:
+        pool.terminate()
+
+        raise
+    else:
+        pool.close()
+    finally:
+        pool.join()
+
+    return results
+
+
+def _probe_help_urls(packages):
+    """Check every help URL of some Rez packages at the same time, before linting them.
+
+    The results are shared with :class:`.UrlNotReachable` so that each
+    unique URL is only requested once.
+
+    Args:
+        packages (iter[:class:`rez.packages_.DeveloperPackage`]):
+            The Rez packages whose ``help`` attribute should be checked.
+
+    """
+    urls = set()
+
+    for package in packages:
+        urls.update(
+            url
+            for _, _, _, url in url_help.get_help_entries(package)
+            if url_prober.is_web_url(url)
+        )
+
+    if urls and url_prober.is_internet_on():
+        url_prober.probe(urls)
+
+
+def lint(  # pylint: disable=too-many-arguments
+    directory,
+    disable=frozenset(),
+    vimgrep=False,
+    recursive=False,
+    verbose=False,
+    jobs=1,
+    ignore_patterns=package_discovery.DEFAULT_IGNORE_PATTERNS,
+    cache=False,
+    cache_directory="",
 ):
     """Print out issues with the Rez package(s) starting at a directory on-disk.
 
@@ -209,6 +543,24 @@ def lint(
             If True, print the lint messages without summarizing any of its data.
             If False, only print 1-to-2 line summaries of each found issue.
             Default is False.
+        jobs (int, optional):
+            The number of Rez packages to check at the same time, each
+            in a separate process. If the value is less than 1, every
+            CPU is used. Default: 1.
+        ignore_patterns (iter[str], optional):
+            If `recursive` is True, never search folders whose name
+            matches any of these glob patterns.
+            Default: :attr:`.DEFAULT_IGNORE_PATTERNS`.
+        cache (bool, optional):
+            If True, re-use the saved issues of any Rez package which
+            hasn't changed since it was last linted and save the issues
+            of every other package. See :mod:`.lint_cache` for details.
+            Checkers which depend on resolved dependencies or web URLs
+            are always run again. Whether or not help URLs are
+            reachable is saved, for a day. See :mod:`.url_prober` for details. Default is False.
+        cache_directory (str, optional):
+            The folder where issues and URLs are saved if `cache` is True.
+            Default: :func:`.lint_cache.get_default_directory`.
 
     Returns:
         list[:class:`.Description`]: Get the found issues.
@@ -217,45 +569,97 @@ def lint(
     _register_internal_plugins()
     _register_external_plugins()
 
-    packages, invalids = _find_rez_packages(directory, recursive=recursive)
+    packages, invalids = _find_rez_packages(
+        directory, recursive=recursive, ignore_patterns=ignore_patterns
+    )
+
+    # Sort the packages so that `processed_packages` is the same, every run
+    packages = sorted(packages, key=operator.attrgetter("filepath"))
 
     output = set()
-    processed_packages = []
+    indices = list(range(len(packages)))
+    keys = []
 
-    for package in packages:
-        context = check_context.Context(
-            package, list(processed_packages), vimgrep=vimgrep, verbose=verbose,
-        )
-        context["processed_checker"] = []
-        context["processed_contexts"] = []
+    cache_directory = cache_directory or lint_cache.get_default_directory()
+
+    cached = []
 
-        for manager in sorted(
+    if cache:
+        cache_ = lint_cache.LintCache(cache_directory)
+        contexts = sorted(
             registry.get_contexts(),
             key=operator.methodcaller("get_order"),
             reverse=True,
-        ):
-            manager.run(package, context)
-            context["processed_contexts"].append(manager)
+        )
+        providers = _get_providers(contexts)
+        plugins = list(contexts)
+        cacheable = set()
+        uncacheable = set()
 
-        for checker in sorted(
-            registry.get_checkers(),
-            key=operator.methodcaller("get_order"),
-            reverse=True,
-        ):
-            if checker.get_long_code() in disable:
-                context["processed_contexts"].append(
-                    {"checker": checker, "status": "skipped"}
-                )
+        for checker in registry.get_checkers():
+            code = checker.get_long_code()
 
+            if code in disable:
                 continue
 
-            results = checker.run(package, context)
-            context["processed_contexts"].append(
-                {"checker": checker, "status": "ran", "results": results}
+            if _is_cacheable(checker, providers):
+                plugins.append(checker)
+                cacheable.add(code)
+            else:
+                uncacheable.add(code)
+
+        settings = {"verbose": verbose, "vimgrep": vimgrep}
+        keys = [
+            lint_cache.get_key(
+                package, plugins, settings, ignore_patterns=ignore_patterns
             )
-            output.update(results)
+            for package in packages
+        ]
+        indices = []
+
+        for index, key in enumerate(keys):
+            descriptions = cache_.get(key)
+
+            if descriptions is None:
+                indices.append(index)
+            else:
+                output.update(descriptions)
+
+                if uncacheable:
+                    cached.append(index)
+
+    url_prober.set_cache(
+        url_prober.UrlCache(os.path.join(cache_directory, "urls.json") if cache else "")
+    )
+
+    if dangers.UrlNotReachable.get_long_code() not in disable:
+        _probe_help_urls(packages[index] for index in sorted(indices + cached))
+
+    results = _lint_packages(packages, indices, jobs, disable, vimgrep, verbose)
+
+    for index, descriptions in zip(indices, results):
+        output.update(descriptions)
+
+        if cache:
+            cache_.set(
+                keys[index],
+                {
+                    description
+                    for description in descriptions
+                    if description.get_code().long_name in cacheable
+                },
+            )
+
+    if cached:
+        # The saved issues of these packages don't include checkers
+        # which depend on more than the package's files. So run them again.
+        #
+        results = _lint_packages(
+            packages, cached, jobs, set(disable) | cacheable, vimgrep, verbose
+        )
 
-        processed_packages.append(package)
+        for descriptions in results:
+            output.update(descriptions)
 
     for directory_ in invalids:
         location = message_description.Location(
@@ -272,4 +676,4 @@ def lint(
             )
         )
 
-    return sorted(output)
+    return sorted(output, key=_get_sort_key)
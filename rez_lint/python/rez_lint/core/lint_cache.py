@@ -0,0 +1,258 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Save the lint issues of Rez packages so that unchanged packages aren't checked again.
+
+Each Rez package's issues are saved to-disk under a key. The key
+is a hash of everything that could change the issues:
+
+- The package definition file's contents
+- The name of every file in the package and the contents of every Python file,
+  skipping the same folders that the caller skips while finding packages
+- The source code of every enabled checker and context plugin
+- The version of rez_lint and the source code of its ``core`` modules
+- The user's settings and the Rez packages path
+
+If any of these change, the key changes and the package is linted again.
+
+Issues which depend on more than these can't be saved. Checker plugins
+which say they aren't cacheable, or which read data from context plugins
+that aren't cacheable (such as the package's resolved dependencies), are
+skipped by the key and their issues are never saved. :func:`.cli.lint`
+runs them again, every time.
+
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+
+from rez.config import config
+
+from . import message_description, package_discovery
+from ..plugins.checkers import base_checker
+
+try:
+    from functools import lru_cache  # python 3
+except ImportError:
+    from backports.functools_lru_cache import lru_cache  # python 2
+
+SCHEMA_VERSION = 2
+
+
+class LintCache(object):
+    """A folder of saved lint issues, one file per cache key."""
+
+    def __init__(self, directory):
+        """Keep track of where lint issues are saved.
+
+        Args:
+            directory (str): The absolute path to a folder on-disk.
+
+        """
+        super(LintCache, self).__init__()
+
+        self._directory = directory
+
+    def _get_path(self, key):
+        """str: Find the file where the issues of `key` are saved."""
+        return os.path.join(self._directory, key[:2], key + ".json")
+
+    def get(self, key):
+        """Load the saved issues of some Rez package.
+
+        Args:
+            key (str): A hash from :func:`get_key`.
+
+        Returns:
+            set[:class:`.Description`] or NoneType:
+                The saved issues or nothing, if `key` was never saved.
+
+        """
+        try:
+            with open(self._get_path(key), "r") as handler:
+                data = json.load(handler)
+        except (IOError, OSError, ValueError):
+            return None
+
+        if data.get("schema") != SCHEMA_VERSION:
+            return None
+
+        return {_deserialize(item) for item in data["descriptions"]}
+
+    def set(self, key, descriptions):
+        """Save the issues of some Rez package.
+
+        Args:
+            key (str): A hash from :func:`get_key`.
+            descriptions (iter[:class:`.Description`]): The issues to save.
+
+        """
+        path = self._get_path(key)
+        directory = os.path.dirname(path)
+
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        handle, temporary = tempfile.mkstemp(dir=directory, suffix=".json")
+
+        with os.fdopen(handle, "w") as handler:
+            json.dump(
+                {
+                    "schema": SCHEMA_VERSION,
+                    "descriptions": [
+                        _serialize(description) for description in descriptions
+                    ],
+                },
+                handler,
+            )
+
+        os.rename(temporary, path)
+
+
+def _deserialize(data):
+    """:class:`.Description`: Convert the output of :func:`_serialize` back into an issue."""
+    return message_description.Description(
+        data["summary"],
+        message_description.Location(*data["location"]),
+        base_checker.Code(*data["code"]),
+        full=data["full"],
+    )
+
+
+def _get_file_hash(path):
+    """str: Hash the contents of a file on-disk."""
+    with open(path, "rb") as handler:
+        return hashlib.sha1(handler.read()).hexdigest()
+
+
+def _get_plugin_identifier(plugin):
+    """str: Describe a plugin class and the current source code of its module."""
+    if not inspect.isclass(plugin):
+        plugin = plugin.__class__
+
+    name = "{plugin.__module__}.{plugin.__name__}".format(plugin=plugin)
+
+    try:
+        path = inspect.getsourcefile(plugin)
+    except TypeError:
+        path = None
+
+    if not path or not os.path.isfile(path):
+        return name
+
+    return name + ":" + _get_source_hash(path)
+
+
+@lru_cache()
+def _get_core_hash():
+    """str: Hash the source code of every ``core`` module of rez_lint, once per-process."""
+    directory = os.path.dirname(os.path.abspath(__file__))
+    hasher = hashlib.sha1()
+
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(".py"):
+            hasher.update(name.encode("utf-8"))
+            hasher.update(_get_file_hash(os.path.join(directory, name)).encode("utf-8"))
+
+    return hasher.hexdigest()
+
+
+@lru_cache()
+def _get_source_hash(path):
+    """str: Hash the contents of a plugin's source file, once per-process."""
+    return _get_file_hash(path)
+
+
+def _iter_package_files(root, ignore_patterns):
+    """Find every file in a Rez package that a checker could read.
+
+    Args:
+        root (str): The folder which contains the Rez package definition file.
+        ignore_patterns (iter[str]): Glob patterns of folder names to skip.
+
+    Yields:
+        str: Each file's path, relative to `root`.
+
+    """
+    for directory, folders, files in os.walk(root):
+        folders[:] = sorted(
+            folder
+            for folder in folders
+            if not package_discovery.is_ignored(folder, ignore_patterns)
+        )
+
+        for name in sorted(files):
+            yield os.path.relpath(os.path.join(directory, name), root)
+
+
+def _serialize(description):
+    """dict[str, object]: Convert an issue into data which can be saved as JSON."""
+    return {
+        "code": list(description.get_code()),
+        "full": description.get_full_text(),
+        "location": list(description.get_location()),
+        "summary": description.get_summary(),
+    }
+
+
+def get_default_directory():
+    """str: Find the folder where lint issues are saved, if the user doesn't choose one."""
+    directory = os.getenv("REZ_LINT_CACHE_DIRECTORY")
+
+    if directory:
+        return directory
+
+    return os.path.join(
+        os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+        "rez_lint",
+    )
+
+
+def get_key(
+    package,
+    plugins,
+    settings,
+    ignore_patterns=package_discovery.DEFAULT_IGNORE_PATTERNS,
+):
+    """Hash everything that could change the lint issues of a Rez package.
+
+    Args:
+        package (:class:`rez.packages_.DeveloperPackage`):
+            The Rez package that will be linted.
+        plugins (iter[:class:`.BaseChecker` or :class:`.BaseContext`]):
+            Every context and enabled, cacheable checker plugin that will be run.
+        settings (dict[str, object]):
+            Any other user-provided options that could change the
+            found issues. e.g. {"verbose": True}. Must be JSON-compatible.
+        ignore_patterns (iter[str], optional):
+            Glob patterns of folder names whose files aren't hashed.
+            Default: :attr:`.DEFAULT_IGNORE_PATTERNS`.
+
+    Returns:
+        str: The generated hash.
+
+    """
+    root = os.path.dirname(package.filepath)
+    files = []
+
+    for path in _iter_package_files(root, ignore_patterns):
+        if path.endswith(".py"):
+            files.append([path, _get_file_hash(os.path.join(root, path))])
+        else:
+            files.append([path, ""])
+
+    data = {
+        "definition": _get_file_hash(package.filepath),
+        "files": files,
+        "packages_path": list(config.packages_path),  # pylint: disable=no-member
+        "path": package.filepath,
+        "plugins": sorted(_get_plugin_identifier(plugin) for plugin in plugins),
+        "rez_lint": [os.getenv("REZ_REZ_LINT_VERSION", ""), _get_core_hash()],
+        "schema": SCHEMA_VERSION,
+        "settings": settings,
+    }
+
+    return hashlib.sha1(json.dumps(data, sort_keys=True).encode("utf-8")).hexdigest()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Find the folders on-disk which could define a Rez package.
+
+Loading a Rez package is slow. This module walks a folder tree once and
+only returns folders which contain a Rez package definition file (e.g.
+"package.py") so that nothing else has to be loaded. Folders which
+can't contain source Rez packages, like ".git" or "build", are skipped
+entirely.
+
+Attributes:
+    DEFAULT_IGNORE_PATTERNS (tuple[str]):
+        Glob patterns of folder names which are never searched.
+
+"""
+
+import fnmatch
+import os
+
+from rez_utilities import rez_configuration
+
+DEFAULT_IGNORE_PATTERNS = (
+    ".git",
+    ".hg",
+    ".svn",
+    ".tox",
+    "__pycache__",
+    "*.egg-info",
+    "build",
+)
+
+
+def _list_directory(directory):
+    """Split the contents of a folder into files and folders.
+
+    Args:
+        directory (str): The absolute path to some folder on-disk.
+
+    Returns:
+        tuple[set[str], list[tuple[str, bool]]]:
+            The names of every file and the name of every folder, along
+            with whether that folder is a symlink.
+
+    """
+    files = set()
+    folders = []
+    scandir = getattr(os, "scandir", None)  # `os.scandir` only exists in Python 3.5+
+
+    try:
+        if scandir:
+            for entry in scandir(directory):
+                if entry.is_dir():
+                    folders.append((entry.name, entry.is_symlink()))
+                else:
+                    files.add(entry.name)
+        else:
+            for name in os.listdir(directory):
+                path = os.path.join(directory, name)
+
+                if os.path.isdir(path):
+                    folders.append((name, os.path.islink(path)))
+                else:
+                    files.add(name)
+    except OSError:
+        # The folder was deleted or can't be read. Either way, there's nothing to find
+        return set(), []
+
+    return files, folders
+
+
+def _has_package_file(directory):
+    """bool: Check if `directory` has a Rez package definition file."""
+    return any(
+        os.path.isfile(os.path.join(directory, name))
+        for name in rez_configuration.REZ_PACKAGE_NAMES
+    )
+
+
+def is_ignored(name, patterns):
+    """bool: Check if the folder `name` matches any of the glob `patterns`."""
+    return any(fnmatch.fnmatch(name, pattern) for pattern in patterns)
+
+
+def iter_package_directories(directory, ignore_patterns=DEFAULT_IGNORE_PATTERNS):
+    """Find every folder, starting from `directory`, which has a Rez package file.
+
+    Just like :func:`os.walk`, symlinked folders are checked but not searched.
+
+    Args:
+        directory (str):
+            The absolute path to a folder on-disk to search within.
+        ignore_patterns (iter[str], optional):
+            Glob patterns of folder names (not paths) to skip, along
+            with everything inside of them. e.g. ["build", ".*"].
+            Default: :attr:`DEFAULT_IGNORE_PATTERNS`.
+
+    Yields:
+        str: Each found folder, including `directory`, if it has a package file.
+
+    """
+    ignore_patterns = tuple(ignore_patterns)
+    directories = [directory]
+
+    while directories:
+        current = directories.pop()
+        files, folders = _list_directory(current)
+
+        if files & rez_configuration.REZ_PACKAGE_NAMES:
+            yield current
+
+        for name, is_symlink in sorted(folders, reverse=True):
+            if is_ignored(name, ignore_patterns):
+                continue
+
+            path = os.path.join(current, name)
+
+            if not is_symlink:
+                directories.append(path)
+            elif _has_package_file(path):
+                yield path
@@ -0,0 +1,459 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Check if many web URLs are reachable, at the same time, and remember the results.
+
+Each unique URL is requested once. URLs are grouped by host and every
+host is checked in a separate thread, re-using a single connection for
+all of its URLs. Each URL is first checked with a HEAD request and only
+downloaded (with GET) if the server doesn't allow HEAD requests.
+
+Requests go through the same proxy servers that :mod:`urllib` uses
+(``http_proxy``, ``https_proxy``, ``no_proxy``, etc). HTTPS URLs are
+tunneled through the proxy so that their connections can still be re-used.
+
+Results are kept in a :class:`UrlCache` so that Rez packages which
+share URLs don't check them again. If the cache has a path, results are
+also saved to-disk and re-used by later runs until they expire.
+
+Attributes:
+    DEFAULT_JOBS (int): The number of hosts to check at the same time.
+    DEFAULT_TIMEOUT (int): The seconds to wait for any one request.
+    DEFAULT_TTL (int): The seconds that a saved result is re-used before it expires.
+
+"""
+
+import base64
+import collections
+import json
+import os
+import socket
+import tempfile
+import time
+from multiprocessing import pool as pool_
+
+from python_compatibility import website
+from rez_utilities import url_help
+from six.moves import http_client
+from six.moves.urllib import parse, request
+
+SCHEMA_VERSION = 1
+DEFAULT_JOBS = 16
+DEFAULT_TIMEOUT = 1
+DEFAULT_TTL = 60 * 60 * 24
+
+_CACHE = []
+_INTERNET = []
+_KNOWN_EXCEPTIONS = (
+    http_client.HTTPException,
+    # Includes timeouts and SSL errors
+    socket.error,
+    # Happens if the URL's port isn't a number
+    ValueError,
+)
+_MAXIMUM_REDIRECTS = 5
+_REDIRECT_CODES = frozenset((301, 302, 303, 307, 308))
+# Servers which don't support HEAD requests usually reply with one of these
+_RETRY_WITH_GET_CODES = frozenset((403, 405, 501))
+_WEB_SCHEMES = frozenset(("http", "https"))
+
+
+class UrlCache(object):
+    """Whether or not some URLs were reachable, and when they were checked."""
+
+    def __init__(self, path="", ttl=DEFAULT_TTL):
+        """Load any results which were already saved.
+
+        Args:
+            path (str, optional):
+                The JSON file where results are saved between runs. If
+                no path is given, nothing is loaded or saved.
+            ttl (int, optional):
+                The number of seconds before a result expires and the
+                URL must be checked again. Default: :attr:`DEFAULT_TTL`.
+
+        """
+        super(UrlCache, self).__init__()
+
+        self._path = path
+        self._ttl = ttl
+        self._results = _read(path) if path else dict()
+        self._changed = False
+
+    def _is_expired(self, checked):
+        """bool: Check if a result from the `checked` time should be ignored."""
+        return time.time() - checked > self._ttl
+
+    def get(self, url):
+        """Find if `url` was reachable when it was last checked.
+
+        Args:
+            url (str): Some web address. e.g. "https://www.google.com".
+
+        Returns:
+            bool or NoneType: The result or nothing, if `url` needs to be checked.
+
+        """
+        try:
+            reachable, checked = self._results[url]
+        except KeyError:
+            return None
+
+        if self._is_expired(checked):
+            return None
+
+        return reachable
+
+    def set(self, url, reachable):
+        """Remember if `url` is reachable, as of right now.
+
+        Args:
+            url (str): Some web address. e.g. "https://www.google.com".
+            reachable (bool): If `url` could be accessed.
+
+        """
+        self._results[url] = [reachable, time.time()]
+        self._changed = True
+
+    def save(self):
+        """Write every result to-disk, if anything new was checked.
+
+        Results saved by other runs in the meantime are kept, unless
+        they've expired or were checked again by this run.
+
+        """
+        if not self._path or not self._changed:
+            return
+
+        results = _read(self._path)
+        results.update(self._results)
+        results = {
+            url: [reachable, checked]
+            for url, (reachable, checked) in results.items()
+            if not self._is_expired(checked)
+        }
+        directory = os.path.dirname(self._path)
+
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        handle, temporary = tempfile.mkstemp(dir=directory, suffix=".json")
+
+        with os.fdopen(handle, "w") as handler:
+            json.dump({"schema": SCHEMA_VERSION, "results": results}, handler)
+
+        os.rename(temporary, self._path)
+        self._changed = False
+
+
+def _check_host(item):
+    """Check every URL of one host, one after another, using the same connection.
+
+    Args:
+        item (tuple[list[str], int]):
+            The URLs to check and the seconds to wait for each request.
+
+    Returns:
+        list[tuple[str, bool]]: Each URL and whether it is reachable.
+
+    """
+    urls, timeout = item
+    connections = dict()
+
+    try:
+        return [(url, _is_reachable(url, connections, timeout)) for url in urls]
+    finally:
+        for connection in connections.values():
+            connection.close()
+
+
+def _get_proxy(scheme, netloc):
+    """Find the proxy server which requests to a host must go through, if any.
+
+    Args:
+        scheme (str): The host's scheme. e.g. "https".
+        netloc (str): The host and, optionally, its port. e.g. "google.com".
+
+    Returns:
+        :class:`urllib.parse.SplitResult` or NoneType: The proxy's URL, if there is one.
+
+    """
+    proxy = request.getproxies().get(scheme)
+
+    if not proxy or request.proxy_bypass(netloc):
+        return None
+
+    if "://" not in proxy:
+        proxy = "http://" + proxy
+
+    return parse.urlsplit(proxy)
+
+
+def _get_proxy_headers(proxy):
+    """dict[str, str]: Get the headers which log into `proxy`, if it has credentials."""
+    if not proxy.username:
+        return dict()
+
+    credentials = "{user}:{password}".format(
+        user=parse.unquote(proxy.username), password=parse.unquote(proxy.password or "")
+    )
+
+    return {
+        "Proxy-Authorization": "Basic "
+        + base64.b64encode(credentials.encode("utf-8")).decode("ascii")
+    }
+
+
+def _get_host(url):
+    """tuple[str, str]: Get the scheme and host of `url`. e.g. ("https", "google.com")."""
+    parts = parse.urlsplit(url)
+
+    return (parts.scheme.lower(), parts.netloc.lower())
+
+
+def _is_reachable(url, connections, timeout):
+    """Check if `url` exists and can be accessed, following any redirects.
+
+    Args:
+        url (str): Some web address. e.g. "https://www.google.com".
+        connections (dict[tuple[str, str], :class:`http.client.HTTPConnection`]):
+            Open connections to re-use, by their scheme and host.
+        timeout (int): The seconds to wait for each request.
+
+    Returns:
+        bool: If `url` replied with "200 OK".
+
+    """
+    for _ in range(_MAXIMUM_REDIRECTS + 1):
+        try:
+            status, location = _request("HEAD", url, connections, timeout)
+
+            if status in _RETRY_WITH_GET_CODES:
+                status, location = _request("GET", url, connections, timeout)
+        except _KNOWN_EXCEPTIONS:
+            return False
+
+        if status not in _REDIRECT_CODES or not location:
+            return status == 200  # `200` means "website found
+
+        url = parse.urljoin(url, location)
+
+        if not is_web_url(url):
+            return False
+
+    return False
+
+
+def _make_connection(scheme, netloc, proxy, timeout):
+    """Connect to a host, either directly or through a proxy server.
+
+    Args:
+        scheme (str): The host's scheme. e.g. "https".
+        netloc (str): The host and, optionally, its port. e.g. "google.com".
+        proxy (:class:`urllib.parse.SplitResult` or NoneType):
+            The proxy server to go through, if any.
+        timeout (int): The seconds to wait for each request.
+
+    Returns:
+        :class:`http.client.HTTPConnection`: The new, un-opened connection.
+
+    """
+    if not proxy:
+        if scheme == "https":
+            return http_client.HTTPSConnection(netloc, timeout=timeout)
+
+        return http_client.HTTPConnection(netloc, timeout=timeout)
+
+    address = proxy.netloc.rpartition("@")[2]  # Credentials are sent as a header
+
+    if scheme == "http":
+        # HTTP requests are sent to the proxy, using the whole URL as the path
+        return http_client.HTTPConnection(address, timeout=timeout)
+
+    connection = http_client.HTTPSConnection(address, timeout=timeout)
+    connection.set_tunnel(netloc, headers=_get_proxy_headers(proxy))
+
+    return connection
+
+
+def _read(path):
+    """dict[str, list]: Load each saved URL, if it was reachable, and when it was checked."""
+    try:
+        with open(path, "r") as handler:
+            data = json.load(handler)
+    except (IOError, OSError, ValueError):
+        return dict()
+
+    if data.get("schema") != SCHEMA_VERSION:
+        return dict()
+
+    return data.get("results", dict())
+
+
+def _request(method, url, connections, timeout):
+    """Send one request for `url`, re-using an open connection to its host, if any.
+
+    If the open connection was closed by the server, a new one is made.
+    If the user has a proxy server for `url`, the request goes through it.
+
+    Args:
+        method (str): The HTTP method to use. e.g. "HEAD" or "GET".
+        url (str): Some web address. e.g. "https://www.google.com".
+        connections (dict[tuple[str, str], :class:`http.client.HTTPConnection`]):
+            Open connections to re-use, by their scheme and host. Any
+            new connection is added to it.
+        timeout (int): The seconds to wait for the reply.
+
+    Raises:
+        :class:`http.client.HTTPException` or :class:`socket.error`:
+            If the request fails.
+
+    Returns:
+        tuple[int, str or NoneType]: The reply's status and redirect location, if any.
+
+    """
+    parts = parse.urlsplit(url)
+    key = _get_host(url)
+    proxy = _get_proxy(key[0], parts.netloc)
+    headers = dict()
+
+    if proxy and key[0] == "http":
+        path = parse.urlunsplit(
+            (parts.scheme, parts.netloc, parts.path or "/", parts.query, "")
+        )
+        headers = _get_proxy_headers(proxy)
+    else:
+        path = parse.urlunsplit(("", "", parts.path or "/", parts.query, ""))
+
+    for reused in (key in connections, False):
+        connection = connections.pop(key, None)
+
+        if not connection:
+            connection = _make_connection(key[0], parts.netloc, proxy, timeout)
+
+        try:
+            connection.request(method, path, headers=headers)
+            response = connection.getresponse()
+        except _KNOWN_EXCEPTIONS:
+            connection.close()
+
+            if reused:
+                continue
+
+            raise
+
+        if method == "HEAD" and not response.will_close:
+            response.read()
+            connections[key] = connection
+        else:
+            # Don't download the rest of the page just to re-use the connection
+            connection.close()
+
+        return response.status, response.getheader("Location")
+
+    raise http_client.HTTPException(
+        'URL "{url}" could not be requested.'.format(url=url)
+    )
+
+
+def get_cache():
+    """:class:`UrlCache`: Get the results which are shared by every Rez package."""
+    if not _CACHE:
+        _CACHE.append(UrlCache())
+
+    return _CACHE[0]
+
+
+def is_internet_on():
+    """bool: Check if the user has access to the Internet, once per :func:`set_cache` call."""
+    if not _INTERNET:
+        _INTERNET.append(website.is_internet_on())
+
+    return _INTERNET[0]
+
+
+def is_web_url(url):
+    """bool: Check if `url` is meant to be requested over HTTP. e.g. "https://google.com"."""
+    return parse.urlsplit(url).scheme.lower() in _WEB_SCHEMES
+
+
+def probe(urls, cache=None, jobs=DEFAULT_JOBS, timeout=DEFAULT_TIMEOUT):
+    """Check if every one of `urls` exists and can be accessed.
+
+    Args:
+        urls (iter[str]):
+            Web addresses, file paths, etc. Anything which isn't a web
+            URL is checked directly and isn't added to `cache`.
+        cache (:class:`UrlCache`, optional):
+            Known results, which are re-used. Every requested web URL
+            is added to it. Default: :func:`get_cache`.
+        jobs (int, optional):
+            The number of hosts to check at the same time, each in a
+            separate thread. Default: :attr:`DEFAULT_JOBS`.
+        timeout (int, optional):
+            The seconds to wait for each request. Default: :attr:`DEFAULT_TIMEOUT`.
+
+    Returns:
+        dict[str, bool]: Each given URL and whether it is reachable.
+
+    """
+    if cache is None:
+        cache = get_cache()
+
+    results = dict()
+    hosts = collections.defaultdict(list)
+
+    for url in set(urls):
+        if not is_web_url(url):
+            results[url] = url_help.is_url_reachable(url)
+
+            continue
+
+        reachable = cache.get(url)
+
+        if reachable is None:
+            hosts[_get_host(url)].append(url)
+        else:
+            results[url] = reachable
+
+    if not hosts:
+        return results
+
+    items = [(sorted(urls_), timeout) for _, urls_ in sorted(hosts.items())]
+    jobs = max(1, min(jobs, len(items)))
+
+    if jobs == 1:
+        found = [_check_host(item) for item in items]
+    else:
+        # Requests spend their time waiting on the network so threads are enough
+        threads = pool_.ThreadPool(processes=jobs)
+
+        try:
+            found = threads.map(_check_host, items)
+        except BaseException:
+            threads.terminate()
+
+            raise
+        else:
+            threads.close()
+        finally:
+            threads.join()
+
+    for url, reachable in (pair for pairs in found for pair in pairs):
+        cache.set(url, reachable)
+        results[url] = reachable
+
+    cache.save()
+
+    return results
+
+
+def set_cache(cache):
+    """Replace the results which are shared by every Rez package.
+
+    Args:
+        cache (:class:`UrlCache`): The new results to use.
+
+    """
+    _CACHE[:] = [cache]
+    del _INTERNET[:]  # A new run may have a different connection
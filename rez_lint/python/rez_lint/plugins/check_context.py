@@ -13,9 +13,19 @@ class Context(collections.MutableMapping):
     to do expensive queries and cache the data that's returned. That data
     can then be passed to each checker plugin to use.
 
+    Context plugins which provide a key are only run the first time
+    that key is read.
+
     """
 
-    def __init__(self, package, processed_packages=None, vimgrep=False, verbose=False):
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        package,
+        processed_packages=None,
+        vimgrep=False,
+        verbose=False,
+        providers=None,
+    ):
         """Keep track of the current Rez package and the user's settings.
 
         Args:
@@ -29,6 +39,9 @@ class Context(collections.MutableMapping):
             verbose (bool, optional): Some user input to track
                 that specifies if they want summary information or
                 everything to be printed.
+            providers (dict[str, :class:`.BaseContext`], optional):
+                Each key that a context plugin adds to this instance and
+                the plugin to run once the key is first read. Default is None.
 
         """
         super(Context, self).__init__()  # pylint: disable=no-member
@@ -38,13 +51,18 @@ class Context(collections.MutableMapping):
             "runtime_context": {"processed_packages": processed_packages or []},
             "user_settings": {"verbose": verbose, "vimgrep": vimgrep},
         }
+        self._providers = providers or dict()
+        self._ran = set()
 
     def __delitem__(self, key):
         """Delete the value at the given `key`."""
         del self._data[key]  # pragma: no cover
 
     def __getitem__(self, key):
-        """Get the value that is stored in `key`."""
+        """Get the value that is stored in `key`, running its context plugin if needed."""
+        if key not in self._data and key in self._providers:
+            self.run_context(self._providers[key])
+
         return self._data[key]
 
     def __iter__(self):
@@ -58,3 +76,19 @@ class Context(collections.MutableMapping):
     def __setitem__(self, key, value):
         """Pair `value` to `key` and add these two objects to the current instance."""
         self._data[key] = value
+
+    def run_context(self, plugin):
+        """Add data to this instance from a context plugin, unless it already ran.
+
+        Args:
+            plugin (:class:`.BaseContext`): The context plugin to run.
+
+        """
+        if plugin in self._ran:
+            return
+
+        self._ran.add(plugin)
+        plugin.run(self._data["package"], self)
+
+        if "processed_contexts" in self._data:
+            self._data["processed_contexts"].append(plugin)
@@ -21,11 +21,37 @@ class BaseChecker(object):
         """str: The string used to refer to this class or disable it."""
         return ""  # pragma: no cover
 
+    @staticmethod
+    def get_context_keys():
+        """Get the :class:`.Context` keys that this plugin reads.
+
+        The context plugins which provide these keys are run before
+        this plugin. Any other key is computed once it's first read.
+
+        Returns:
+            set[str]: Keys such as {:attr:`.lint_constant.HAS_PYTHON_PACKAGE`}.
+
+        """
+        return set()
+
     @staticmethod
     def get_order():
         """int: The execution order of this plugin. Increase this value to make it run sooner."""
         return 0
 
+    @staticmethod
+    def is_cacheable():
+        """Check if this plugin's issues only depend on the Rez package's files.
+
+        If False, :mod:`.lint_cache` never saves this plugin's issues
+        and the plugin is run again, every time.
+
+        Returns:
+            bool: If this plugin's issues may be saved.
+
+        """
+        return True
+
     @staticmethod
     @abc.abstractmethod
     def run(package, context):
@@ -8,10 +8,9 @@ import collections
 import logging
 import os
 
-from python_compatibility import website
 from rez_utilities import finder, url_help
 
-from ...core import lint_constant, message_description, package_parser
+from ...core import lint_constant, message_description, package_parser, url_prober
 from . import base_checker
 
 _LOGGER = logging.getLogger(__name__)
@@ -399,6 +398,11 @@ class ImproperVariants(ImproperRequirements):
 class MissingRequirements(base_checker.BaseChecker):
     """Check that a Rez package's requirements are up to date."""
 
+    @staticmethod
+    def get_context_keys():
+        """set[str]: The :class:`.Context` keys that this plugin reads."""
+        return {lint_constant.DEPENDENT_PACKAGES, lint_constant.HAS_PYTHON_PACKAGE}
+
     @staticmethod
     def get_long_code():
         """str: The string used to refer to this class or disable it."""
@@ -784,7 +788,9 @@ class TooManyDependencies(base_checker.BaseChecker):
 class UrlNotReachable(base_checker.BaseChecker):
     """Check every rez-test URL destination to make sure it exists.
 
-    If for any reason the Internet is down, just skip the test.
+    If for any reason the Internet is down, just skip the test. Each
+    URL is only requested once, even if many Rez packages use it. See
+    :mod:`.url_prober` for details.
 
     """
 
@@ -828,6 +834,11 @@ class UrlNotReachable(base_checker.BaseChecker):
         """str: The string used to refer to this class or disable it."""
         return "url-unreachable"
 
+    @staticmethod
+    def is_cacheable():
+        """bool: Don't save these issues. :mod:`.url_prober` decides when URLs expire."""
+        return False
+
     @classmethod
     def run(cls, package, _):
         """Find every URL in a Rez package that points to a bad web address.
@@ -844,14 +855,20 @@ class UrlNotReachable(base_checker.BaseChecker):
         if not package.help:
             return []
 
-        if not website.is_internet_on():
+        if not url_prober.is_internet_on():
             _LOGGER.warning(
                 "User has no internet. Checking for help URLs will be skipped."
             )
 
             return []
 
-        urls = url_help.get_invalid_help_urls(package)
+        entries = url_help.get_help_entries(package)
+        reachables = url_prober.probe(url for _, _, _, url in entries)
+        urls = {
+            (index, label, command)
+            for index, label, command, url in entries
+            if not reachables[url]
+        }
 
         if not urls:
             return []
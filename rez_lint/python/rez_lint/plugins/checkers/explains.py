@@ -62,6 +62,11 @@ class NoChangeLog(_MissingFile):
 class NoDocumentation(base_checker.BaseChecker):
     """Find documentation for the user's Rez package and report if it's missing."""
 
+    @staticmethod
+    def get_context_keys():
+        """set[str]: The :class:`.Context` keys that this plugin reads."""
+        return {lint_constant.HAS_PYTHON_PACKAGE}
+
     @staticmethod
     def get_long_code():
         """str: The string used to refer to this class or disable it."""
@@ -31,6 +31,11 @@ class NeedsComment(base_checker.BaseChecker):
 
     """
 
+    @staticmethod
+    def get_context_keys():
+        """set[str]: The :class:`.Context` keys that this plugin reads."""
+        return {lint_constant.DEPENDENT_PACKAGES, lint_constant.PARSO_GRAPH}
+
     @staticmethod
     def get_long_code():
         """str: The string used to refer to this class or disable it."""
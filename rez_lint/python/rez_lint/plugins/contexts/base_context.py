@@ -17,11 +17,37 @@ class BaseContext(object):
 
     """
 
+    @staticmethod
+    def get_provided_keys():
+        """Get the keys that this plugin adds to a :class:`.Context`.
+
+        If any keys are given, this plugin is only run once a checker
+        plugin needs one of them. Otherwise, it is always run.
+
+        Returns:
+            set[str]: Keys such as {:attr:`.lint_constant.HAS_PYTHON_PACKAGE`}.
+
+        """
+        return set()
+
     @staticmethod
     def get_order():
         """int: The priority of this plugin. To give higher priority, increase this value."""
         return 0
 
+    @staticmethod
+    def is_cacheable():
+        """Check if this plugin's data only depends on the Rez package's files.
+
+        If False, every checker plugin which reads one of this plugin's
+        keys is run again, every time, instead of re-using saved issues.
+
+        Returns:
+            bool: If the issues of checkers which read this plugin's data may be saved.
+
+        """
+        return True
+
     @staticmethod
     @abc.abstractmethod
     def run(package, context):
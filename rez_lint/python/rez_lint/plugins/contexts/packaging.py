@@ -21,6 +21,16 @@ _LOGGER = logging.getLogger(__name__)
 class HasPythonPackage(base_context.BaseContext):
     """Find out if a Rez package defines a Python package and cache the result."""
 
+    @staticmethod
+    def get_provided_keys():
+        """set[str]: The keys that this plugin adds to a :class:`.Context`."""
+        return {lint_constant.HAS_PYTHON_PACKAGE}
+
+    @staticmethod
+    def is_cacheable():
+        """bool: Don't save this data. It depends on the environment and resolved dependencies."""
+        return False
+
     @staticmethod
     def run(package, context):
         """Add context information to `context`, using data inside of `package`.
@@ -56,6 +66,19 @@ class SourceResolvedContext(base_context.BaseContext):
 
     """
 
+    @staticmethod
+    def get_provided_keys():
+        """set[str]: The keys that this plugin adds to a :class:`.Context`."""
+        return {
+            lint_constant.DEPENDENT_PACKAGES,
+            lint_constant.RESOLVED_SOURCE_CONTEXT,
+        }
+
+    @staticmethod
+    def is_cacheable():
+        """bool: Don't save this data. New releases of dependencies change the resolve."""
+        return False
+
     @staticmethod
     def run(package, context):
         """Get the resolved Rez context and add it to ``rez_lint``'s main context.
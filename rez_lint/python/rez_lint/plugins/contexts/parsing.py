@@ -17,6 +17,11 @@ class ParsePackageDefinition(base_context.BaseContext):
 
     """
 
+    @staticmethod
+    def get_provided_keys():
+        """set[str]: The keys that this plugin adds to a :class:`.Context`."""
+        return {lint_constant.PARSO_GRAPH}
+
     @staticmethod
     def run(package, context):
         """Parse `package` into parso nodes and add the entire module into `context`.
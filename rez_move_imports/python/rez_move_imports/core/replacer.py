@@ -244,6 +244,7 @@ def replace(  # pylint: disable=too-many-arguments
         import_types=configuration.types,
         aliases=configuration.aliases,
         continue_on_syntax_error=configuration.continue_on_syntax_error,
+        jobs=configuration.jobs,
     )
 
     if not overwritten_paths and not force_requirements_bump:
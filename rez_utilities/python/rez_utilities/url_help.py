@@ -88,21 +88,19 @@ def get_help_urls(package):
     return [(label, _get_url(command)) for label, command in package.help or []]
 
 
-def get_invalid_help_urls(package):
-    """Find every help item that doesn't point to a valid URL.
+def get_help_entries(package):
+    """Find the URL (or file path) of every entry in a Rez package's ``help``.
 
     Args:
-        package (:class:`rez.developer_package.DeveloperPackage`):
-            The user package description that may have URLs inside of
-            it. If URLs exist, check each one for any potential issues.
+        package (:class:`rez.packages_.Package`):
+            A Rez package that may have a ``help`` attribute/function defined.
 
     Returns:
-        set[tuple[int, str, str]]:
-            The position, help command label, and URL for each invalid URL found.
+        list[tuple[int, str, str, str]]:
+            The position, label, and command of each entry, followed by
+            its URL. e.g. (0, "Home Page", "firefox https://google.com", "https://google.com").
 
     """
-    invalids = set()
-
     help_ = package.help or []
 
     if isinstance(help_, six.string_types):
@@ -111,13 +109,30 @@ def get_invalid_help_urls(package):
         #
         help_ = [["", help_]]
 
-    for index, (label, command) in enumerate(help_):
-        url = _get_url(command)
+    return [
+        (index, label, command, _get_url(command))
+        for index, (label, command) in enumerate(help_)
+    ]
+
+
+def get_invalid_help_urls(package):
+    """Find every help item that doesn't point to a valid URL.
+
+    Args:
+        package (:class:`rez.developer_package.DeveloperPackage`):
+            The user package description that may have URLs inside of
+            it. If URLs exist, check each one for any potential issues.
 
-        if not is_url_reachable(url):
-            invalids.add((index, label, command))
+    Returns:
+        set[tuple[int, str, str]]:
+            The position, help command label, and URL for each invalid URL found.
 
-    return invalids
+    """
+    return {
+        (index, label, command)
+        for index, label, command, url in get_help_entries(package)
+        if not is_url_reachable(url)
+    }
 
 
 def find_api_documentation(package):
@@ -237,6 +237,43 @@ class CheckUrl(common.Common):
         self.assertEqual({"thing", "another", "foo_bar"}, results)
 
 
+class GetHelpEntries(common.Common):
+    """Check :func:`.url_help.get_help_entries`."""
+
+    def _get(self, help_text):
+        """list[tuple[int, str, str, str]]: Get the help entries of a new Rez package."""
+        folder = tempfile.mkdtemp()
+        self.delete_item_later(folder)
+
+        with open(os.path.join(folder, "package.py"), "w") as handler:
+            handler.write(_make_fake_package(help_text))
+
+        return url_help.get_help_entries(packages_.get_developer_package(folder))
+
+    def test_list(self):
+        """Get the URL of each command, with its position and label."""
+        self.assertEqual(
+            [
+                (0, "home-page", "firefox https://google.com", "https://google.com"),
+                (1, "docs", "/some/path", "/some/path"),
+            ],
+            self._get(
+                [["home-page", "firefox https://google.com"], ["docs", "/some/path"]]
+            ),
+        )
+
+    def test_string(self):
+        """Get one unlabelled entry if ``help`` is a single string."""
+        self.assertEqual(
+            [(0, "", "https://google.com", "https://google.com")],
+            self._get("https://google.com"),
+        )
+
+    def test_empty(self):
+        """Get nothing if the package has no ``help``."""
+        self.assertEqual([], self._get(None))
+
+
 class FindUrl(common.Common):
     """Find the URLs to a Rez package's help documentation."""
 